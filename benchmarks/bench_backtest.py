@@ -0,0 +1,51 @@
+"""
+Benchmark the vectorized backtest engine.
+
+Replays one signal every 100 bars against a random-walk minute series
+and reports the time of ``run()`` and of building the ``Statistic``
+message.
+
+Usage:
+    python benchmarks/bench_backtest.py [sizes...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from openstoxlify.backtest.engine import run
+from openstoxlify.models.frame import QuoteFrame
+
+SIZES = (100_000, 1_000_000, 10_000_000)
+SIGNAL_EVERY = 100
+
+
+def build(n: int):
+    rng = np.random.default_rng(0)
+    close = 1_000.0 + np.cumsum(rng.normal(scale=0.5, size=n))
+    ts = 1_600_000_000 + 60 * np.arange(n, dtype=np.int64)
+    frame = QuoteFrame(ts, close, close, close, close, np.ones(n))
+    bars = np.arange(0, n, SIGNAL_EVERY)
+    actions = rng.choice(np.array([-1, 0, 1], dtype=np.int8), size=len(bars))
+    return frame, ts[bars], actions
+
+
+def main(sizes) -> None:
+    print(f"{'bars':>10} {'trades':>8} {'run (s)':>9} {'statistic (s)':>14}")
+    for n in sizes:
+        frame, ts, actions = build(n)
+
+        start = time.perf_counter()
+        result = run(frame, ts, actions, 1.0, fee=0.001)
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result.statistic()
+        stats = time.perf_counter() - start
+
+        print(f"{n:>10} {len(result.trades):>8} {elapsed:>9.3f} {stats:>14.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,124 @@
+"""
+Benchmark headless chart rendering to PNG files.
+
+Renders end-of-day style charts (daily candles, a moving average, a
+volume panel and crossover signals) three ways:
+
+- ``pyplot``: ``draw()``-style figures saved with ``plt.savefig`` and
+  never closed, which is what calling ``draw()`` under a headless
+  backend amounts to
+- ``render``: ``Canvas.render()`` in the calling process
+- ``render_many``: ``render_many()`` on a process pool
+
+Reports the time per chart and, for the serial modes, the Python
+memory still allocated per chart afterwards (``tracemalloc``, measured
+in a separate shorter run because tracing slows rendering down).
+
+Usage:
+    python benchmarks/bench_batch_render.py [charts] [workers]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from openstoxlify.draw import Canvas
+from openstoxlify.indicators.trend import sma
+from openstoxlify.models.enum import PlotType
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.models.store import PlotStore, SignalStore
+from openstoxlify.utils.render import ChartSnapshot, render_many
+
+CHARTS = 24
+BARS = 750
+MEMORY_CHARTS = 4
+
+
+def snapshot(seed: int) -> ChartSnapshot:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(size=BARS))
+    ts = 1_600_000_000 + 86400 * np.arange(BARS, dtype=np.int64)
+    frame = QuoteFrame(ts, close, close + 1, close - 1, close, np.ones(BARS))
+
+    class Chart:
+        def quotes(self):
+            return frame.quotes()
+
+        def plots(self):
+            store = PlotStore()
+            store.extend(PlotType.LINE.value, "SMA 20", ts, sma(close, 20), 0)
+            store.extend(PlotType.HISTOGRAM.value, "Volume", ts, np.ones(BARS), 1)
+            return store.plots()
+
+        def signals(self):
+            store = SignalStore()
+            cross = np.flatnonzero(np.diff(np.sign(close - sma(close, 20))) != 0)
+            store.extend(
+                ts[cross], np.where(close[cross] > 100, 1, -1).astype(np.int8), 1.0
+            )
+            return store.signals()
+
+    return ChartSnapshot.from_context(Chart())
+
+
+def pyplot_draw(chart: ChartSnapshot, path: str) -> None:
+    with patch("openstoxlify.draw.plt.show"):
+        Canvas(chart).draw()
+    plt.savefig(path)
+
+
+def canvas_render(chart: ChartSnapshot, path: str) -> None:
+    Canvas(chart).render(path)
+
+
+def serial(render, charts, folder):
+    start = time.perf_counter()
+    for i, chart in enumerate(charts):
+        render(chart, os.path.join(folder, f"{i}.png"))
+    elapsed = time.perf_counter() - start
+    plt.close("all")
+
+    sample = charts[:MEMORY_CHARTS]
+    tracemalloc.start()
+    for i, chart in enumerate(sample):
+        render(chart, os.path.join(folder, f"{i}.png"))
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    plt.close("all")
+    return elapsed / len(charts), retained / len(sample) / 2**20
+
+
+def main(count: int, workers: int | None) -> None:
+    charts = [snapshot(seed) for seed in range(count)]
+    print(f"{'mode':>12} {'ms/chart':>9} {'MiB/chart':>10}")
+    plt.rcParams["figure.max_open_warning"] = 0
+    with tempfile.TemporaryDirectory() as folder:
+        for name, render in (("pyplot", pyplot_draw), ("render", canvas_render)):
+            per_chart, retained = serial(render, charts, folder)
+            print(f"{name:>12} {per_chart * 1e3:>9.1f} {retained:>10.2f}")
+
+        start = time.perf_counter()
+        batch = render_many(
+            [(c, os.path.join(folder, f"p{i}.png")) for i, c in enumerate(charts)],
+            max_workers=workers,
+        )
+        elapsed = time.perf_counter() - start
+        assert not batch.errors, batch.errors
+        print(f"{'render_many':>12} {elapsed / count * 1e3:>9.1f} {'-':>10}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else CHARTS, args[1] if len(args) > 1 else None)
@@ -0,0 +1,77 @@
+"""
+Benchmark decoding of GetProductInfoResponse.
+
+Compares the legacy per-object path (one ``Quote`` dataclass and one
+timezone-aware ``datetime`` per candle) with the columnar
+``codec.decode_quotes`` path.
+
+Usage:
+    python benchmarks/bench_decode.py [sizes...]
+"""
+
+import sys
+import time
+
+from datetime import timezone
+
+from openstoxlify.models.model import Quote
+from openstoxlify.providers.stoxlify.codec import decode_quotes
+from openstoxlify.providers.stoxlify.proto.market import market_pb2
+
+SIZES = (10_000, 100_000, 1_000_000)
+REPEAT = 3
+
+
+def build_response(n: int) -> market_pb2.GetProductInfoResponse:
+    response = market_pb2.GetProductInfoResponse()
+    for i in range(n):
+        quote = response.Quote.add()
+        quote.Timestamp.seconds = 1_600_000_000 + 60 * i
+        price = quote.ProductInfo.Price
+        price.Open = 100.0 + i
+        price.High = 101.0 + i
+        price.Low = 99.0 + i
+        price.Close = 100.5 + i
+        price.Volume = 1_000.0
+    response.Count = n
+    return market_pb2.GetProductInfoResponse.FromString(response.SerializeToString())
+
+
+def decode_objects(response: market_pb2.GetProductInfoResponse):
+    quotes = []
+    for q in response.Quote:
+        ts = q.Timestamp.ToDatetime().replace(tzinfo=timezone.utc)
+        price = q.ProductInfo.Price
+        quotes.append(
+            Quote(
+                timestamp=ts,
+                high=price.High,
+                low=price.Low,
+                open=price.Open,
+                close=price.Close,
+                volume=price.Volume,
+            )
+        )
+    return quotes
+
+
+def best_of(fn, arg) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes) -> None:
+    print(f"{'quotes':>10} {'objects (s)':>12} {'columnar (s)':>13} {'speedup':>8}")
+    for n in sizes:
+        response = build_response(n)
+        objects = best_of(decode_objects, response)
+        columnar = best_of(decode_quotes, response)
+        print(f"{n:>10} {objects:>12.3f} {columnar:>13.3f} {objects / columnar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,84 @@
+"""
+Benchmark tail latency of quote requests with and without hedging.
+
+Starts a local gRPC market service where a fraction of the requests
+stall (``SLOW_RATE`` of them take ``SLOW_SECONDS``, the rest
+``FAST_SECONDS``) and issues sequential ``quote_frame()`` calls through
+``Provider`` with the default policy and with hedging enabled (delay
+from the p95 of recent latencies). Reports latency percentiles and the
+provider's counters.
+
+Usage:
+    python benchmarks/bench_hedging.py [requests]
+"""
+
+import random
+import sys
+import time
+from concurrent import futures
+
+import grpc
+import numpy as np
+
+from openstoxlify.models.enum import DefaultProvider, Period
+from openstoxlify.providers.stoxlify.policy import CallPolicy
+from openstoxlify.providers.stoxlify.provider import Provider
+from openstoxlify.providers.stoxlify.proto.market import market_pb2, market_pb2_grpc
+
+REQUESTS = 400
+SLOW_RATE = 0.03
+SLOW_SECONDS = 0.5
+FAST_SECONDS = 0.005
+
+
+class StallingMarket(market_pb2_grpc.MarketServiceServicer):
+    def __init__(self, seed: int):
+        self._random = random.Random(seed)
+
+    def GetProductInfo(self, request, context):
+        slow = self._random.random() < SLOW_RATE
+        time.sleep(SLOW_SECONDS if slow else FAST_SECONDS)
+        response = market_pb2.GetProductInfoResponse()
+        response.Quote.add().Timestamp.seconds = 1_700_000_000
+        return response
+
+
+def run(policy: CallPolicy, requests: int):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    market_pb2_grpc.add_MarketServiceServicer_to_server(StallingMarket(0), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        provider = Provider(
+            DefaultProvider.YFinance, target=f"127.0.0.1:{port}", policy=policy
+        )
+        provider.warm_up()
+        latencies = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            provider.quote_frame("BTC-USD", Period.DAILY)
+            latencies.append(time.perf_counter() - start)
+        return np.array(latencies), provider.stats.snapshot()
+    finally:
+        server.stop(None)
+
+
+def main(requests: int) -> None:
+    print(
+        f"{'policy':>8} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'max ms':>7}  counters"
+    )
+    for name, policy in (
+        ("default", CallPolicy()),
+        ("hedged", CallPolicy(hedge=True)),
+    ):
+        latencies, stats = run(policy, requests)
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1e3
+        print(
+            f"{name:>8} {p50:>7.1f} {p95:>7.1f} {p99:>7.1f} "
+            f"{latencies.max() * 1e3:>7.1f}  "
+            f"hedges={stats['hedges']} wins={stats['hedge_wins']}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else REQUESTS)
@@ -0,0 +1,99 @@
+"""
+Benchmark level-of-detail rendering in ``Canvas``.
+
+Renders minute candles with a 50-bar moving average (line) and a volume
+histogram on a second panel, once with every point and once with
+``lod=True`` point budgets, and draws the figure on the Agg backend.
+The default largest size is a decade of 24/7 minute bars. Full renders
+are only run up to ``FULL_MAX`` points.
+
+Usage:
+    python benchmarks/bench_lod.py [sizes...]
+"""
+
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from openstoxlify.draw import Canvas
+from openstoxlify.indicators.trend import sma
+from openstoxlify.models.enum import PlotType
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.models.store import PlotStore
+
+DECADE = 10 * 365 * 24 * 60
+SIZES = (20_000, 1_000_000, DECADE)
+FULL_MAX = 100_000
+FIGSIZE = (12, 6)
+
+
+class Chart:
+    """Minimal stand-in for a Context with quotes and two plots."""
+
+    def __init__(self, n: int):
+        rng = np.random.default_rng(0)
+        close = 1_000.0 + np.cumsum(rng.normal(size=n))
+        open_ = np.concatenate(([close[0]], close[:-1]))
+        spread = rng.uniform(0, 2, size=n)
+        ts = 1_600_000_000 + 60 * np.arange(n, dtype=np.int64)
+        volume = rng.uniform(1, 100, size=n)
+        self._frame = QuoteFrame(
+            ts,
+            open_,
+            np.maximum(open_, close) + spread,
+            np.minimum(open_, close) - spread,
+            close,
+            volume,
+        )
+        self._store = PlotStore()
+        self._store.extend(PlotType.LINE.value, "SMA 50", ts, sma(close, 50), 0)
+        self._store.extend(PlotType.HISTOGRAM.value, "Volume", ts, volume, 1)
+
+    def plots(self):
+        return self._store.plots()
+
+    def quotes(self):
+        return self._frame.quotes()
+
+    def signals(self):
+        return []
+
+
+def render(canvas: Canvas, lod: bool):
+    fig = Figure(figsize=FIGSIZE)
+    FigureCanvasAgg(fig)
+    ax_main, ax_volume = fig.subplots(2, 1, sharex=True)
+    axes = {0: ax_main, 1: ax_volume}
+    points = int(canvas._axes_resolution(FIGSIZE, 2)[0]) if lod else None
+
+    start = time.perf_counter()
+    canvas._plot_histograms(axes, 0.6, points)
+    canvas._plot_lines(axes, 2, points)
+    canvas._render_candlesticks(ax_main, 1, 4, points)
+    built = time.perf_counter() - start
+    fig.canvas.draw()
+    return built, time.perf_counter() - start - built
+
+
+def main(sizes) -> None:
+    print(f"{'bars':>10} {'mode':>5} {'build (s)':>10} {'draw (s)':>9} {'total':>7}")
+    for n in sizes:
+        canvas = Canvas(Chart(n))
+        modes = [("lod", True)]
+        if n <= FULL_MAX:
+            modes.insert(0, ("full", False))
+        for name, lod in modes:
+            built, drawn = render(canvas, lod)
+            total = built + drawn
+            print(f"{n:>10} {name:>5} {built:>10.3f} {drawn:>9.3f} {total:>7.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,111 @@
+"""
+Benchmark the memory used per point by the model classes.
+
+Builds ``n`` ``Quote``, ``FloatSeries`` and ``ActionSeries`` objects
+with the slotted model classes and with plain ``@dataclass`` copies
+(the previous definitions, which keep a ``__dict__`` per instance) and
+reports the Python memory allocated per point (``tracemalloc``) and the
+construction time. The total includes the ``datetime`` and ``float``
+objects each point holds and its slot in the list; the object overhead
+column is the instance alone (``sys.getsizeof`` plus its ``__dict__``).
+
+Usage:
+    python benchmarks/bench_models.py [sizes...]
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+from openstoxlify.models.enum import ActionType
+from openstoxlify.models.model import Quote
+from openstoxlify.models.series import ActionSeries, FloatSeries
+from openstoxlify.utils.time import from_epoch
+
+SIZES = (1_000_000,)
+
+
+@dataclass
+class LegacyQuote:
+    timestamp: datetime
+    high: float
+    low: float
+    open: float
+    close: float
+    volume: float
+
+
+@dataclass
+class LegacyFloatSeries:
+    timestamp: datetime
+    value: float
+
+
+@dataclass
+class LegacyActionSeries:
+    timestamp: datetime
+    action: ActionType
+    amount: float = 0.0
+
+
+def quotes(cls, ts, values):
+    return [cls(from_epoch(t), v, v, v, v, v) for t, v in zip(ts, values)]
+
+
+def series(cls, ts, values):
+    return [cls(from_epoch(t), v) for t, v in zip(ts, values)]
+
+
+def actions(cls, ts, values):
+    return [cls(from_epoch(t), ActionType.LONG, v) for t, v in zip(ts, values)]
+
+
+def instance_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure(build, cls, ts, values):
+    start = time.perf_counter()
+    items = build(cls, ts, values)
+    elapsed = time.perf_counter() - start
+    overhead = instance_size(items[0])
+    del items
+
+    tracemalloc.start()
+    items = build(cls, ts, values)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(items), overhead, elapsed
+
+
+def main(sizes) -> None:
+    cases = (
+        ("Quote", quotes, LegacyQuote, Quote),
+        ("FloatSeries", series, LegacyFloatSeries, FloatSeries),
+        ("ActionSeries", actions, LegacyActionSeries, ActionSeries),
+    )
+    print(
+        f"{'points':>10} {'class':>13} {'variant':>8} {'B/point':>8} "
+        f"{'object B':>9} {'build (s)':>10}"
+    )
+    for n in sizes:
+        ts = (1_600_000_000 + 60 * np.arange(n)).tolist()
+        values = np.random.default_rng(0).normal(size=n).tolist()
+        for name, build, legacy, slotted in cases:
+            for variant, cls in (("dict", legacy), ("slots", slotted)):
+                per_point, overhead, elapsed = measure(build, cls, ts, values)
+                print(
+                    f"{n:>10} {name:>13} {variant:>8} {per_point:>8.0f} "
+                    f"{overhead:>9} {elapsed:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,214 @@
+"""
+Benchmark the documents written by ``utils.output``.
+
+Builds a context-like object with ``n`` quotes, a line and a histogram
+series over every quote and a signal on every tenth quote, then writes
+the document to a temporary file and reads it back these ways:
+
+- ``legacy``: ``Output`` dataclasses, ``asdict`` and one ``json.dumps``
+  string, with ``utcnow.get()`` per point (the previous implementation)
+- ``json``: ``JsonWriter`` with the standard library backend
+- ``orjson``: ``JsonWriter`` with orjson, when it is installed
+- ``v2``/``v2-or``: ``ColumnarJsonWriter`` (``format="json-v2"``) with
+  the standard library and orjson, read with ``read_json_v2()``
+- ``npz``: ``NpzWriter`` typed columns, read with ``read_npz()``
+- ``npz-z``: the same, compressed
+
+JSON is read back with ``json.loads`` (``orjson.loads`` for orjson).
+
+The legacy path is only run up to ``LEGACY_MAX`` points because it
+grows too slow beyond that.
+
+Reports the write and read times, the file size and, in a separate run
+because tracing slows encoding down, the peak Python memory while
+writing (``tracemalloc``).
+
+Usage:
+    python benchmarks/bench_output.py [sizes...]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict
+
+import numpy as np
+from utcnow import utcnow
+
+from openstoxlify.models.enum import Period, PlotType
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.models.output import Output, QuoteOut, QuotesOut, StrategyOut
+from openstoxlify.models.store import PlotStore, SignalStore
+from openstoxlify.utils import output as output_module
+from openstoxlify.utils.output import (
+    ColumnarJsonWriter,
+    JsonWriter,
+    NpzWriter,
+    build_plots,
+    read_json_v2,
+    read_npz,
+)
+
+SIZES = (100_000, 1_000_000, 2_000_000)
+LEGACY_MAX = 100_000
+
+
+class Chart:
+    """Minimal stand-in for a Context with quotes, plots and signals."""
+
+    def __init__(self, n: int):
+        rng = np.random.default_rng(0)
+        ts = 1_600_000_000 + 60 * np.arange(n, dtype=np.int64)
+        close = 100.0 + np.cumsum(rng.normal(size=n))
+        self._frame = QuoteFrame(ts, close, close + 1, close - 1, close, np.ones(n))
+        self._plots = PlotStore()
+        self._plots.extend(PlotType.LINE.value, "Close", ts, close, 0)
+        self._plots.extend(PlotType.HISTOGRAM.value, "Volume", ts, np.ones(n), 1)
+        self._signals = SignalStore()
+        self._signals.extend(ts[::10], np.where(close[::10] > 100, 1, -1), 1.0)
+
+    def quotes(self):
+        return self._frame.quotes()
+
+    def plots(self):
+        return self._plots.plots()
+
+    def signals(self):
+        return self._signals.signals()
+
+    def symbol(self):
+        return "BENCH"
+
+    def period(self):
+        return Period.MINUTELY
+
+    def provider(self):
+        class Source:
+            def source(self):
+                return "bench"
+
+        return Source()
+
+
+def legacy(chart: Chart, stream) -> None:
+    quotes = QuotesOut(
+        ticker=chart.symbol(),
+        interval="1m",
+        provider=chart.provider().source(),
+        data=[
+            QuoteOut(
+                timestamp=utcnow.get(q.timestamp.isoformat()),
+                open=q.open,
+                high=q.high,
+                low=q.low,
+                close=q.close,
+                volume=q.volume,
+            )
+            for q in chart.quotes()
+        ],
+    )
+    out = Output(
+        histogram=build_plots(chart, PlotType.HISTOGRAM),
+        line=build_plots(chart, PlotType.LINE),
+        area=build_plots(chart, PlotType.AREA),
+        strategy=[
+            StrategyOut(
+                label="default", data=[item.to_dict() for item in chart.signals()]
+            )
+        ],
+        quotes=quotes,
+    )
+    stream.write(json.dumps(asdict(out)) + "\n")
+
+
+def writer(backend: str):
+    return lambda chart, stream: JsonWriter(stream, backend).write(chart)
+
+
+def columnar_writer(backend: str):
+    return lambda chart, stream: ColumnarJsonWriter(stream, backend).write(chart)
+
+
+def npz_writer(compress: bool):
+    return lambda chart, stream: NpzWriter(stream, compress).write(chart)
+
+
+def read_json(path: str) -> None:
+    with open(path, "rb") as f:
+        json.loads(f.read())
+
+
+def read_orjson(path: str) -> None:
+    with open(path, "rb") as f:
+        output_module.orjson.loads(f.read())
+
+
+def read_columnar(path: str) -> None:
+    doc = read_json_v2(path)
+    for plot in doc["line"] + doc["histogram"]:
+        plot["value"].sum()
+
+
+def read_binary(path: str) -> None:
+    doc = read_npz(path)
+    for plot in doc["line"] + doc["histogram"]:
+        plot["value"].sum()
+
+
+def run(write, binary: bool, chart: Chart, path: str, traced: bool):
+    if traced:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with open(path, "wb" if binary else "w") as stream:
+        write(chart, stream)
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if traced:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main(sizes) -> None:
+    modes = [
+        ("legacy", legacy, read_json, False),
+        ("json", writer("json"), read_json, False),
+    ]
+    if output_module.orjson is not None:
+        modes.append(("orjson", writer("orjson"), read_orjson, False))
+    modes.append(("v2", columnar_writer("json"), read_columnar, False))
+    if output_module.orjson is not None:
+        modes.append(("v2-or", columnar_writer("orjson"), read_columnar, False))
+    modes += [
+        ("npz", npz_writer(False), read_binary, True),
+        ("npz-z", npz_writer(True), read_binary, True),
+    ]
+
+    print(
+        f"{'points':>10} {'mode':>8} {'write (s)':>10} {'read (s)':>9} "
+        f"{'peak MiB':>9} {'MiB out':>8}"
+    )
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "output")
+        for n in sizes:
+            chart = Chart(n)
+            for name, write, read, binary in modes:
+                if name == "legacy" and n > LEGACY_MAX:
+                    continue
+                elapsed, _ = run(write, binary, chart, path, traced=False)
+                _, peak = run(write, binary, chart, path, traced=True)
+                size = os.path.getsize(path) / 2**20
+                start = time.perf_counter()
+                read(path)
+                parsed = time.perf_counter() - start
+                print(
+                    f"{n:>10} {name:>8} {elapsed:>10.2f} {parsed:>9.2f} "
+                    f"{peak:>9.1f} {size:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
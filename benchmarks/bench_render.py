@@ -0,0 +1,121 @@
+"""
+Benchmark candlestick rendering in ``Canvas``.
+
+Builds the candlestick artists for a random-walk series and draws the
+figure on the Agg backend. Reports the wall time of both steps and the
+peak memory allocated by Python (``tracemalloc``), which is measured in
+a separate run. The legacy path (two ``vlines`` artists per candle) is
+only run up to ``LEGACY_MAX`` candles because it grows too slow beyond
+that.
+
+Usage:
+    python benchmarks/bench_render.py [sizes...]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.dates as mdates
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from openstoxlify.draw import Canvas
+from openstoxlify.models.frame import QuoteFrame
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LEGACY_MAX = 10_000
+
+
+class Quotes:
+    """Minimal stand-in for a Context that only holds quotes."""
+
+    def __init__(self, frame: QuoteFrame):
+        self._frame = frame
+
+    def plots(self):
+        return {}
+
+    def quotes(self):
+        return self._frame.quotes()
+
+    def signals(self):
+        return []
+
+
+def build_frame(n: int) -> QuoteFrame:
+    rng = np.random.default_rng(0)
+    close = 1_000.0 + np.cumsum(rng.normal(size=n))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = rng.uniform(0, 2, size=n)
+    ts = 1_600_000_000 + 60 * np.arange(n, dtype=np.int64)
+    return QuoteFrame(
+        ts,
+        open_,
+        np.maximum(open_, close) + spread,
+        np.minimum(open_, close) - spread,
+        close,
+        np.ones(n),
+    )
+
+
+def render_legacy(canvas: Canvas, ax) -> None:
+    frame = canvas._quote_frame()
+    x = mdates.date2num(frame.timestamp.astype("datetime64[s]"))
+    for i in range(len(frame)):
+        color = "green" if frame.close[i] > frame.open[i] else "red"
+        ax.vlines(x[i], frame.low[i], frame.high[i], color=color, lw=1)
+        ax.vlines(x[i], frame.open[i], frame.close[i], color=color, lw=4)
+
+
+def render_collections(canvas: Canvas, ax) -> None:
+    canvas._render_candlesticks(ax, 1, 4)
+
+
+def figure():
+    fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def measure(render, canvas: Canvas):
+    fig, ax = figure()
+    start = time.perf_counter()
+    render(canvas, ax)
+    built = time.perf_counter() - start
+    fig.canvas.draw()
+    drawn = time.perf_counter() - start - built
+
+    # Memory is measured in a separate run, tracemalloc slows allocation.
+    fig, ax = figure()
+    tracemalloc.start()
+    render(canvas, ax)
+    fig.canvas.draw()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return built, drawn, peak / 2**20
+
+
+def main(sizes) -> None:
+    print(
+        f"{'candles':>10} {'renderer':>12} {'build (s)':>10} "
+        f"{'draw (s)':>9} {'peak (MiB)':>11}"
+    )
+    for n in sizes:
+        canvas = Canvas(Quotes(build_frame(n)))
+        runs = [("collections", render_collections)]
+        if n <= LEGACY_MAX:
+            runs.insert(0, ("vlines", render_legacy))
+        for name, render in runs:
+            built, drawn, peak = measure(render, canvas)
+            print(f"{n:>10} {name:>12} {built:>10.3f} {drawn:>9.3f} {peak:>11.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,118 @@
+"""
+Benchmark trading signal rendering in ``Canvas``.
+
+Renders LONG/SHORT signals on every candle of a random-walk series and
+draws the figure on the Agg backend. The legacy path (one ``plot`` and
+one ``annotate`` per signal) is only run up to ``LEGACY_MAX`` signals
+because it grows too slow beyond that.
+
+Usage:
+    python benchmarks/bench_signals.py [sizes...]
+"""
+
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from openstoxlify.draw import Canvas
+from openstoxlify.models.enum import ActionType
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.models.series import ActionSeries
+from openstoxlify.utils.time import from_epoch
+
+SIZES = (1_000, 20_000, 200_000)
+LEGACY_MAX = 20_000
+
+
+class Signals:
+    """Minimal stand-in for a Context that holds quotes and signals."""
+
+    def __init__(self, n: int):
+        rng = np.random.default_rng(0)
+        close = 1_000.0 + np.cumsum(rng.normal(size=n))
+        ts = 1_600_000_000 + 3600 * np.arange(n, dtype=np.int64)
+        self._frame = QuoteFrame(ts, close, close + 1, close - 1, close, np.ones(n))
+        self._signals = [
+            ActionSeries(q.timestamp, ActionType.LONG if up else ActionType.SHORT, 1.0)
+            for q, up in zip(self._frame.quotes(), rng.random(n) < 0.5)
+        ]
+
+    def plots(self):
+        return {}
+
+    def quotes(self):
+        return self._frame.quotes()
+
+    def signals(self):
+        return self._signals
+
+
+def render_legacy(canvas: Canvas, ax, lut) -> None:
+    candle_ts, candle_x, candle_close = lut
+    lut = {
+        from_epoch(ts).isoformat(): (x, close)
+        for ts, x, close in zip(
+            candle_ts.tolist(), candle_x.tolist(), candle_close.tolist()
+        )
+    }
+    for trade in canvas._strategy_data:
+        ts_num, price = lut[trade.timestamp.isoformat()]
+        if trade.action == ActionType.LONG:
+            y, marker, color, dy = price * 0.95, "^", "blue", -15
+        else:
+            y, marker, color, dy = price * 1.05, "v", "purple", 10
+        ax.plot(ts_num, y, marker=marker, color=color, markersize=8)
+        ax.annotate(
+            f"{trade.action.name} {trade.amount}",
+            xy=(ts_num, y),
+            xytext=(0, dy),
+            textcoords="offset points",
+            ha="center",
+            fontsize=9,
+            color=color,
+        )
+
+
+def render_batched(canvas: Canvas, ax, lut) -> None:
+    canvas._render_trading_signals(ax, lut, 0.05, 8, 9)
+
+
+def measure(render, canvas: Canvas, lut):
+    fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    canvas._render_candlesticks(ax, 1, 4)
+
+    start = time.perf_counter()
+    render(canvas, ax, lut)
+    built = time.perf_counter() - start
+    fig.canvas.draw()
+    drawn = time.perf_counter() - start - built
+    return built, drawn, len(ax.texts)
+
+
+def main(sizes) -> None:
+    print(
+        f"{'signals':>10} {'renderer':>10} {'build (s)':>10} "
+        f"{'draw (s)':>9} {'labels':>7}"
+    )
+    for n in sizes:
+        canvas = Canvas(Signals(n))
+        lut = canvas._build_candle_lookup_table()
+        runs = [("batched", render_batched)]
+        if n <= LEGACY_MAX:
+            runs.insert(0, ("legacy", render_legacy))
+        for name, render in runs:
+            built, drawn, labels = measure(render, canvas, lut)
+            print(f"{n:>10} {name:>10} {built:>10.3f} {drawn:>9.3f} {labels:>7}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
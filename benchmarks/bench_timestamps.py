@@ -0,0 +1,90 @@
+"""
+Benchmark timestamp conversion in ``Canvas``.
+
+Compares converting a plotted series to matplotlib date numbers one
+point at a time with ``convert_timestamp()`` against the vectorized
+``_series_points()`` path, for a columnar ``SeriesView`` and for a list
+of ``FloatSeries``. Also times preparing the candle coordinates, which
+used to be converted separately by the candle lookup table, the candle
+renderer and the signal renderer.
+
+Usage:
+    python benchmarks/bench_timestamps.py [sizes...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from openstoxlify.draw import Canvas
+from openstoxlify.models.enum import PlotType
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.models.store import PlotStore
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+class Chart:
+    """Minimal stand-in for a Context with quotes and one line plot."""
+
+    def __init__(self, n: int):
+        ts = 1_600_000_000 + 60 * np.arange(n, dtype=np.int64)
+        close = 100.0 + np.cumsum(np.random.default_rng(0).normal(size=n))
+        self._frame = QuoteFrame(ts, close, close + 1, close - 1, close, np.ones(n))
+        self._store = PlotStore()
+        self._store.extend(PlotType.LINE.value, "Close", ts, close, 0)
+
+    def plots(self):
+        return self._store.plots()
+
+    def quotes(self):
+        return self._frame.quotes()
+
+    def signals(self):
+        return []
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(sizes) -> None:
+    print(f"{'points':>10} {'case':>22} {'per-point (s)':>14} {'vectorized (s)':>15}")
+    for n in sizes:
+        chart = Chart(n)
+        canvas = Canvas(chart)
+        view = chart.plots()[PlotType.LINE.value][0].data
+        items = list(view)
+
+        def per_point(data):
+            return lambda: (
+                [canvas.convert_timestamp(item.timestamp) for item in data],
+                [item.value for item in data],
+            )
+
+        def vectorized(data):
+            return lambda: canvas._series_points(data, None, None)
+
+        def legacy_candles():
+            quotes = list(chart.quotes())
+            for _ in range(3):
+                [canvas.convert_timestamp(q.timestamp) for q in quotes]
+
+        def candles():
+            canvas._candle_cache = None
+            canvas._candles()
+
+        rows = (
+            ("SeriesView", per_point(view), vectorized(view)),
+            ("List[FloatSeries]", per_point(items), vectorized(items)),
+            ("candles (3 consumers)", legacy_candles, candles),
+        )
+        for case, old, new in rows:
+            print(f"{n:>10} {case:>22} {timed(old):>14.3f} {timed(new):>15.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
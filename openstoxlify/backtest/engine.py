@@ -0,0 +1,363 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+from google.protobuf.wrappers_pb2 import Int64Value
+
+from ..context import Context
+from ..models.enum import PlotType
+from ..models.frame import QuoteFrame
+from ..providers.stoxlify.proto.statistic import statistic_pb2
+from ..providers.stoxlify.proto.types.amount import amount_pb2
+
+DEFAULT_CAPITAL = 10_000.0
+
+
+def _amount(
+    value: float, currency: str, perf: float | None = None
+) -> amount_pb2.Amount:
+    amount = amount_pb2.Amount(Cur=currency, Num=f"{value:.2f}")
+    if perf is not None:
+        amount.Perf = f"{perf:.2f}"
+    return amount
+
+
+def _decimals(values: np.ndarray) -> np.ndarray:
+    """Values formatted with two decimals, as a bytes array."""
+    return np.array(list(map(b"%.2f".__mod__, values.tolist())), dtype=np.bytes_)
+
+
+def _varint(values: np.ndarray) -> np.ndarray:
+    """Protobuf base-128 varints of non-negative integers, as a bytes array."""
+    rest = np.asarray(values, dtype=np.uint64).copy()
+    groups = [rest & 0x7F]
+    rest >>= np.uint64(7)
+    while rest.any():
+        groups[-1] |= (rest > 0).astype(np.uint64) << np.uint64(7)
+        groups.append(rest & 0x7F)
+        rest >>= np.uint64(7)
+    encoded = np.stack(groups, axis=1).astype(np.uint8)
+    return encoded.view(f"S{len(groups)}").reshape(len(encoded))
+
+
+def _field(tag: int, payload: np.ndarray) -> np.ndarray:
+    """Length-delimited protobuf field ``tag`` for every payload."""
+    head = np.strings.add(np.bytes_(bytes([tag])), _varint(np.strings.str_len(payload)))
+    return np.strings.add(head, payload)
+
+
+def _encode_trades(
+    currency: str,
+    capital: np.ndarray,
+    entry: np.ndarray,
+    exit: np.ndarray,
+    kind: np.ndarray,
+    pnl: np.ndarray,
+) -> bytes:
+    """
+    Wire encoding of the ``Trades`` field of ``statistic_pb2.Trades``.
+
+    Builds every ``Trade`` at once with NumPy byte-string operations
+    instead of one message object per trade. Only valid while no field
+    ends in a NUL byte, which holds for formatted numbers and the
+    non-zero ``TradeType`` values used here.
+    """
+    cur = np.bytes_(b"\x0a" + _varint([len(currency.encode())])[0] + currency.encode())
+
+    def amount(num: np.ndarray) -> np.ndarray:
+        return np.strings.add(cur, _field(0x12, num))
+
+    trade = np.strings.add(_field(0x0A, amount(capital)), _field(0x12, amount(entry)))
+    trade = np.strings.add(trade, _field(0x1A, amount(exit)))
+    types = np.strings.add(np.bytes_(b"\x20"), kind.astype(np.uint8).view("S1"))
+    trade = np.strings.add(np.strings.add(trade, types), _field(0x2A, pnl))
+    return b"".join(_field(0x12, trade).tolist())
+
+
+@dataclass(frozen=True)
+class TradeLog:
+    """
+    Columnar record of the trades of a backtest, one row per trade.
+
+    Attributes:
+        entry (np.ndarray): Bar index where the position was opened
+        exit (np.ndarray): Bar index where it was closed, or the last bar
+            for a trade that is still open
+        size (np.ndarray): Signed position size, positive for long
+        entry_price (np.ndarray): Close price of the entry bar
+        exit_price (np.ndarray): Close price of the exit bar
+        pnl (np.ndarray): Profit in currency after fees
+        closed (np.ndarray): False for the trade still open at the end
+    """
+
+    entry: np.ndarray
+    exit: np.ndarray
+    size: np.ndarray
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    pnl: np.ndarray
+    closed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.entry)
+
+    @property
+    def returns(self) -> np.ndarray:
+        """Price change in the trade direction, in percent."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = (self.exit_price / self.entry_price - 1.0) * 100.0
+        return np.sign(self.size) * change
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """
+    Bar-by-bar outcome of replaying signals against quotes.
+
+    Attributes:
+        timestamps (np.ndarray): Epoch seconds of every bar
+        position (np.ndarray): Position held after each bar's close
+        equity (np.ndarray): Account value at each bar's close
+        drawdown (np.ndarray): Distance of equity below its running peak
+        trades (TradeLog): Trades opened during the backtest
+        capital (float): Starting capital
+        currency (str): Currency code used in ``statistic()``
+        label (str): Name of the trade list in ``statistic()``
+    """
+
+    timestamps: np.ndarray
+    position: np.ndarray
+    equity: np.ndarray
+    drawdown: np.ndarray
+    trades: TradeLog
+    capital: float
+    currency: str = "USD"
+    label: str = "default"
+
+    @property
+    def net_profit(self) -> float:
+        return float(self.equity[-1] - self.capital) if len(self.equity) else 0.0
+
+    @property
+    def max_drawdown(self) -> float:
+        return float(self.drawdown.max()) if len(self.drawdown) else 0.0
+
+    def statistic(self) -> statistic_pb2.Statistic:
+        """
+        Summarize the backtest as a ``statistic_pb2.Statistic`` message.
+
+        Percentages are formatted with two decimals. Only closed trades
+        count towards the trade totals and are listed in ``Details``.
+        ``PercentProfitable`` and ``WinRate`` are both the share of closed
+        trades with a positive P&L.
+        """
+        closed = self.trades.closed
+        total = int(closed.sum())
+        winning = int((self.trades.pnl[closed] > 0).sum())
+
+        peak = np.maximum.accumulate(self.equity) if len(self.equity) else self.equity
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown_pct = float(np.nanmax(self.drawdown / peak, initial=0.0)) * 100
+
+        trades = self.trades
+        size = trades.size[closed]
+        details = _encode_trades(
+            self.currency,
+            capital=_decimals(np.abs(size) * trades.entry_price[closed]),
+            entry=_decimals(trades.entry_price[closed]),
+            exit=_decimals(trades.exit_price[closed]),
+            kind=np.where(
+                size > 0, statistic_pb2.TradeType.Long, statistic_pb2.TradeType.Short
+            ),
+            pnl=_decimals(trades.returns[closed]),
+        )
+
+        profit_pct = self.net_profit / self.capital * 100 if self.capital else 0.0
+        win_pct = winning / total * 100 if total else 0.0
+        stats = statistic_pb2.Statistic(
+            Capital=_amount(self.capital, self.currency),
+            NetProfit=_amount(self.net_profit, self.currency, profit_pct),
+            PercentProfitable=f"{win_pct:.2f}",
+            TotalClosedTrades=Int64Value(value=total),
+            TotalWinningTrades=Int64Value(value=winning),
+            MaximumDrawdown=_amount(self.max_drawdown, self.currency, drawdown_pct),
+            WinRate=f"{win_pct:.2f}",
+        )
+        # Filled in place: passing a large Trades message to the
+        # constructor would copy it.
+        trade_list = stats.Details.add(Label=self.label)
+        trade_list.MergeFromString(details)
+        return stats
+
+    def plot(self, ctx: Context, screen_index: int = 1) -> None:
+        """
+        Add the equity curve and drawdown to a Context's plots.
+
+        Equity is drawn as a line on ``screen_index`` and the drawdown as
+        an area on the panel below it.
+        """
+        ctx.plot_series(
+            "Equity", PlotType.LINE, self.timestamps, self.equity, screen_index
+        )
+        ctx.plot_series(
+            "Drawdown",
+            PlotType.AREA,
+            self.timestamps,
+            -self.drawdown,
+            screen_index + 1,
+        )
+
+
+def _target_positions(
+    bars: np.ndarray, timestamps: np.ndarray, targets: np.ndarray, hold: np.ndarray
+) -> np.ndarray:
+    # HOLD means no action, so it never changes the target.
+    timestamps, targets = timestamps[~hold], targets[~hold]
+
+    # Signals on the same bar: the one recorded last wins.
+    order = np.argsort(timestamps, kind="stable")
+    ts = timestamps[order]
+    last = np.ones(len(ts), dtype=bool)
+    last[:-1] = ts[1:] != ts[:-1]
+    ts, values = ts[last], targets[order][last]
+
+    index = np.searchsorted(bars, ts)
+    inside = index < len(bars)
+    index, ts, values = index[inside], ts[inside], values[inside]
+    matched = bars[index] == ts
+
+    target = np.full(len(bars), np.nan)
+    target[index[matched]] = values[matched]
+
+    # Forward fill the target, starting flat.
+    filled = np.where(np.isnan(target), 0, np.arange(len(bars)))
+    np.maximum.accumulate(filled, out=filled)
+    position = target[filled]
+    position[np.isnan(position)] = 0.0
+    return position
+
+
+def _trades(position: np.ndarray, close: np.ndarray, fee: float) -> TradeLog:
+    previous = np.concatenate(([0.0], position[:-1]))
+    changes = np.flatnonzero(position != previous)
+    open_at = changes[position[changes] != 0]
+
+    following = np.searchsorted(changes, open_at, side="right")
+    closed = following < len(changes)
+    exit_at = np.where(closed, changes[np.minimum(following, len(changes) - 1)], 0)
+    exit_at = np.where(closed, exit_at, len(position) - 1)
+
+    size = position[open_at]
+    entry_price = close[open_at]
+    exit_price = close[exit_at]
+    costs = fee * np.abs(size) * (entry_price + np.where(closed, exit_price, 0.0))
+    return TradeLog(
+        entry=open_at,
+        exit=exit_at,
+        size=size,
+        entry_price=entry_price,
+        exit_price=exit_price,
+        pnl=size * (exit_price - entry_price) - costs,
+        closed=closed,
+    )
+
+
+def run(
+    frame: QuoteFrame,
+    timestamps: Sequence[int] | np.ndarray,
+    actions: Sequence[int] | np.ndarray,
+    amounts: Sequence[float] | np.ndarray,
+    capital: float = DEFAULT_CAPITAL,
+    fee: float = 0.0,
+    currency: str = "USD",
+    label: str = "default",
+) -> BacktestResult:
+    """
+    Replay signal columns against a quote frame.
+
+    Each LONG or SHORT signal sets the target position to ``+amount`` or
+    ``-amount`` units from the close of the bar with the same timestamp
+    until the next LONG or SHORT signal. HOLD is no action and keeps the
+    current position; a LONG or SHORT signal with an amount of 0 closes
+    it. Signals without a matching bar are ignored. Changing the size of a position closes the
+    current trade and opens a new one.
+
+    Everything is computed with NumPy array operations, so the cost grows
+    linearly with the number of bars without a Python loop per bar.
+
+    Args:
+        frame (QuoteFrame): Quotes to trade on
+        timestamps: Signal epoch seconds
+        actions: Signal action codes (LONG=1, SHORT=-1, HOLD=0)
+        amounts: Position size per signal, in units
+        capital (float): Starting capital. Defaults to 10,000.
+        fee (float): Fee as a fraction of traded value, e.g. 0.001
+        currency (str): Currency code for the ``Statistic`` amounts
+        label (str): Name of the trade list in the ``Statistic``
+
+    Returns:
+        BacktestResult: Positions, equity curve, drawdown and trades
+    """
+    ts = np.asarray(timestamps, dtype=np.int64)
+    codes = np.asarray(actions, dtype=np.float64)
+    size = np.broadcast_to(np.asarray(amounts, dtype=np.float64), ts.shape)
+    if codes.shape != ts.shape:
+        raise ValueError("timestamps and actions must be 1-D and equal length")
+
+    close = frame.close
+    position = _target_positions(frame.timestamp, ts, codes * size, codes == 0)
+
+    pnl = np.zeros(len(close))
+    pnl[1:] = position[:-1] * np.diff(close)
+    traded = np.abs(np.diff(position, prepend=0.0))
+    equity = capital + np.cumsum(pnl - fee * traded * close)
+    drawdown = np.maximum.accumulate(equity) - equity if len(equity) else equity
+
+    return BacktestResult(
+        timestamps=frame.timestamp,
+        position=position,
+        equity=equity,
+        drawdown=drawdown,
+        trades=_trades(position, close, fee),
+        capital=capital,
+        currency=currency,
+        label=label,
+    )
+
+
+def backtest(
+    ctx: Context,
+    capital: float = DEFAULT_CAPITAL,
+    fee: float = 0.0,
+    currency: str = "USD",
+) -> BacktestResult:
+    """
+    Backtest the signals recorded in a Context against its quotes.
+
+    Args:
+        ctx (Context): Context with loaded quotes and recorded signals
+        capital (float): Starting capital. Defaults to 10,000.
+        fee (float): Fee as a fraction of traded value, e.g. 0.001
+        currency (str): Currency code for the ``Statistic`` amounts
+
+    Returns:
+        BacktestResult: See ``run()`` for the trading rules
+
+    Example:
+        >>> result = backtest(ctx, capital=10_000, fee=0.001)
+        >>> stats = result.statistic()
+        >>> print(stats.NetProfit.Num, stats.WinRate)
+        >>> result.plot(ctx)
+        >>> Canvas(ctx).draw()
+    """
+    signals = ctx.signals()
+    return run(
+        ctx.frame(),
+        signals.timestamps,
+        signals.actions,
+        signals.amounts,
+        capital=capital,
+        fee=fee,
+        currency=currency,
+        label=ctx.symbol(),
+    )
@@ -0,0 +1,115 @@
+import os
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from ..context import Context
+from ..utils.shared import SharedFrame
+from .engine import DEFAULT_CAPITAL
+from .worker import Strategy, SweepResult, Task, expand, loaded_frame, pool
+from .worker import run_tasks
+
+
+@dataclass
+class SweepReport:
+    """
+    Result of a parameter sweep.
+
+    Attributes:
+        results (List[SweepResult]): Successful combinations, best first
+        errors (List[Tuple[Dict[str, Any], Exception]]): Parameters and
+            failure of every combination whose strategy raised
+    """
+
+    results: List[SweepResult] = field(default_factory=list)
+    errors: List[Tuple[Dict[str, Any], Exception]] = field(default_factory=list)
+
+    @property
+    def best(self) -> SweepResult | None:
+        return self.results[0] if self.results else None
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """
+        Flatten the ranking into one dict per combination, e.g. for
+        ``pandas.DataFrame(report.rows())``.
+        """
+        return [
+            {
+                **result.params,
+                "net_profit": result.net_profit,
+                "max_drawdown": result.max_drawdown,
+                "total_trades": result.total_trades,
+                "win_rate": result.win_rate,
+            }
+            for result in self.results
+        ]
+
+
+def sweep(
+    ctx: Context,
+    strategy: Strategy,
+    grid: Mapping[str, Iterable[Any]] | Iterable[Mapping[str, Any]],
+    capital: float = DEFAULT_CAPITAL,
+    fee: float = 0.0,
+    key: Callable[[SweepResult], float] | None = None,
+    max_workers: int | None = None,
+) -> SweepReport:
+    """
+    Backtest a strategy for every parameter combination in parallel.
+
+    The quotes of ``ctx`` are copied once into shared memory and every
+    worker process reads them in place. For each combination a fresh
+    Context over those quotes is passed to ``strategy(ctx, params)``,
+    and the signals it records are backtested.
+
+    Args:
+        ctx (Context): Context whose symbol, period and quotes are used.
+            Quotes are fetched if none were loaded yet.
+        strategy: Picklable ``(Context, params) -> None`` callable, e.g.
+            a module-level function
+        grid: Mapping of parameter names to candidate values (all
+            combinations are run), or an iterable of parameter dicts
+        capital (float): Starting capital per backtest
+        fee (float): Fee as a fraction of traded value
+        key: Score to rank by, higher is better. Defaults to net profit.
+        max_workers (int | None): Worker processes. Defaults to the
+            number of CPUs.
+
+    Returns:
+        SweepReport: Ranked results and per-combination errors
+
+    Example:
+        >>> def crossover(ctx, params):
+        ...     frame = ctx.quote_frame()
+        ...     fast = sma(frame.close, params["fast"])
+        ...     slow = sma(frame.close, params["slow"])
+        ...     ctx.signals_from_masks(frame.timestamp, fast > slow, fast < slow)
+        >>> report = sweep(ctx, crossover, {"fast": [10, 20], "slow": [50, 100]})
+        >>> report.best.params
+        {'fast': 20, 'slow': 100}
+    """
+    frame = loaded_frame(ctx)
+
+    combos = expand(grid)
+    tasks = [Task(strategy, params, 0, len(frame), capital, fee) for params in combos]
+    workers = max_workers or os.cpu_count() or 1
+
+    report = SweepReport()
+    if not tasks:
+        return report
+
+    source = ctx.provider().source()
+    with SharedFrame(frame) as shared:
+        with pool(
+            shared.handle, source, ctx.symbol(), ctx.period(), workers
+        ) as executor:
+            outcomes = run_tasks(executor, tasks, workers)
+
+    for params, outcome in zip(combos, outcomes):
+        if isinstance(outcome, Exception):
+            report.errors.append((params, outcome))
+        else:
+            report.results.append(outcome)
+
+    report.results.sort(key=key or (lambda r: r.net_profit), reverse=True)
+    return report
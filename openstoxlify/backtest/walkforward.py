@@ -0,0 +1,215 @@
+import os
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from ..context import Context
+from ..utils.shared import SharedFrame
+from .engine import DEFAULT_CAPITAL
+from .worker import Strategy, SweepResult, Task, expand, loaded_frame, pool
+from .worker import run_tasks
+
+Window = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Fold:
+    """
+    One walk-forward step.
+
+    Attributes:
+        index (int): Position of the fold, oldest first
+        train (Tuple[int, int]): In-sample bar range ``[lo, hi)``
+        test (Tuple[int, int]): Out-of-sample bar range ``[lo, hi)``
+        params (Dict[str, Any] | None): Best in-sample parameters, None
+            if every combination failed
+        in_sample (SweepResult | None): Backtest of ``params`` on ``train``
+        out_of_sample (SweepResult | None): Backtest of ``params`` on
+            ``test``, None if it failed
+    """
+
+    index: int
+    train: Window
+    test: Window
+    params: Dict[str, Any] | None = None
+    in_sample: SweepResult | None = None
+    out_of_sample: SweepResult | None = None
+
+
+@dataclass
+class WalkForwardReport:
+    """
+    Result of a walk-forward run.
+
+    Attributes:
+        folds (List[Fold]): Folds in chronological order
+        errors (List[Tuple[int, Dict[str, Any], Exception]]): Fold index,
+            parameters and failure of every strategy run that raised
+    """
+
+    folds: List[Fold] = field(default_factory=list)
+    errors: List[Tuple[int, Dict[str, Any], Exception]] = field(default_factory=list)
+
+    @property
+    def net_profit(self) -> float:
+        """Sum of the out-of-sample net profits."""
+        return sum(f.out_of_sample.net_profit for f in self.folds if f.out_of_sample)
+
+    @property
+    def total_trades(self) -> int:
+        """Closed out-of-sample trades over all folds."""
+        return sum(f.out_of_sample.total_trades for f in self.folds if f.out_of_sample)
+
+
+def split(
+    rows: int, folds: int, train_ratio: float = 3.0, anchored: bool = False
+) -> List[Tuple[Window, Window]]:
+    """
+    Split ``rows`` bars into consecutive in-sample/out-of-sample windows.
+
+    The out-of-sample windows have equal length and together cover the
+    end of the history; each is preceded by an in-sample window about
+    ``train_ratio`` times as long. With ``anchored`` every in-sample
+    window starts at the first bar instead of rolling forward.
+
+    Raises:
+        ValueError: If there are too few bars for the requested folds
+
+    Example:
+        >>> split(100, folds=2, train_ratio=3.0)
+        [((0, 60), (60, 80)), ((20, 80), (80, 100))]
+    """
+    if folds < 1 or train_ratio <= 0:
+        raise ValueError("folds must be at least 1 and train_ratio positive")
+
+    test = int(rows // (folds + train_ratio))
+    if test < 1:
+        raise ValueError(f"{rows} bars are not enough for {folds} folds")
+
+    train = rows - folds * test
+    return [
+        (
+            (0 if anchored else k * test, train + k * test),
+            (train + k * test, train + (k + 1) * test),
+        )
+        for k in range(folds)
+    ]
+
+
+def walk_forward(
+    ctx: Context,
+    strategy: Strategy,
+    grid: Mapping[str, Iterable[Any]] | Iterable[Mapping[str, Any]],
+    folds: int = 5,
+    train_ratio: float = 3.0,
+    anchored: bool = False,
+    warmup: int = 0,
+    capital: float = DEFAULT_CAPITAL,
+    fee: float = 0.0,
+    key: Callable[[SweepResult], float] | None = None,
+    max_workers: int | None = None,
+) -> WalkForwardReport:
+    """
+    Optimize a strategy in-sample and score it out-of-sample, fold by fold.
+
+    The history of ``ctx`` is fetched once and copied into shared memory.
+    Every fold is a zero-copy slice of it. All in-sample runs of all
+    folds are evaluated concurrently on one process pool, then the best
+    parameters of each fold are run on the following out-of-sample
+    window, again concurrently.
+
+    Args:
+        ctx (Context): Context whose symbol, period and quotes are used.
+            Quotes are fetched if none were loaded yet.
+        strategy: Picklable ``(Context, params) -> None`` callable
+        grid: Mapping of parameter names to candidate values, or an
+            iterable of parameter dicts
+        folds (int): Number of out-of-sample windows. Defaults to 5.
+        train_ratio (float): In-sample length relative to the
+            out-of-sample length. Defaults to 3.0.
+        anchored (bool): Grow the in-sample window from the first bar
+            instead of rolling it forward. Defaults to False.
+        warmup (int): Bars before each window that the strategy sees to
+            prime its indicators without trading on them, e.g. the
+            longest indicator period. Defaults to 0.
+        capital (float): Starting capital per backtest
+        fee (float): Fee as a fraction of traded value
+        key: In-sample score to select by, higher is better. Defaults
+            to net profit.
+        max_workers (int | None): Worker processes. Defaults to the
+            number of CPUs.
+
+    Returns:
+        WalkForwardReport: Folds with chosen parameters and scores
+
+    Example:
+        >>> report = walk_forward(
+        ...     ctx, crossover, {"fast": [10, 20], "slow": [50, 100]},
+        ...     folds=4, warmup=100,
+        ... )
+        >>> for fold in report.folds:
+        ...     print(fold.params, fold.out_of_sample.net_profit)
+    """
+    frame = loaded_frame(ctx)
+    windows = split(len(frame), folds, train_ratio, anchored)
+    combos = expand(grid)
+    score = key or (lambda r: r.net_profit)
+    workers = max_workers or os.cpu_count() or 1
+
+    report = WalkForwardReport()
+    if not combos:
+        report.folds = [Fold(i, train, test) for i, (train, test) in enumerate(windows)]
+        return report
+
+    def task(params: Dict[str, Any], window: Window) -> Task:
+        return Task(strategy, params, window[0], window[1], capital, fee, warmup)
+
+    source = ctx.provider().source()
+    with SharedFrame(frame) as shared:
+        with pool(
+            shared.handle, source, ctx.symbol(), ctx.period(), workers
+        ) as executor:
+            in_sample = run_tasks(
+                executor,
+                [task(params, train) for train, _ in windows for params in combos],
+                workers,
+            )
+
+            best: List[SweepResult | None] = []
+            for i in range(len(windows)):
+                results = []
+                for params, outcome in zip(
+                    combos, in_sample[i * len(combos) : (i + 1) * len(combos)]
+                ):
+                    if isinstance(outcome, Exception):
+                        report.errors.append((i, params, outcome))
+                    else:
+                        results.append(outcome)
+                best.append(max(results, key=score) if results else None)
+
+            chosen = [i for i, result in enumerate(best) if result is not None]
+            out_of_sample = run_tasks(
+                executor,
+                [task(best[i].params, windows[i][1]) for i in chosen],
+                workers,
+            )
+
+    scored: Dict[int, SweepResult] = {}
+    for i, outcome in zip(chosen, out_of_sample):
+        if isinstance(outcome, Exception):
+            report.errors.append((i, best[i].params, outcome))
+        else:
+            scored[i] = outcome
+
+    report.folds = [
+        Fold(
+            index=i,
+            train=train,
+            test=test,
+            params=best[i].params if best[i] else None,
+            in_sample=best[i],
+            out_of_sample=scored.get(i),
+        )
+        for i, (train, test) in enumerate(windows)
+    ]
+    return report
@@ -0,0 +1,222 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import product
+from typing import Any, Callable, Dict, Iterable, List, Mapping
+
+from ..cache.memory import QuoteCache
+from ..context import Context
+from ..models.enum import Period
+from ..models.frame import QuoteFrame
+from ..models.model import Quote
+from ..models.series import ActionSeries
+from ..providers.stoxlify.proto.statistic import statistic_pb2
+from ..utils.shared import SharedFrameHandle, attach
+from .engine import DEFAULT_CAPITAL, run
+
+Strategy = Callable[[Context, Dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Backtest outcome of one parameter combination.
+
+    Attributes:
+        params (Dict[str, Any]): Parameters passed to the strategy
+        net_profit (float): Final equity minus capital
+        max_drawdown (float): Largest drop of equity below its peak
+        total_trades (int): Number of closed trades
+        winning_trades (int): Closed trades with a positive PnL
+        serialized_statistic (bytes): Full backtest ``Statistic`` in wire
+            format, decoded by ``statistic``. Generated protobuf classes
+            cannot be pickled across processes.
+    """
+
+    params: Dict[str, Any]
+    net_profit: float
+    max_drawdown: float
+    total_trades: int
+    winning_trades: int
+    serialized_statistic: bytes = field(repr=False)
+
+    @property
+    def statistic(self) -> statistic_pb2.Statistic:
+        return statistic_pb2.Statistic.FromString(self.serialized_statistic)
+
+    @property
+    def win_rate(self) -> float:
+        """Winning trades in percent of closed trades."""
+        return (
+            self.winning_trades / self.total_trades * 100 if self.total_trades else 0.0
+        )
+
+
+@dataclass(frozen=True)
+class Task:
+    """
+    One strategy run scored over the bars ``[lo, hi)`` of the shared
+    frame.
+
+    The strategy also sees the ``warmup`` bars before ``lo`` so its
+    indicators are primed, but signals on those bars are not traded.
+    """
+
+    strategy: Strategy
+    params: Dict[str, Any]
+    lo: int
+    hi: int
+    capital: float = DEFAULT_CAPITAL
+    fee: float = 0.0
+    warmup: int = 0
+
+
+class ReplayProvider:
+    """Provider that serves a fixed ``QuoteFrame`` for every request."""
+
+    def __init__(self, source: str, frame: QuoteFrame):
+        self._source = source
+        self._frame = frame
+
+    def source(self) -> str:
+        return self._source
+
+    def quote_frame(
+        self,
+        symbol: str,
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> QuoteFrame:
+        return self._frame.between(start, end)
+
+    def quotes(
+        self,
+        symbol: str,
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> List[Quote]:
+        return self.quote_frame(symbol, period, start, end).to_list()
+
+    def authenticate(self, token: str) -> None:
+        return
+
+    def execute(
+        self, id: str, symbol: str, action: ActionSeries, amount: float
+    ) -> None:
+        return
+
+
+def evaluate(
+    frame: QuoteFrame, source: str, symbol: str, period: Period, task: Task
+) -> SweepResult:
+    """
+    Run a strategy on a fresh Context over a window of ``frame`` and
+    backtest the signals it records on the bars ``[task.lo, task.hi)``.
+    """
+    start = max(task.lo - task.warmup, 0)
+    ctx = Context(
+        [],
+        ReplayProvider(source, frame[start : task.hi]),
+        symbol,
+        period,
+        cache=QuoteCache(),
+    )
+    ctx.quotes()
+    task.strategy(ctx, dict(task.params))
+
+    signals = ctx.signals()
+    result = run(
+        ctx.frame()[task.lo - start :],
+        signals.timestamps,
+        signals.actions,
+        signals.amounts,
+        capital=task.capital,
+        fee=task.fee,
+        label=symbol,
+    )
+    statistic = result.statistic()
+    return SweepResult(
+        params=dict(task.params),
+        net_profit=result.net_profit,
+        max_drawdown=result.max_drawdown,
+        total_trades=statistic.TotalClosedTrades.value,
+        winning_trades=statistic.TotalWinningTrades.value,
+        serialized_statistic=statistic.SerializeToString(),
+    )
+
+
+def loaded_frame(ctx: Context) -> QuoteFrame:
+    """Quotes already loaded in ``ctx``, fetching them if there are none."""
+    frame = ctx.frame()
+    return frame if len(frame) else ctx.quote_frame()
+
+
+# Per-process state set up by ``_init`` in every pool worker.
+_worker: Dict[str, Any] = {}
+
+
+def _init(handle: SharedFrameHandle, source: str, symbol: str, period: Period):
+    shm, frame = attach(handle)
+    _worker.update(shm=shm, frame=frame, source=source, symbol=symbol, period=period)
+
+
+def _run(task: Task) -> SweepResult | Exception:
+    try:
+        return evaluate(
+            _worker["frame"],
+            _worker["source"],
+            _worker["symbol"],
+            _worker["period"],
+            task,
+        )
+    except Exception as err:
+        return err
+
+
+def pool(
+    handle: SharedFrameHandle,
+    source: str,
+    symbol: str,
+    period: Period,
+    max_workers: int | None = None,
+) -> Executor:
+    """Process pool whose workers are attached to a shared frame."""
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init,
+        initargs=(handle, source, symbol, period),
+    )
+
+
+def run_tasks(
+    executor: Executor, tasks: List[Task], workers: int
+) -> List[SweepResult | Exception]:
+    """
+    Run tasks on a pool from ``pool()``, keeping their order.
+
+    Failures are returned in place of the result instead of aborting the
+    remaining tasks.
+    """
+    chunksize = max(1, len(tasks) // (workers * 4))
+    return list(executor.map(_run, tasks, chunksize=chunksize))
+
+
+def expand(
+    grid: Mapping[str, Iterable[Any]] | Iterable[Mapping[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Expand a parameter grid into a list of parameter dicts.
+
+    A mapping of names to candidate values yields every combination; an
+    iterable of mappings is used as is.
+
+    Example:
+        >>> expand({"fast": [10, 20], "slow": [50]})
+        [{'fast': 10, 'slow': 50}, {'fast': 20, 'slow': 50}]
+    """
+    if isinstance(grid, Mapping):
+        names = list(grid)
+        return [dict(zip(names, values)) for values in product(*grid.values())]
+    return [dict(params) for params in grid]
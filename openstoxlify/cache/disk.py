@@ -0,0 +1,143 @@
+import json
+import os
+import tempfile
+import uuid
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+from ..models.frame import QuoteFrame
+
+META_FILE = "meta.json"
+
+
+@dataclass(frozen=True, slots=True)
+class StoredQuotes:
+    """
+    Candles kept on disk for one source/symbol/interval.
+
+    Attributes:
+        frame (QuoteFrame): Memory-mapped candles
+        start (int | None): Earliest epoch second covered by past
+            fetches, None when the full history was fetched
+        end (int): Latest epoch second covered by past fetches
+    """
+
+    frame: QuoteFrame
+    start: int | None
+    end: int
+
+    def missing(self, start: int | None, end: int) -> List[Tuple[int | None, int]]:
+        """
+        Ranges of ``[start, end]`` that still need to be fetched.
+
+        The tail gap starts at the last stored candle rather than at the
+        end of coverage, so a candle that was still open at the previous
+        fetch is refreshed.
+        """
+        gaps: List[Tuple[int | None, int]] = []
+
+        if self.start is not None and (start is None or start < self.start):
+            gaps.append((start, self.start))
+
+        if end > self.end:
+            tail = self.end
+            if len(self.frame):
+                tail = min(tail, int(self.frame.timestamp[-1]))
+            gaps.append((tail, end))
+
+        return gaps
+
+
+class DiskQuoteStore:
+    """
+    Persistent columnar store of fetched candles.
+
+    Each source/symbol/interval gets a directory holding one ``.npy``
+    file per ``QuoteFrame`` column plus a ``meta.json`` describing the
+    covered time range. Columns are opened with ``np.load(mmap_mode="r")``,
+    so loading a long history does not read it into memory up front.
+
+    Writes go to a new file generation and are published by atomically
+    replacing ``meta.json``, so readers never see a half-written frame.
+    Generation names are unique per write (process id plus a random
+    suffix), so processes saving the same key at once never write to
+    each other's files; the last ``meta.json`` replaced wins.
+
+    Example:
+        >>> store = DiskQuoteStore("~/.cache/openstoxlify")
+        >>> provider = Provider(DefaultProvider.YFinance, store=store)
+    """
+
+    def __init__(self, root: str | os.PathLike):
+        self._root = Path(root).expanduser()
+
+    def _dir(self, source: str, symbol: str, interval: str) -> Path:
+        parts = (quote(part, safe="-_.") for part in (source, symbol, interval))
+        return self._root.joinpath(*parts)
+
+    def load(self, source: str, symbol: str, interval: str) -> StoredQuotes | None:
+        """Open the stored candles, or return None if nothing is stored."""
+        directory = self._dir(source, symbol, interval)
+        try:
+            meta = json.loads((directory / META_FILE).read_text())
+            columns = [
+                np.load(directory / f"{meta['generation']}.{name}.npy", mmap_mode="r")
+                for name in QuoteFrame.COLUMNS
+            ]
+        except (FileNotFoundError, KeyError, ValueError):
+            return None
+
+        return StoredQuotes(
+            frame=QuoteFrame(*columns), start=meta["start"], end=meta["end"]
+        )
+
+    def save(
+        self,
+        source: str,
+        symbol: str,
+        interval: str,
+        frame: QuoteFrame,
+        start: int | None,
+        end: int,
+    ) -> StoredQuotes:
+        """
+        Replace the stored candles and coverage for a source/symbol/interval.
+
+        Args:
+            frame (QuoteFrame): Sorted, de-duplicated candles to store
+            start (int | None): Earliest covered epoch second, None for
+                the full history
+            end (int): Latest covered epoch second
+        """
+        directory = self._dir(source, symbol, interval)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        previous = None
+        try:
+            previous = json.loads((directory / META_FILE).read_text())["generation"]
+        except (FileNotFoundError, KeyError, ValueError):
+            pass
+
+        generation = f"{os.getpid()}-{uuid.uuid4().hex}"
+        for name in QuoteFrame.COLUMNS:
+            np.save(directory / f"{generation}.{name}.npy", getattr(frame, name))
+
+        meta = {"generation": generation, "start": start, "end": end}
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".json")
+        with os.fdopen(fd, "w") as fp:
+            json.dump(meta, fp)
+        os.replace(tmp, directory / META_FILE)
+
+        if previous is not None:
+            for name in QuoteFrame.COLUMNS:
+                try:
+                    (directory / f"{previous}.{name}.npy").unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+        return self.load(source, symbol, interval) or StoredQuotes(frame, start, end)
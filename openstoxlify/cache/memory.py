@@ -0,0 +1,223 @@
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Hashable, Tuple
+
+from ..models.enum import Period
+from ..models.frame import QuoteFrame
+from ..utils.time import to_epoch
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL = 60.0
+
+_UNCHANGED = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheKey:
+    source: Hashable
+    symbol: str
+    period: str
+    start: int | None
+    end: int | None
+
+    @classmethod
+    def of(
+        cls,
+        source: Hashable,
+        symbol: str,
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> "CacheKey":
+        return cls(
+            source=source,
+            symbol=symbol,
+            period=period.value,
+            start=None if start is None else to_epoch(start),
+            end=None if end is None else to_epoch(end),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    nbytes: int
+
+
+class QuoteCache:
+    """
+    Thread-safe LRU cache of ``QuoteFrame`` objects.
+
+    Entries are keyed by ``CacheKey`` (provider source, symbol, period,
+    start, end), evicted least-recently-used first once the total size
+    of the cached columns exceeds ``max_bytes``, and expire ``ttl``
+    seconds after they were stored.
+
+    Concurrent ``get_or_load()`` calls for the same key share a single
+    load, so parallel strategies never fetch the same history twice.
+
+    Example:
+        >>> cache = default_cache()
+        >>> cache.configure(max_bytes=1 << 30, ttl=300)
+        >>> cache.stats().hits
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float | None = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_bytes (int): Memory budget for cached columns in bytes
+            ttl (float | None): Seconds an entry stays valid. None keeps
+                entries until they are evicted.
+            clock (Callable[[], float]): Monotonic time source
+        """
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[QuoteFrame, float]]" = OrderedDict()
+        self._loading: Dict[CacheKey, threading.Event] = {}
+        self._nbytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def configure(self, max_bytes: int | None = None, ttl=_UNCHANGED) -> None:
+        """
+        Change the memory budget and/or TTL, evicting entries if needed.
+
+        Args:
+            max_bytes (int | None): New memory budget, None keeps it
+            ttl (float | None): New TTL in seconds, None disables expiry.
+                Omit to keep the current TTL.
+        """
+        with self._lock:
+            if max_bytes is not None:
+                self._max_bytes = max_bytes
+            if ttl is not _UNCHANGED:
+                self._ttl = ttl
+            self._evict()
+
+    def _lookup(self, key: CacheKey) -> QuoteFrame | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        frame, stored_at = entry
+        if self._ttl is not None and self._clock() - stored_at > self._ttl:
+            self._remove(key)
+            self._expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return frame
+
+    def _remove(self, key: CacheKey) -> None:
+        frame, _ = self._entries.pop(key)
+        self._nbytes -= frame.nbytes
+
+    def _evict(self) -> None:
+        while self._entries and self._nbytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def get(self, key: CacheKey) -> QuoteFrame | None:
+        with self._lock:
+            frame = self._lookup(key)
+            if frame is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return frame
+
+    def put(self, key: CacheKey, frame: QuoteFrame) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if frame.nbytes > self._max_bytes:
+                return
+            self._entries[key] = (frame, self._clock())
+            self._nbytes += frame.nbytes
+            self._evict()
+
+    def get_or_load(
+        self, key: CacheKey, loader: Callable[[], QuoteFrame]
+    ) -> QuoteFrame:
+        """
+        Return the cached frame for ``key``, loading it on a miss.
+
+        Only one thread runs ``loader`` for a given key at a time; other
+        threads asking for the same key wait and then read the result
+        from the cache.
+        """
+        while True:
+            with self._lock:
+                frame = self._lookup(key)
+                if frame is not None:
+                    self._hits += 1
+                    return frame
+
+                event = self._loading.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._loading[key] = event
+                    self._misses += 1
+                    break
+
+            event.wait()
+
+        try:
+            frame = loader()
+            self.put(key, frame)
+            return frame
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            event.set()
+
+    def invalidate(self, key: CacheKey) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                nbytes=self._nbytes,
+            )
+
+
+_default_cache = QuoteCache()
+
+
+def default_cache() -> QuoteCache:
+    """The process-wide cache shared by every ``Context``."""
+    return _default_cache
@@ -1,30 +1,68 @@
+import heapq
+
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
 
 from openstoxlify.utils.token import fetch_id, fetch_token
+from openstoxlify.utils.time import to_epoch, to_epoch_array
+from openstoxlify.utils.batch import DEFAULT_MAX_CONCURRENCY, fetch_many
 
-from .models.contract import Provider
+from .cache.memory import CacheKey, QuoteCache, default_cache
+from .models.contract import FrameProvider, Provider
+from .models.frame import QuoteBatch, QuoteFrame, QuoteView
+from .models.store import ACTION_CODES, PlotStore, SignalStore
 from .models.enum import ActionType, PlotType
 from .models.series import ActionSeries, FloatSeries
 from .models.model import Period, PlotData, Quote
 
 
+def _action_code(action):
+    """Action code of an ``ActionType`` or its string value; codes pass through."""
+    if isinstance(action, str):
+        action = ActionType(action)
+    return ACTION_CODES[action] if isinstance(action, ActionType) else action
+
+
+def _action_codes(actions) -> np.ndarray:
+    """
+    Convert actions to an int8 array of action codes.
+
+    Accepts ``ActionType`` members, their string values and integer or
+    boolean codes, in a list or an array.
+
+    Raises:
+        ValueError: If an action is unknown or a code is not -1, 0 or 1
+    """
+    actions = np.asarray(actions)
+    if actions.dtype.kind not in "biuf":
+        actions = np.array([_action_code(a) for a in actions.ravel()])
+    if actions.size and actions.dtype.kind not in "biuf":
+        raise ValueError("actions must be ActionType values or action codes")
+    if not np.isin(actions, (-1, 0, 1)).all():
+        raise ValueError("action codes must be -1, 0 or 1")
+    return actions.astype(np.int8)
+
+
 class Context:
     """
     Central context manager for trading strategies.
 
     The Context class manages market data fetching, indicator plotting,
-    and trading signal generation in a unified interface. It provides
-    caching for market data and organizes plots by type and screen index.
+    and trading signal generation in a unified interface. Market data is
+    cached in a process-wide ``QuoteCache`` shared by every Context, and
+    plots are organized by type and screen index.
 
     Attributes:
         _symbol (str): Trading symbol (e.g., "BTC-USD", "AAPL")
         _period (Period): Timeframe for market data
         _provider (Provider): Data provider instance
-        _quotes (List[Quote]): Cached market quotes
-        _quotes_mapped (Dict[str, List[Quote]]): Symbol-to-quotes mapping
-        _plots (Dict[str, List[PlotData]]): Organized plot data by type
-        _signals (List[ActionSeries]): Trading signals timeline
+        _quotes (Sequence[Quote]): Cached market quotes
+        _frame (QuoteFrame): Columnar form of the current quotes
+        _cache (QuoteCache): Quote cache shared across Contexts
+        _plots (PlotStore): Label-indexed plot data organized by type
+        _signals (SignalStore): Columnar trading signals timeline
         _token (str): Authentication token for provider
         _authenticated (bool): Authentication status
 
@@ -37,7 +75,12 @@ class Context:
     """
 
     def __init__(
-        self, agrv: List[str], provider: Provider, symbol: str, period: Period
+        self,
+        agrv: List[str],
+        provider: Provider,
+        symbol: str,
+        period: Period,
+        cache: QuoteCache | None = None,
     ):
         """
         Initialize a new trading context.
@@ -47,6 +90,8 @@ class Context:
             provider (Provider): Data provider instance for fetching market data
             symbol (str): Trading symbol (e.g., "BTC-USD", "AAPL")
             period (Period): Timeframe for candles (DAILY, HOURLY, etc.)
+            cache (QuoteCache | None): Quote cache to use. Defaults to the
+                process-wide cache returned by ``default_cache()``.
 
         Example:
             >>> from openstoxlify.providers.stoxlify.provider import Provider
@@ -57,10 +102,11 @@ class Context:
         self._period = period
         self._provider = provider
 
-        self._quotes: List[Quote] = []
-        self._quotes_mapped: Dict[str, List[Quote]] = {}
-        self._plots: Dict[str, List[PlotData]] = {}
-        self._signals: List[ActionSeries] = []
+        self._quotes: Sequence[Quote] = []
+        self._frame = QuoteFrame.empty()
+        self._cache = cache if cache is not None else default_cache()
+        self._plots = PlotStore()
+        self._signals = SignalStore()
 
         self._authenticated: bool = False
         self._token: str | None = fetch_token(agrv)
@@ -68,16 +114,22 @@ class Context:
 
     def quotes(
         self, start: datetime | None = None, end: datetime | None = None
-    ) -> List[Quote]:
+    ) -> Sequence[Quote]:
         """
         Fetch and cache market data quotes.
 
         Retrieves OHLCV (Open, High, Low, Close, Volume) data from the
-        configured provider. Results are cached per symbol to avoid
-        redundant API calls.
+        configured provider. Results are cached in the shared quote cache
+        keyed by provider source, symbol, period, start and end, so any
+        Context in the process asking for the same data reuses it.
+
+        Args:
+            start (datetime | None): Start of the requested range
+            end (datetime | None): End of the requested range
 
         Returns:
-            List[Quote]: List of market quotes with OHLCV data
+            Sequence[Quote]: List of market quotes with OHLCV data, as a
+                lazy view that only builds ``Quote`` objects on access.
 
         Example:
             >>> quotes = ctx.quotes()
@@ -85,16 +137,95 @@ class Context:
             ...     print(f"{quote.timestamp}: {quote.close}")
 
         Note:
-            Subsequent calls for the same symbol return cached data.
+            Cached entries expire after the cache TTL (60 seconds by
+            default), see ``QuoteCache.configure()``.
         """
-        quotes = self._quotes_mapped.get(self._symbol)
-        if quotes is not None:
-            return quotes
-
-        self._quotes = self._provider.quotes(self._symbol, self._period, start, end)
-        self._quotes_mapped[self._symbol] = self._quotes
+        self._frame = self._load(self._symbol, start, end)
+        self._quotes = self._frame.quotes()
         return self._quotes
 
+    def _load(
+        self, symbol: str, start: datetime | None, end: datetime | None
+    ) -> QuoteFrame:
+        key = CacheKey.of(self._provider.source(), symbol, self._period, start, end)
+        return self._cache.get_or_load(key, lambda: self._fetch(symbol, start, end))
+
+    def _fetch(
+        self, symbol: str, start: datetime | None, end: datetime | None
+    ) -> QuoteFrame:
+        if isinstance(self._provider, FrameProvider):
+            return self._provider.quote_frame(symbol, self._period, start, end)
+        return QuoteFrame.from_quotes(
+            self._provider.quotes(symbol, self._period, start, end)
+        )
+
+    def quotes_many(
+        self,
+        symbols: Iterable[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> QuoteBatch:
+        """
+        Load quotes for a universe of symbols concurrently.
+
+        Symbols are fetched on a bounded thread pool with this Context's
+        provider and period, through the shared quote cache. Contexts
+        created afterwards for any of these symbols are served from the
+        cache without another request.
+
+        Args:
+            symbols (Iterable[str]): Trading symbols to load
+            start (datetime | None): Start of the requested range
+            end (datetime | None): End of the requested range
+            max_concurrency (int): Maximum number of in-flight requests.
+                Defaults to 16.
+
+        Returns:
+            QuoteBatch: Frames per loaded symbol and errors per failed one
+
+        Example:
+            >>> batch = ctx.quotes_many(["AAPL", "MSFT", "NVDA"])
+            >>> for symbol, error in batch.errors.items():
+            ...     print(f"{symbol}: {error}")
+            >>> closes = {s: f.close for s, f in batch.frames.items()}
+        """
+        return fetch_many(
+            lambda symbol: self._load(symbol, start, end), symbols, max_concurrency
+        )
+
+    def quote_frame(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> QuoteFrame:
+        """
+        Fetch market data as a columnar ``QuoteFrame``.
+
+        Shares the cache with ``quotes()``. Providers that produce frames
+        directly are never converted to ``Quote`` objects; for other
+        providers the frame is built once from the quote list.
+
+        Returns:
+            QuoteFrame: Timestamps and OHLCV columns as NumPy arrays
+
+        Example:
+            >>> frame = ctx.quote_frame()
+            >>> sma = frame.close[-20:].mean()
+        """
+        self.quotes(start, end)
+        return self._frame
+
+    def frame(self) -> QuoteFrame:
+        """
+        Columnar form of the quotes loaded so far, without fetching.
+
+        Returns:
+            QuoteFrame: Frame behind ``quotes()``, or one built from the
+                loaded quote list. Empty before the first ``quotes()`` call.
+        """
+        if isinstance(self._quotes, QuoteView):
+            return self._quotes.frame
+        return QuoteFrame.from_quotes(self._quotes)
+
     def plot(
         self, label: str, plot_type: PlotType, data: FloatSeries, screen_index: int = 0
     ):
@@ -124,22 +255,52 @@ class Context:
         Note:
             Call this method multiple times with the same label to build
             a time series. Data points are automatically grouped by label.
+            For whole series prefer ``plot_series()``.
         """
         if plot_type not in PlotType:
             raise ValueError(f"Invalid plot type: {plot_type}")
 
-        key = plot_type.value
-        if key not in self._plots:
-            self._plots[key] = []
+        self._plots.append(plot_type.value, label, data, screen_index)
 
-        for plot_entry in self._plots[key]:
-            if plot_entry.label == label:
-                plot_entry.data.append(data)
-                return
+    def plot_series(
+        self,
+        label: str,
+        plot_type: PlotType,
+        timestamps: Sequence[datetime] | np.ndarray,
+        values: Sequence[float] | np.ndarray,
+        screen_index: int = 0,
+    ):
+        """
+        Add a whole indicator series for visualization in one call.
 
-        self._plots[key].append(
-            PlotData(label=label, data=[data], screen_index=screen_index)
-        )
+        Equivalent to calling ``plot()`` once per point, but the arrays
+        are copied into the plot store in bulk without creating a
+        ``FloatSeries`` object per point.
+
+        Args:
+            label (str): Display name for the indicator (e.g., "SMA 20")
+            plot_type (PlotType): Visualization type (LINE, HISTOGRAM, AREA)
+            timestamps: Epoch seconds (int64 array, e.g.
+                ``QuoteFrame.timestamp``), ``datetime64`` array or a
+                sequence of datetimes
+            values: Indicator values, one per timestamp. NaN values, such
+                as the warm-up of ``openstoxlify.indicators``, are kept
+                as in ``plot()`` and drawn as gaps.
+            screen_index (int, optional): Subplot index. Defaults to 0.
+
+        Raises:
+            ValueError: If plot_type is not a valid PlotType enum or the
+                arrays differ in length
+
+        Example:
+            >>> frame = ctx.quote_frame()
+            >>> ctx.plot_series("Close", PlotType.LINE, frame.timestamp, frame.close)
+            >>> ctx.plot_series("SMA 20", PlotType.LINE, frame.timestamp, sma(frame.close, 20))
+        """
+        if plot_type not in PlotType:
+            raise ValueError(f"Invalid plot type: {plot_type}")
+
+        self._plots.extend(plot_type.value, label, timestamps, values, screen_index)
 
     def signal(self, data: ActionSeries):
         """
@@ -174,6 +335,91 @@ class Context:
 
         self._signals.append(data)
 
+    def signals_from_arrays(
+        self,
+        timestamps: Sequence[datetime] | np.ndarray,
+        actions: Sequence[ActionType] | np.ndarray,
+        amounts: Sequence[float] | np.ndarray | float,
+    ):
+        """
+        Record many trading signals in one call.
+
+        Equivalent to calling ``signal()`` once per element, without
+        creating an ``ActionSeries`` object per signal.
+
+        Args:
+            timestamps: Epoch seconds (int64 array), ``datetime64`` array
+                or a sequence of datetimes
+            actions: ``ActionType`` members, their string values
+                ("Long", "Short", "Hold") or action codes (LONG=1,
+                SHORT=-1, HOLD=0), as a list or an array. Boolean
+                arrays are read as codes, i.e. True is LONG.
+            amounts: Amount per signal, or a single amount for all.
+                HOLD signals always get an amount of 0.
+
+        Raises:
+            ValueError: If the arrays differ in length or contain an
+                unknown action code
+
+        Example:
+            >>> frame = ctx.quote_frame()
+            >>> actions = np.where(fast > slow, 1, -1)
+            >>> ctx.signals_from_arrays(frame.timestamp, actions, 1.0)
+        """
+        ts = to_epoch_array(timestamps)
+        codes = _action_codes(actions)
+        values = np.broadcast_to(np.asarray(amounts, dtype=np.float64), ts.shape)
+
+        if ts.ndim != 1 or codes.shape != ts.shape:
+            raise ValueError("timestamps and actions must be 1-D and equal length")
+
+        self._signals.extend(ts, codes, values)
+
+    def signals_from_masks(
+        self,
+        timestamps: Sequence[datetime] | np.ndarray,
+        long_mask: Sequence[bool] | np.ndarray,
+        short_mask: Sequence[bool] | np.ndarray,
+        amounts: Sequence[float] | np.ndarray | float = 1.0,
+    ):
+        """
+        Record LONG/SHORT signals selected by boolean masks.
+
+        Rows where ``long_mask`` is set become LONG signals and rows where
+        ``short_mask`` is set become SHORT signals; all other rows are
+        skipped.
+
+        Args:
+            timestamps: Epoch seconds (int64 array), ``datetime64`` array
+                or a sequence of datetimes
+            long_mask: Boolean array selecting LONG signals
+            short_mask: Boolean array selecting SHORT signals
+            amounts: Amount per row, or a single amount. Defaults to 1.0.
+
+        Raises:
+            ValueError: If a row is selected by both masks or the arrays
+                differ in length
+
+        Example:
+            >>> ctx.signals_from_masks(
+            ...     frame.timestamp, rsi < 30, rsi > 70, amounts=1.0
+            ... )
+        """
+        ts = to_epoch_array(timestamps)
+        longs = np.asarray(long_mask, dtype=bool)
+        shorts = np.asarray(short_mask, dtype=bool)
+
+        if longs.shape != ts.shape or shorts.shape != ts.shape:
+            raise ValueError("timestamps and masks must be 1-D and equal length")
+        if np.any(longs & shorts):
+            raise ValueError("a signal cannot be both LONG and SHORT")
+
+        selected = longs | shorts
+        codes = np.where(longs, 1, -1).astype(np.int8)[selected]
+        values = np.broadcast_to(np.asarray(amounts, dtype=np.float64), ts.shape)
+
+        self._signals.extend(ts[selected], codes, values[selected])
+
     def authenticate(self):
         """
         Authenticate with the data provider.
@@ -224,14 +470,14 @@ class Context:
         if not self._authenticated or not self._token:
             return
 
-        self._quotes.sort(key=lambda q: q.timestamp)
-        latest = self._quotes[-1 - offset].timestamp
-        hashmap = {s.timestamp: s for s in self._signals}
+        latest = self._latest_timestamp(offset)
 
-        signal = hashmap.get(latest)
-        if signal is None:
+        index = self._signals.find(to_epoch(latest))
+        if index is None:
             return
 
+        signal = self._signals.signal_at(index)
+
         match signal.action:
             case ActionType.HOLD:
                 return
@@ -241,34 +487,42 @@ class Context:
 
         self._provider.execute(self._id, self._symbol, signal, signal.amount)
 
+    def _latest_timestamp(self, offset: int) -> datetime:
+        if isinstance(self._quotes, QuoteView):
+            return self._quotes.frame.datetime_at(-1 - offset)
+
+        return heapq.nlargest(offset + 1, (q.timestamp for q in self._quotes))[-1]
+
     def plots(self) -> Dict[str, List[PlotData]]:
         """
         Get all plot data organized by type.
 
         Returns:
             Dict[str, List[PlotData]]: Plot data grouped by type
-                (e.g., {"line": [...], "histogram": [...]})
+                (e.g., {"line": [...], "histogram": [...]}). Each
+                ``PlotData.data`` is a live view over the stored arrays.
 
         Example:
             >>> plots = ctx.plots()
             >>> for plot_type, plot_list in plots.items():
             ...     print(f"{plot_type}: {len(plot_list)} plots")
         """
-        return self._plots
+        return self._plots.plots()
 
-    def signals(self) -> List[ActionSeries]:
+    def signals(self) -> Sequence[ActionSeries]:
         """
         Get all recorded trading signals.
 
         Returns:
-            List[ActionSeries]: Chronological list of trading signals
+            Sequence[ActionSeries]: Trading signals in the order they were
+                recorded, as a view over the columnar signal store
 
         Example:
             >>> signals = ctx.signals()
             >>> for signal in signals:
             ...     print(f"{signal.timestamp}: {signal.action} {signal.amount}")
         """
-        return self._signals
+        return self._signals.signals()
 
     def symbol(self) -> str:
         """
@@ -1,14 +1,28 @@
+import inspect
+import os
 import random
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+import numpy as np
 
-from typing import Any, Dict, List, Tuple
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from typing import Any, BinaryIO, Callable, Dict, List, Sequence, Tuple
 from datetime import datetime
 
 from .context import Context
 from .utils.color import color_palette
+from .utils.lod import lttb, minmax, ohlc_buckets
 from .utils.output import output
+from .utils.time import to_epoch_array
 from .models.enum import PlotType, ActionType
+from .models.frame import QuoteFrame
+from .models.series import FloatSeries
+from .models.store import ACTION_CODES, SeriesView, SignalView
+
+DEFAULT_MAX_ANNOTATIONS = 200
 
 
 class Canvas:
@@ -55,6 +69,7 @@ class Canvas:
         self._strategy_data = ctx.signals()
 
         self._color_map: Dict[str, str] = {}
+        self._candle_cache: Tuple[Any, QuoteFrame, np.ndarray] | None = None
 
     def _get_color(self, label: str) -> str:
         """
@@ -177,13 +192,17 @@ class Canvas:
 
         return fig, axes
 
-    def _plot_histograms(self, axes: Any, histogram_alpha: float) -> None:
+    def _plot_histograms(
+        self, axes: Any, histogram_alpha: float, points: int | None = None
+    ) -> None:
         """
         Render histogram plots on specified axes.
 
         Args:
             axes (Dict[int, plt.Axes]): Screen index to axes mapping
             histogram_alpha (float): Transparency level (0-1)
+            points (int | None): Point budget per series in LOD mode,
+                reduced with min/max bucketing
 
         Note:
             Automatically calculates bar width based on data density.
@@ -199,11 +218,12 @@ class Canvas:
 
             ax = axes[screen_idx]
 
-            timestamps = [self.convert_timestamp(item.timestamp) for item in plot.data]
-            values = [item.value for item in plot.data]
+            timestamps, values = self._series_points(
+                plot.data, points, lambda ts, v: minmax(v, points // 2)
+            )
 
             bar_width = (
-                (max(timestamps) - min(timestamps)) / len(timestamps) * 0.8
+                (timestamps.max() - timestamps.min()) / len(timestamps) * 0.8
                 if len(timestamps) > 1
                 else 0.5
             )
@@ -220,13 +240,17 @@ class Canvas:
                 alpha=histogram_alpha,
             )
 
-    def _plot_lines(self, axes: Any, line_width: float) -> None:
+    def _plot_lines(
+        self, axes: Any, line_width: float, points: int | None = None
+    ) -> None:
         """
         Render line plots on specified axes.
 
         Args:
             axes (Dict[int, plt.Axes]): Screen index to axes mapping
             line_width (float): Line thickness
+            points (int | None): Point budget per series in LOD mode,
+                reduced with LTTB
 
         Note:
             Used for indicators like moving averages, RSI, etc.
@@ -237,8 +261,9 @@ class Canvas:
                 continue
 
             ax = axes[screen_idx]
-            timestamps = [self.convert_timestamp(item.timestamp) for item in plot.data]
-            values = [item.value for item in plot.data]
+            timestamps, values = self._series_points(
+                plot.data, points, lambda ts, v: lttb(ts, v, points)
+            )
 
             ax.plot(
                 timestamps,
@@ -248,13 +273,17 @@ class Canvas:
                 lw=line_width,
             )
 
-    def _plot_areas(self, axes: Any, area_alpha: float) -> None:
+    def _plot_areas(
+        self, axes: Any, area_alpha: float, points: int | None = None
+    ) -> None:
         """
         Render area plots on specified axes.
 
         Args:
             axes (Dict[int, plt.Axes]): Screen index to axes mapping
             area_alpha (float): Transparency level (0-1)
+            points (int | None): Point budget per series in LOD mode,
+                reduced with min/max bucketing
 
         Note:
             Used for filled regions like Bollinger Bands, clouds, etc.
@@ -265,8 +294,9 @@ class Canvas:
                 continue
 
             ax = axes[screen_idx]
-            timestamps = [self.convert_timestamp(item.timestamp) for item in plot.data]
-            values = [item.value for item in plot.data]
+            timestamps, values = self._series_points(
+                plot.data, points, lambda ts, v: minmax(v, points // 2)
+            )
 
             ax.fill_between(
                 timestamps,
@@ -276,119 +306,302 @@ class Canvas:
                 alpha=area_alpha,
             )
 
-    def _build_candle_lookup_table(self) -> Dict[str, Tuple[float, float]]:
+    def _series_points(
+        self,
+        data: Sequence[FloatSeries],
+        points: int | None,
+        reduce: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Build lookup table mapping timestamps to matplotlib coordinates and prices.
+        Plot coordinates of a series, downsampled in LOD mode.
+
+        Columnar series are converted straight from their epoch arrays;
+        other sequences are converted to epoch seconds first. Either way
+        the date numbers come from one vectorized ``date2num`` call.
+
+        Args:
+            data (Sequence[FloatSeries]): Series points
+            points (int | None): Point budget, ``None`` keeps every point
+            reduce (Callable): Maps epoch timestamps and values to the
+                indices of the points to keep
 
         Returns:
-            Dict[str, Tuple[float, float]]: Map of ISO timestamp to (x_coord, price)
+            Tuple[np.ndarray, np.ndarray]: Matplotlib date numbers and values
+        """
+        if isinstance(data, SeriesView):
+            ts, values = data.timestamps, data.values
+        else:
+            ts = self._epochs([item.timestamp for item in data])
+            values = np.fromiter((item.value for item in data), np.float64, len(data))
+
+        if points is not None and len(ts) > points:
+            keep = reduce(ts, values)
+            ts, values = ts[keep], values[keep]
+        return self._date_numbers(ts), values
+
+    def _epochs(self, timestamps: Sequence[Any]) -> np.ndarray:
+        """Epoch seconds of datetimes or ISO format strings, int64."""
+        return to_epoch_array(
+            [datetime.fromisoformat(t) if isinstance(t, str) else t for t in timestamps]
+        )
 
-        Note:
-            Used for positioning trading signal markers on the chart.
+    def _date_numbers(self, epochs: np.ndarray) -> np.ndarray:
+        """Matplotlib date numbers of an epoch-seconds array."""
+        return mdates.date2num(epochs.astype("datetime64[s]"))
+
+    def _candles(self) -> Tuple[QuoteFrame, np.ndarray]:
         """
-        candle_lut = {}
+        Columnar market data and its x coordinates.
 
-        for item in self._market_data:
-            timestamp = item.timestamp
-            ts_str = timestamp if isinstance(timestamp, str) else timestamp.isoformat()
-            ts_num = self.convert_timestamp(timestamp)
-            price = item.close
+        Converted once and reused by the candle renderer and the signal
+        lookup until the market data changes.
+        """
+        cached = self._candle_cache
+        if cached is None or cached[0] is not self._market_data:
+            frame = QuoteFrame.from_quotes(self._market_data)
+            cached = (self._market_data, frame, self._date_numbers(frame.timestamp))
+            self._candle_cache = cached
+        return cached[1], cached[2]
+
+    def _build_candle_lookup_table(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Build lookup table mapping timestamps to matplotlib coordinates and prices.
 
-            candle_lut[ts_str] = (ts_num, price)
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Sorted candle epoch
+                timestamps with their x coordinates and close prices
 
-        return candle_lut
+        Note:
+            Used for positioning trading signal markers on the chart.
+            Signals are matched with a binary search on the timestamps.
+        """
+        frame, x = self._candles()
+        return frame.timestamp, x, frame.close
+
+    def _quote_frame(self) -> QuoteFrame:
+        """Columnar view of the market data (zero-copy for Context quotes)."""
+        return self._candles()[0]
+
+    def _signal_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Epoch timestamps, action codes and amounts of the signals."""
+        signals = self._strategy_data
+        if isinstance(signals, SignalView):
+            return signals.timestamps, signals.actions, signals.amounts
+        return (
+            self._epochs([s.timestamp for s in signals]),
+            np.array([ACTION_CODES[s.action] for s in signals], dtype=np.int8),
+            np.array([s.amount for s in signals], dtype=np.float64),
+        )
 
     def _render_candlesticks(
-        self, ax: Any, candle_linewidth: float, candle_body_width: float
+        self,
+        ax: Any,
+        candle_linewidth: float,
+        candle_body_width: float,
+        buckets: int | None = None,
     ) -> None:
         """
         Render OHLC candlestick chart.
 
+        Wick and body segments are built as arrays and added as at most
+        four ``LineCollection`` artists (up/down wicks and bodies), no
+        matter how many candles there are.
+
         Args:
             ax (plt.Axes): Matplotlib axes to draw on
             candle_linewidth (float): Wick line width
             candle_body_width (float): Body line width
+            buckets (int | None): In LOD mode, the maximum number of
+                candles; denser data is re-aggregated into OHLC buckets
 
         Note:
             Green candles for up days (close > open)
             Red candles for down days (close < open)
         """
-        for item in self._market_data:
-            ts_num = self.convert_timestamp(item.timestamp)
+        frame, x = self._candles()
+        if not len(frame):
+            return
+        if buckets is not None and len(frame) > buckets:
+            frame = ohlc_buckets(frame, buckets)
+            x = self._date_numbers(frame.timestamp)
 
-            color = "green" if item.close > item.open else "red"
+        up = frame.close > frame.open
 
-            ax.vlines(ts_num, item.low, item.high, color=color, lw=candle_linewidth)
-            ax.vlines(ts_num, item.open, item.close, color=color, lw=candle_body_width)
+        for mask, color in ((up, "green"), (~up, "red")):
+            if not mask.any():
+                continue
+            for lower, upper, width in (
+                (frame.low, frame.high, candle_linewidth),
+                (frame.open, frame.close, candle_body_width),
+            ):
+                segments = np.empty((int(mask.sum()), 2, 2))
+                segments[:, :, 0] = x[mask, None]
+                segments[:, 0, 1] = lower[mask]
+                segments[:, 1, 1] = upper[mask]
+                ax.add_collection(
+                    LineCollection(segments, colors=color, linewidths=width)
+                )
+
+        ax.autoscale_view()
 
     def _render_trading_signals(
         self,
         ax: Any,
-        candle_lut: Dict[str, Tuple[float, float]],
+        candle_lut: Tuple[np.ndarray, np.ndarray, np.ndarray],
         offset_multiplier: float,
         marker_size: int,
         annotation_fontsize: int,
+        max_annotations: int | None = DEFAULT_MAX_ANNOTATIONS,
+        resolution: Tuple[float, float] | None = None,
+        dpi: float | None = None,
     ) -> None:
         """
         Render trading signal markers and annotations.
 
+        Markers are drawn with one ``scatter`` call per direction. Text
+        annotations are only added where they do not overlap an already
+        placed label at the chart's pixel resolution, up to
+        ``max_annotations`` in total.
+
         Args:
             ax (plt.Axes): Matplotlib axes to draw on
-            candle_lut (Dict): Timestamp to coordinate mapping
+            candle_lut (Tuple): Candle timestamps, x coordinates and closes
+                from ``_build_candle_lookup_table()``
             offset_multiplier (float): Marker offset as fraction of price
             marker_size (int): Size of marker triangles
             annotation_fontsize (int): Font size for annotations
+            max_annotations (int | None): Upper bound on the number of
+                annotations, ``None`` for no bound and ``0`` to disable them
+            resolution (Tuple[float, float] | None): Axes size in pixels,
+                defaults to the size for the default figure
+            dpi (float | None): Output resolution the axes size was
+                computed for, ``None`` for the figure default
 
         Note:
             LONG signals: Blue upward triangle below price
             SHORT signals: Purple downward triangle above price
         """
-        for trade in self._strategy_data:
-            ts_key = (
-                trade.timestamp
-                if isinstance(trade.timestamp, str)
-                else trade.timestamp.isoformat()
-            )
+        styles = {
+            ActionType.LONG: ("^", "blue", -1.0, -15),
+            ActionType.SHORT: ("v", "purple", 1.0, 10),
+        }
+        candle_ts, candle_x, candle_close = candle_lut
+        ts, codes, amounts = self._signal_columns()
+        if not len(ts) or not len(candle_ts):
+            return
 
-            if ts_key not in candle_lut:
-                continue
+        pos = np.minimum(np.searchsorted(candle_ts, ts), len(candle_ts) - 1)
+        found = candle_ts[pos] == ts
 
-            ts_num, price = candle_lut[ts_key]
-            offset = price * offset_multiplier
-            direction = trade.action
-            amount = trade.amount
+        points: Dict[ActionType, Tuple[np.ndarray, np.ndarray, List[str]]] = {}
+        for direction, (marker, color, sign, _) in styles.items():
+            selected = found & (codes == ACTION_CODES[direction])
+            if not selected.any():
+                continue
+            xs = candle_x[pos[selected]]
+            price = candle_close[pos[selected]]
+            ys = price + sign * price * offset_multiplier
+            texts = [f"{direction.name} {a}" for a in amounts[selected].tolist()]
+            points[direction] = (xs, ys, texts)
+            ax.scatter(xs, ys, marker=marker, color=color, s=marker_size**2)
+
+        if max_annotations == 0 or not points:
+            return
 
-            if direction == ActionType.LONG:
-                y = price - offset
-                ax.plot(ts_num, y, marker="^", color="blue", markersize=marker_size)
+        dpi = dpi or plt.rcParams["figure.dpi"]
+        width, height = resolution or self._axes_resolution((12, 6), 1, dpi)
+        x = np.concatenate([candle_x] + [p[0] for p in points.values()])
+        y = np.concatenate([candle_close] + [p[1] for p in points.values()])
+        x_scale = width / max(float(np.ptp(x)), 1e-12)
+        y_scale = height / max(float(np.ptp(y)), 1e-12)
+
+        for direction, (xs, ys, texts) in points.items():
+            _, color, _, dy = styles[direction]
+            px = (xs - x.min()) * x_scale
+            py = (ys - y.min()) * y_scale
+            for i in self._visible_annotations(
+                px, py, texts, dy, annotation_fontsize, max_annotations, dpi
+            ):
                 ax.annotate(
-                    f"LONG {amount}",
-                    xy=(ts_num, y),
-                    xytext=(0, -15),
+                    texts[i],
+                    xy=(xs[i], ys[i]),
+                    xytext=(0, dy),
                     textcoords="offset points",
                     ha="center",
                     fontsize=annotation_fontsize,
-                    color="blue",
+                    color=color,
                 )
 
-            elif direction == ActionType.SHORT:
-                y = price + offset
-                ax.plot(
-                    ts_num,
-                    y,
-                    marker="v",
-                    color="purple",
-                    markersize=marker_size,
-                )
-                ax.annotate(
-                    f"SHORT {amount}",
-                    xy=(ts_num, y),
-                    xytext=(0, 10),
-                    textcoords="offset points",
-                    ha="center",
-                    fontsize=annotation_fontsize,
-                    color="purple",
-                )
+    def _axes_resolution(
+        self, figsize: Tuple[float, float], rows: int, dpi: float | None = None
+    ) -> Tuple[float, float]:
+        """
+        Estimate the pixel size of one panel of a stacked figure.
+
+        Uses the given (or configured figure) DPI and the subplot margins,
+        so it does not require a rendered figure.
+        """
+        params = plt.rcParams
+        dpi = dpi or params["figure.dpi"]
+        width = params["figure.subplot.right"] - params["figure.subplot.left"]
+        height = params["figure.subplot.top"] - params["figure.subplot.bottom"]
+        return figsize[0] * dpi * width, figsize[1] * dpi * height / max(rows, 1)
+
+    def _visible_annotations(
+        self,
+        px: np.ndarray,
+        py: np.ndarray,
+        texts: List[str],
+        offset: float,
+        fontsize: float,
+        limit: int | None,
+        dpi: float,
+    ) -> List[int]:
+        """
+        Select which signal labels to draw.
+
+        Label boxes are estimated in pixels from the font size and text
+        length. Labels are placed left to right, skipping any that would
+        overlap a label already placed. At most ``limit`` labels are
+        kept, spread evenly over the placed ones.
+
+        Args:
+            px, py (np.ndarray): Anchor points in pixels
+            texts (List[str]): Label texts
+            offset (float): Vertical text offset in points
+            fontsize (float): Label font size in points
+            limit (int | None): Maximum number of labels
+            dpi (float): Resolution the anchor points were computed for
+
+        Returns:
+            List[int]: Indices of the labels to draw, in x order
+        """
+        px_per_pt = dpi / 72.0
+        py = py + offset * px_per_pt
+        height = fontsize * px_per_pt
+        half_widths = (
+            np.fromiter(map(len, texts), np.float64, len(texts))
+            * 0.3
+            * fontsize
+            * px_per_pt
+        )
+
+        # Labels are placed in x order, so a new label can only collide
+        # with the rightmost label kept in its own or a neighbouring row.
+        right_edges: Dict[int, float] = {}
+        placed: List[int] = []
+        for i in np.argsort(px, kind="stable").tolist():
+            row = int(py[i] // height)
+            left = px[i] - half_widths[i]
+            if any(right_edges.get(r, -np.inf) > left for r in (row - 1, row, row + 1)):
+                continue
+            right_edges[row] = px[i] + half_widths[i]
+            placed.append(i)
+
+        if limit is not None and len(placed) > limit:
+            keep = np.unique(np.linspace(0, len(placed) - 1, limit).round().astype(int))
+            placed = [placed[k] for k in keep]
+        return placed
 
     def _configure_main_chart(
         self,
@@ -443,6 +656,68 @@ class Canvas:
                 if show_legend and ax.get_legend_handles_labels()[0]:
                     ax.legend()
 
+    def _compose(
+        self,
+        axes: Dict[int, Any],
+        figsize: Tuple[float, float],
+        dpi: float | None,
+        show_legend: bool,
+        offset_multiplier: float,
+        rotation: int,
+        ha: str,
+        title: str,
+        xlabel: str,
+        ylabel: str,
+        candle_linewidth: float,
+        candle_body_width: float,
+        marker_size: int,
+        annotation_fontsize: int,
+        max_annotations: int | None,
+        histogram_alpha: float,
+        area_alpha: float,
+        line_width: float,
+        lod: bool,
+    ) -> None:
+        """
+        Draw every chart element onto prepared axes.
+
+        Shared by ``draw()`` and ``render()``; see ``draw()`` for the
+        meaning of the options. ``dpi`` is the output resolution used to
+        size the LOD point budget, ``None`` for the figure default.
+        """
+        resolution = self._axes_resolution(figsize, len(axes), dpi)
+        points = int(resolution[0]) if lod else None
+
+        self._plot_histograms(axes, histogram_alpha, points)
+        self._plot_lines(axes, line_width, points)
+        self._plot_areas(axes, area_alpha, points)
+
+        if 0 in axes:
+            ax_main = axes[0]
+
+            candle_lut = self._build_candle_lookup_table()
+
+            self._render_candlesticks(
+                ax_main, candle_linewidth, candle_body_width, points
+            )
+
+            self._render_trading_signals(
+                ax_main,
+                candle_lut,
+                offset_multiplier,
+                marker_size,
+                annotation_fontsize,
+                max_annotations,
+                resolution,
+                dpi,
+            )
+
+            self._configure_main_chart(
+                ax_main, show_legend, title, xlabel, ylabel, rotation, ha
+            )
+
+        self._configure_subplots(axes, show_legend)
+
     def draw(
         self,
         show_legend: bool = True,
@@ -457,9 +732,12 @@ class Canvas:
         candle_body_width: float = 4,
         marker_size: int = 8,
         annotation_fontsize: int = 9,
+        max_annotations: int | None = DEFAULT_MAX_ANNOTATIONS,
         histogram_alpha: float = 0.6,
         area_alpha: float = 0.3,
         line_width: float = 2,
+        lod: bool = False,
+        output_format: str = "json",
     ):
         """
         Render the complete financial chart.
@@ -483,10 +761,22 @@ class Canvas:
             candle_body_width (float): Width of candlestick body lines. Default 4.
             marker_size (int): Size of trade signal markers. Default 8.
             annotation_fontsize (int): Font size for trade annotations. Default 9.
+            max_annotations (int | None): Maximum number of trade annotations.
+                Overlapping and off-screen labels are skipped first.
+                None for no limit, 0 to disable. Default 200.
             histogram_alpha (float): Transparency for histogram bars (0-1).
                 Default 0.6.
             area_alpha (float): Transparency for area plots (0-1). Default 0.3.
             line_width (float): Width of line plots. Default 2.
+            lod (bool): Level-of-detail mode. When the data has more points
+                than the panel has pixel columns, candles are re-aggregated
+                into one OHLC bucket per column, lines are reduced with
+                LTTB and histograms/areas with min/max bucketing.
+                Default False.
+            output_format (str): Format of the document written to stdout
+                when the context is authenticated: "json", "json-v2"
+                (columnar JSON, see ``ColumnarJsonWriter``) or "npz" (typed
+                NumPy columns, see ``NpzWriter``). Default "json".
 
         Example:
             >>> # Basic usage
@@ -516,33 +806,90 @@ class Canvas:
 
         fig, axes = self._create_figure_and_axes(screens, figsize)
 
-        self._plot_histograms(axes, histogram_alpha)
-        self._plot_lines(axes, line_width)
-        self._plot_areas(axes, area_alpha)
-
-        if 0 in axes:
-            ax_main = axes[0]
+        self._compose(
+            axes,
+            figsize,
+            None,
+            show_legend,
+            offset_multiplier,
+            rotation,
+            ha,
+            title,
+            xlabel,
+            ylabel,
+            candle_linewidth,
+            candle_body_width,
+            marker_size,
+            annotation_fontsize,
+            max_annotations,
+            histogram_alpha,
+            area_alpha,
+            line_width,
+            lod,
+        )
 
-            candle_lut = self._build_candle_lookup_table()
+        if self._ctx.authenticated():
+            output(self._ctx, format=output_format)
 
-            self._render_candlesticks(ax_main, candle_linewidth, candle_body_width)
+        plt.tight_layout()
+        plt.show()
 
-            self._render_trading_signals(
-                ax_main,
-                candle_lut,
-                offset_multiplier,
-                marker_size,
-                annotation_fontsize,
-            )
+    def render(
+        self,
+        path: str | os.PathLike | BinaryIO,
+        format: str | None = None,
+        dpi: float | None = None,
+        **options: Any,
+    ) -> None:
+        """
+        Render the chart to a file without a display.
 
-            self._configure_main_chart(
-                ax_main, show_legend, title, xlabel, ylabel, rotation, ha
-            )
+        The figure is built with matplotlib's object-oriented API on a
+        non-interactive canvas, so it is never registered with pyplot,
+        does not need a GUI backend and is released as soon as it has
+        been saved. Unlike ``draw()``, the output JSON is not printed.
 
-        self._configure_subplots(axes, show_legend)
+        Args:
+            path (str | os.PathLike | BinaryIO): Destination file or
+                binary file object
+            format (str | None): Image format ("png", "svg", "pdf", ...).
+                Defaults to the file extension, or PNG.
+            dpi (float | None): Resolution in dots per inch. Defaults to
+                matplotlib's ``savefig.dpi`` setting.
+            **options: Any keyword argument accepted by ``draw()`` except
+                ``output_format``. Use ``output()`` to write the document.
+
+        Raises:
+            TypeError: If an option is not a ``draw()`` argument, or is
+                ``output_format``
 
-        if self._ctx.authenticated():
-            output(self._ctx)
+        Example:
+            >>> Canvas(ctx).render("charts/BTC-USD.png", dpi=150, lod=True)
+        """
+        params = {
+            name: param
+            for name, param in inspect.signature(Canvas.draw).parameters.items()
+            if name not in ("self", "output_format")
+        }
+        unknown = set(options) - set(params)
+        if unknown:
+            raise TypeError(f"unexpected draw options: {', '.join(sorted(unknown))}")
+        kwargs = {
+            name: options.get(name, param.default) for name, param in params.items()
+        }
 
-        plt.tight_layout()
-        plt.show()
+        screens = self._unique_screens()
+        fig = Figure(figsize=kwargs["figsize"])
+        FigureCanvasAgg(fig)
+        try:
+            grid = fig.subplots(len(screens), 1, sharex=True, squeeze=False)
+            axes = dict(zip(screens, grid.flatten()))
+            self._compose(
+                axes,
+                dpi=None if dpi in (None, "figure") else dpi,
+                **kwargs,
+            )
+            fig.tight_layout()
+            fig.savefig(path, format=format, dpi=dpi)
+        finally:
+            fig.clear()
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from .window import as_series, check_period, rolling_max, rolling_mean, rolling_min
+from .window import smoothed
+
+
+@dataclass(frozen=True)
+class Stochastic:
+    """
+    Stochastic oscillator lines.
+
+    Attributes:
+        k (np.ndarray): %K, close relative to the high/low range (0-100)
+        d (np.ndarray): %D, simple average of %K
+    """
+
+    k: np.ndarray
+    d: np.ndarray
+
+
+def rsi(values: Sequence[float] | np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Relative Strength Index with Wilder smoothing.
+
+    Args:
+        values: Input series, e.g. ``QuoteFrame.close``
+        period (int): Smoothing period. Defaults to 14.
+
+    Returns:
+        np.ndarray: RSI values (0-100) aligned with ``values``, NaN for
+            the first ``period`` rows
+
+    Example:
+        >>> oversold = rsi(frame.close) < 30
+    """
+    check_period(period)
+    x = as_series(values)
+    out = np.full(len(x), np.nan)
+    if len(x) < 2:
+        return out
+
+    change = np.diff(x)
+    gain = smoothed(np.maximum(change, 0.0), 1.0 / period, period)
+    loss = smoothed(np.maximum(-change, 0.0), 1.0 / period, period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = 100.0 - 100.0 / (1.0 + gain / loss)
+    # Flat markets have no losses: 100 when rising, 50 when unchanged.
+    value = np.where(loss == 0.0, np.where(gain == 0.0, 50.0, 100.0), value)
+    out[1:] = np.where(np.isnan(gain), np.nan, value)
+    return out
+
+
+def stochastic(
+    high: Sequence[float] | np.ndarray,
+    low: Sequence[float] | np.ndarray,
+    close: Sequence[float] | np.ndarray,
+    period: int = 14,
+    smooth: int = 3,
+) -> Stochastic:
+    """
+    Stochastic oscillator.
+
+    Args:
+        high, low, close: Price columns, e.g. from ``QuoteFrame``
+        period (int): Look-back window for the high/low range.
+            Defaults to 14.
+        smooth (int): Period of the %D average. Defaults to 3.
+
+    Returns:
+        Stochastic: %K and %D aligned with the input, NaN during warm-up.
+            %K is 50 when the range is flat.
+
+    Example:
+        >>> stoch = stochastic(frame.high, frame.low, frame.close)
+        >>> overbought = stoch.k > 80
+    """
+    c = as_series(close)
+    if not (len(as_series(high)) == len(as_series(low)) == len(c)):
+        raise ValueError("high, low and close must be equal length")
+
+    highest = rolling_max(high, period)
+    lowest = rolling_min(low, period)
+    spread = highest - lowest
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.where(spread == 0.0, 50.0, 100.0 * (c - lowest) / spread)
+    k = np.where(np.isnan(spread), np.nan, k)
+    return Stochastic(k=k, d=rolling_mean(k, smooth))
@@ -0,0 +1,419 @@
+import json
+
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Type
+
+import numpy as np
+
+from ..utils.time import to_epoch
+from .window import check_period
+
+NAN = float("nan")
+
+
+class OnlineIndicator(ABC):
+    """
+    Base class for indicators that are updated one bar at a time.
+
+    Each ``update()`` costs O(1) (amortized for rolling extremes), so the
+    latency from candle close to signal does not depend on the length of
+    the history. Values match the vectorized functions in
+    ``openstoxlify.indicators`` fed with the same series, including NaN
+    during warm-up.
+
+    Passing the candle timestamp to ``update()`` makes replays harmless:
+    bars at or before the last processed timestamp are ignored, so
+    re-fetching an overlapping window after a restart does not count a
+    candle twice. The indicator no longer knows its value at those bars,
+    so ``update()`` returns NaN for them and ``skipped`` is set.
+
+    ``state()`` returns plain JSON-compatible data and ``from_state()``
+    restores an equal indicator, see ``dumps()``/``loads()``.
+    """
+
+    def __init__(self):
+        self._timestamp: int | None = None
+        self._skipped = False
+
+    @property
+    def timestamp(self) -> int | None:
+        """Epoch seconds of the last processed bar, if timestamps are used."""
+        return self._timestamp
+
+    @property
+    def skipped(self) -> bool:
+        """Whether the last ``update()`` was ignored as an already seen bar."""
+        return self._skipped
+
+    @property
+    @abstractmethod
+    def value(self) -> Any: ...
+
+    @property
+    @abstractmethod
+    def ready(self) -> bool:
+        """Whether the warm-up is over."""
+
+    def _missing(self) -> Any:
+        """The value reported for bars without one."""
+        return NAN
+
+    @abstractmethod
+    def _update(self, value: float) -> None: ...
+
+    def update(self, value: float, timestamp: datetime | int | None = None) -> Any:
+        """
+        Feed the next bar.
+
+        Args:
+            value (float): Input value of the bar, e.g. its close
+            timestamp (datetime | int | None): Bar time as a datetime or
+                epoch seconds. Bars not newer than the last one are skipped.
+
+        Returns:
+            The indicator value after this bar, NaN during warm-up and for
+            skipped bars
+        """
+        self._skipped = False
+        if timestamp is not None:
+            epoch = (
+                to_epoch(timestamp)
+                if isinstance(timestamp, datetime)
+                else int(timestamp)
+            )
+            if self._timestamp is not None and epoch <= self._timestamp:
+                self._skipped = True
+                return self._missing()
+            self._timestamp = epoch
+
+        self._update(float(value))
+        return self.value
+
+    def update_many(
+        self,
+        values: Iterable[float] | np.ndarray,
+        timestamps: Iterable[int] | np.ndarray | None = None,
+    ) -> List[Any]:
+        """Feed several bars in order and return the value after each one."""
+        if timestamps is None:
+            return [
+                self.update(v) for v in np.asarray(values, dtype=np.float64).tolist()
+            ]
+        return [
+            self.update(v, ts)
+            for v, ts in zip(
+                np.asarray(values, dtype=np.float64).tolist(),
+                np.asarray(timestamps, dtype=np.int64).tolist(),
+            )
+        ]
+
+    @abstractmethod
+    def _state(self) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    def _restore(self, state: Mapping[str, Any]) -> None: ...
+
+    @abstractmethod
+    def _params(self) -> Dict[str, Any]: ...
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-compatible snapshot of the indicator."""
+        return {
+            "type": type(self).__name__,
+            "params": self._params(),
+            "timestamp": self._timestamp,
+            "state": self._state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, Any]) -> "OnlineIndicator":
+        """
+        Rebuild an indicator from ``state()``.
+
+        Raises:
+            ValueError: If the state belongs to an unknown indicator type
+        """
+        kind = _REGISTRY.get(state.get("type", ""))
+        if kind is None or not issubclass(kind, cls):
+            raise ValueError(f"unknown indicator state: {state.get('type')!r}")
+
+        indicator = kind(**state["params"])
+        indicator._timestamp = state["timestamp"]
+        indicator._restore(state["state"])
+        return indicator
+
+
+class OnlineSMA(OnlineIndicator):
+    """Simple moving average over the last ``period`` bars."""
+
+    def __init__(self, period: int):
+        super().__init__()
+        check_period(period)
+        self._period = period
+        self._window: deque = deque(maxlen=period)
+        self._sum = 0.0
+        self._updates = 0
+
+    @property
+    def value(self) -> float:
+        return self._sum / self._period if self.ready else NAN
+
+    @property
+    def ready(self) -> bool:
+        return len(self._window) == self._period
+
+    def _update(self, value: float) -> None:
+        if self.ready:
+            self._sum -= self._window[0]
+        self._window.append(value)
+        self._sum += value
+
+        # Re-sum once per window so rounding errors cannot accumulate.
+        self._updates += 1
+        if self._updates % self._period == 0:
+            self._sum = sum(self._window)
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self._period}
+
+    def _state(self) -> Dict[str, Any]:
+        return {"window": list(self._window)}
+
+    def _restore(self, state: Mapping[str, Any]) -> None:
+        self._window.extend(state["window"])
+        self._sum = sum(self._window)
+
+
+class OnlineEMA(OnlineIndicator):
+    """
+    Exponential moving average seeded with the average of the first
+    ``period`` bars.
+
+    ``alpha`` defaults to ``2 / (period + 1)``; pass ``1 / period`` for
+    Wilder smoothing.
+    """
+
+    def __init__(self, period: int, alpha: float | None = None):
+        super().__init__()
+        check_period(period)
+        self._period = period
+        self._alpha = 2.0 / (period + 1) if alpha is None else alpha
+        if not 0.0 < self._alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self._count = 0
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        return self._value if self.ready else NAN
+
+    @property
+    def ready(self) -> bool:
+        return self._count >= self._period
+
+    def _update(self, value: float) -> None:
+        if self._count < self._period:
+            self._count += 1
+            self._value += (value - self._value) / self._count
+        else:
+            self._value += self._alpha * (value - self._value)
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self._period, "alpha": self._alpha}
+
+    def _state(self) -> Dict[str, Any]:
+        return {"count": self._count, "value": self._value}
+
+    def _restore(self, state: Mapping[str, Any]) -> None:
+        self._count = state["count"]
+        self._value = state["value"]
+
+
+class OnlineRSI(OnlineIndicator):
+    """Relative Strength Index with Wilder smoothing, NaN for ``period`` bars."""
+
+    def __init__(self, period: int = 14):
+        super().__init__()
+        check_period(period)
+        self._period = period
+        self._gain = OnlineEMA(period, 1.0 / period)
+        self._loss = OnlineEMA(period, 1.0 / period)
+        self._previous: float | None = None
+
+    @property
+    def value(self) -> float:
+        if not self.ready:
+            return NAN
+        gain, loss = self._gain.value, self._loss.value
+        if loss == 0.0:
+            return 50.0 if gain == 0.0 else 100.0
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+    @property
+    def ready(self) -> bool:
+        return self._loss.ready
+
+    def _update(self, value: float) -> None:
+        if self._previous is not None:
+            change = value - self._previous
+            self._gain.update(max(change, 0.0))
+            self._loss.update(max(-change, 0.0))
+        self._previous = value
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self._period}
+
+    def _state(self) -> Dict[str, Any]:
+        return {
+            "previous": self._previous,
+            "gain": self._gain._state(),
+            "loss": self._loss._state(),
+        }
+
+    def _restore(self, state: Mapping[str, Any]) -> None:
+        self._previous = state["previous"]
+        self._gain._restore(state["gain"])
+        self._loss._restore(state["loss"])
+
+
+class OnlineMACD(OnlineIndicator):
+    """
+    MACD line, signal line and histogram.
+
+    ``update()`` and ``value`` return a ``(macd, signal, histogram)``
+    tuple.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        super().__init__()
+        if fast >= slow:
+            raise ValueError("fast period must be shorter than slow period")
+        self._fast = OnlineEMA(fast)
+        self._slow = OnlineEMA(slow)
+        self._signal = OnlineEMA(signal)
+
+    @property
+    def value(self) -> Tuple[float, float, float]:
+        line = self._fast.value - self._slow.value
+        signal = self._signal.value
+        return line, signal, line - signal
+
+    @property
+    def ready(self) -> bool:
+        return self._signal.ready
+
+    def _missing(self) -> Tuple[float, float, float]:
+        return NAN, NAN, NAN
+
+    def _update(self, value: float) -> None:
+        self._fast.update(value)
+        self._slow.update(value)
+        if self._slow.ready:
+            self._signal.update(self._fast.value - self._slow.value)
+
+    def _params(self) -> Dict[str, Any]:
+        return {
+            "fast": self._fast._period,
+            "slow": self._slow._period,
+            "signal": self._signal._period,
+        }
+
+    def _state(self) -> Dict[str, Any]:
+        return {
+            "fast": self._fast._state(),
+            "slow": self._slow._state(),
+            "signal": self._signal._state(),
+        }
+
+    def _restore(self, state: Mapping[str, Any]) -> None:
+        self._fast._restore(state["fast"])
+        self._slow._restore(state["slow"])
+        self._signal._restore(state["signal"])
+
+
+class _OnlineExtreme(OnlineIndicator):
+    # Monotonic deque of (bar index, value): each bar is pushed and
+    # popped at most once, so updates are amortized O(1).
+
+    def __init__(self, period: int):
+        super().__init__()
+        check_period(period)
+        self._period = period
+        self._candidates: deque = deque()
+        self._count = 0
+
+    @abstractmethod
+    def _dominates(self, a: float, b: float) -> bool: ...
+
+    @property
+    def value(self) -> float:
+        return self._candidates[0][1] if self.ready else NAN
+
+    @property
+    def ready(self) -> bool:
+        return self._count >= self._period
+
+    def _update(self, value: float) -> None:
+        candidates = self._candidates
+        while candidates and not self._dominates(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((self._count, value))
+        self._count += 1
+        if candidates[0][0] <= self._count - 1 - self._period:
+            candidates.popleft()
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self._period}
+
+    def _state(self) -> Dict[str, Any]:
+        return {"count": self._count, "candidates": [list(c) for c in self._candidates]}
+
+    def _restore(self, state: Mapping[str, Any]) -> None:
+        self._count = state["count"]
+        self._candidates.extend(tuple(c) for c in state["candidates"])
+
+
+class OnlineMax(_OnlineExtreme):
+    """Maximum over the last ``period`` bars."""
+
+    def _dominates(self, a: float, b: float) -> bool:
+        return a > b
+
+
+class OnlineMin(_OnlineExtreme):
+    """Minimum over the last ``period`` bars."""
+
+    def _dominates(self, a: float, b: float) -> bool:
+        return a < b
+
+
+_REGISTRY: Dict[str, Type[OnlineIndicator]] = {
+    kind.__name__: kind
+    for kind in (OnlineSMA, OnlineEMA, OnlineRSI, OnlineMACD, OnlineMax, OnlineMin)
+}
+
+
+def dumps(indicators: Mapping[str, OnlineIndicator]) -> str:
+    """
+    Serialize named indicators to a JSON string.
+
+    Example:
+        >>> Path("state.json").write_text(dumps({"ema": ema, "rsi": rsi}))
+    """
+    return json.dumps({name: ind.state() for name, ind in indicators.items()})
+
+
+def loads(text: str) -> Dict[str, OnlineIndicator]:
+    """
+    Restore indicators serialized with ``dumps()``.
+
+    Example:
+        >>> indicators = loads(Path("state.json").read_text())
+        >>> value = indicators["ema"].update(quote.close, quote.timestamp)
+    """
+    return {
+        name: OnlineIndicator.from_state(state)
+        for name, state in json.loads(text).items()
+    }
@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from .window import check_period, rolling_mean, smoothed
+
+
+@dataclass(frozen=True)
+class MACD:
+    """
+    Moving Average Convergence Divergence lines.
+
+    Attributes:
+        macd (np.ndarray): Fast EMA minus slow EMA
+        signal (np.ndarray): EMA of the MACD line
+        histogram (np.ndarray): MACD line minus signal line
+    """
+
+    macd: np.ndarray
+    signal: np.ndarray
+    histogram: np.ndarray
+
+
+def sma(values: Sequence[float] | np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average.
+
+    Args:
+        values: Input series, e.g. ``QuoteFrame.close``
+        period (int): Window length
+
+    Returns:
+        np.ndarray: Averages aligned with ``values``, NaN for the first
+            ``period - 1`` rows
+
+    Example:
+        >>> frame = ctx.quote_frame()
+        >>> ma_20 = sma(frame.close, 20)
+    """
+    return rolling_mean(values, period)
+
+
+def ema(values: Sequence[float] | np.ndarray, period: int) -> np.ndarray:
+    """
+    Exponential moving average with ``alpha = 2 / (period + 1)``.
+
+    The average is seeded with the simple average of the first
+    ``period`` values.
+
+    Args:
+        values: Input series, e.g. ``QuoteFrame.close``
+        period (int): Span of the average
+
+    Returns:
+        np.ndarray: Averages aligned with ``values``, NaN for the first
+            ``period - 1`` rows
+    """
+    check_period(period)
+    return smoothed(values, 2.0 / (period + 1), period)
+
+
+def macd(
+    values: Sequence[float] | np.ndarray,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+) -> MACD:
+    """
+    MACD line, signal line and histogram.
+
+    Args:
+        values: Input series, e.g. ``QuoteFrame.close``
+        fast (int): Fast EMA period. Defaults to 12.
+        slow (int): Slow EMA period. Defaults to 26.
+        signal (int): Signal EMA period. Defaults to 9.
+
+    Returns:
+        MACD: Lines aligned with ``values``, NaN during warm-up
+
+    Example:
+        >>> hist = macd(frame.close).histogram
+    """
+    if fast >= slow:
+        raise ValueError("fast period must be shorter than slow period")
+
+    line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(line, signal)
+    return MACD(macd=line, signal=signal_line, histogram=line - signal_line)
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from .window import as_series, check_period, rolling_mean, rolling_std, smoothed
+
+
+@dataclass(frozen=True)
+class BollingerBands:
+    """
+    Bollinger Bands.
+
+    Attributes:
+        upper (np.ndarray): Middle band plus ``width`` deviations
+        middle (np.ndarray): Simple moving average
+        lower (np.ndarray): Middle band minus ``width`` deviations
+    """
+
+    upper: np.ndarray
+    middle: np.ndarray
+    lower: np.ndarray
+
+
+def bollinger(
+    values: Sequence[float] | np.ndarray, period: int = 20, width: float = 2.0
+) -> BollingerBands:
+    """
+    Bollinger Bands around a simple moving average.
+
+    Args:
+        values: Input series, e.g. ``QuoteFrame.close``
+        period (int): Window length. Defaults to 20.
+        width (float): Band width in population standard deviations.
+            Defaults to 2.0.
+
+    Returns:
+        BollingerBands: Bands aligned with ``values``, NaN for the first
+            ``period - 1`` rows
+    """
+    middle = rolling_mean(values, period)
+    offset = width * rolling_std(values, period)
+    return BollingerBands(upper=middle + offset, middle=middle, lower=middle - offset)
+
+
+def true_range(
+    high: Sequence[float] | np.ndarray,
+    low: Sequence[float] | np.ndarray,
+    close: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    """
+    True range per candle.
+
+    The first candle has no previous close, so its range is
+    ``high - low``.
+    """
+    h, l, c = as_series(high), as_series(low), as_series(close)
+    if not (h.shape == l.shape == c.shape):
+        raise ValueError("high, low and close must be equal length")
+
+    out = h - l
+    if len(out) > 1:
+        previous = c[:-1]
+        out[1:] = np.maximum.reduce(
+            [out[1:], np.abs(h[1:] - previous), np.abs(l[1:] - previous)]
+        )
+    return out
+
+
+def atr(
+    high: Sequence[float] | np.ndarray,
+    low: Sequence[float] | np.ndarray,
+    close: Sequence[float] | np.ndarray,
+    period: int = 14,
+) -> np.ndarray:
+    """
+    Average True Range with Wilder smoothing.
+
+    Args:
+        high, low, close: Price columns, e.g. from ``QuoteFrame``
+        period (int): Smoothing period. Defaults to 14.
+
+    Returns:
+        np.ndarray: ATR aligned with the input, NaN for the first
+            ``period - 1`` rows
+
+    Example:
+        >>> stop = frame.close - 2 * atr(frame.high, frame.low, frame.close)
+    """
+    check_period(period)
+    return smoothed(true_range(high, low, close), 1.0 / period, period)
@@ -0,0 +1,173 @@
+import numpy as np
+
+# Largest exponent used when rescaling exponential weights, keeps
+# ``decay ** -k`` far away from float64 overflow.
+_MAX_LOG_SCALE = 300.0
+
+# Outputs per block of restarted cumulative sums in the rolling windows.
+_BLOCK = 1024
+
+
+def as_series(values) -> np.ndarray:
+    """Convert input values to a one-dimensional float64 array."""
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim != 1:
+        raise ValueError("indicator input must be one-dimensional")
+    return array
+
+
+def check_period(period: int) -> None:
+    if period < 1:
+        raise ValueError("period must be at least 1")
+
+
+def _warmup(n: int) -> np.ndarray:
+    return np.full(n, np.nan)
+
+
+def _first_valid(x: np.ndarray) -> int:
+    valid = np.flatnonzero(~np.isnan(x))
+    return int(valid[0]) if len(valid) else len(x)
+
+
+def _window_sums(x: np.ndarray, period: int) -> np.ndarray:
+    """Sums of every full trailing window of ``x`` from one cumulative sum."""
+    csum = np.concatenate(([0.0], np.cumsum(x)))
+    return csum[period:] - csum[:-period]
+
+
+def _rolling_moments(values, period: int, squares: bool):
+    """
+    Window sums of the values, and of their squared deviations if
+    ``squares`` is set, as ``(sum, sum_of_squares, centre)`` blocks.
+
+    Cumulative sums are restarted every ``_BLOCK`` outputs and taken
+    relative to the block's mean, so their rounding error depends on the
+    block and not on how long the series is or how far it has drifted.
+    A NaN only affects the windows that contain it.
+    """
+    check_period(period)
+    x = as_series(values)
+    n = len(x)
+    missing = np.isnan(x)
+    block = max(_BLOCK, period)
+
+    for lo in range(period - 1, n, block):
+        hi = min(lo + block, n)
+        segment = x[lo - period + 1 : hi]
+        gaps = missing[lo - period + 1 : hi]
+        valid = segment[~gaps]
+        centre = valid.mean() if len(valid) else 0.0
+        deviation = np.where(gaps, 0.0, segment - centre)
+
+        total = _window_sums(deviation, period)
+        squared = _window_sums(deviation * deviation, period) if squares else None
+        incomplete = _window_sums(gaps.astype(np.float64), period) > 0
+        total[incomplete] = np.nan
+        yield lo, hi, total, squared, centre
+
+
+def rolling_sum(values, period: int) -> np.ndarray:
+    """
+    Sum over a trailing window of ``period`` values in O(n).
+
+    Windows that contain a NaN (e.g. the warm-up of another indicator)
+    are NaN; the first ``period - 1`` results are always NaN.
+    """
+    out = _warmup(len(as_series(values)))
+    for lo, hi, total, _, centre in _rolling_moments(values, period, False):
+        out[lo:hi] = total + centre * period
+    return out
+
+
+def rolling_mean(values, period: int) -> np.ndarray:
+    """Simple moving average over a trailing window, NaN during warm-up."""
+    return rolling_sum(values, period) / period
+
+
+def rolling_std(values, period: int) -> np.ndarray:
+    """
+    Population standard deviation over a trailing window in O(n).
+
+    Uses window sums of the deviations from a per-block centre and of
+    their squares, so years of minute bars keep full precision. Windows
+    that contain a NaN are NaN.
+    """
+    out = _warmup(len(as_series(values)))
+    for lo, hi, total, squared, _ in _rolling_moments(values, period, True):
+        mean = total / period
+        out[lo:hi] = np.sqrt(np.maximum(squared / period - mean * mean, 0.0))
+    return out
+
+
+def _rolling_extreme(values, period: int, ufunc: np.ufunc, fill: float) -> np.ndarray:
+    # van Herk/Gil-Werman: prefix and suffix extremes per block of
+    # ``period`` values, so every window is the extreme of two lookups.
+    check_period(period)
+    x = as_series(values)
+    n = len(x)
+    out = _warmup(n)
+    if n < period:
+        return out
+
+    blocks = -(-n // period)
+    padded = np.full(blocks * period, fill)
+    padded[:n] = x
+    grid = padded.reshape(blocks, period)
+    prefix = ufunc.accumulate(grid, axis=1).ravel()
+    suffix = ufunc.accumulate(grid[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    out[period - 1 :] = ufunc(suffix[: n - period + 1], prefix[period - 1 : n])
+    return out
+
+
+def rolling_max(values, period: int) -> np.ndarray:
+    """Maximum over a trailing window in O(n), NaN during warm-up."""
+    return _rolling_extreme(values, period, np.maximum, -np.inf)
+
+
+def rolling_min(values, period: int) -> np.ndarray:
+    """Minimum over a trailing window in O(n), NaN during warm-up."""
+    return _rolling_extreme(values, period, np.minimum, np.inf)
+
+
+def smoothed(values, alpha: float, period: int) -> np.ndarray:
+    """
+    Exponential smoothing ``y[t] = y[t-1] + alpha * (x[t] - y[t-1])``.
+
+    Leading NaNs are skipped. The first output is the simple average of
+    the first ``period`` valid values, matching the usual EMA and Wilder
+    seeding; everything before it is NaN.
+
+    The recursion is evaluated in blocks with rescaled cumulative sums
+    instead of a Python loop, so the cost stays O(n) in NumPy.
+    """
+    check_period(period)
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError("alpha must be in (0, 1]")
+
+    x = as_series(values)
+    out = _warmup(len(x))
+    first = _first_valid(x)
+    seed = first + period - 1
+    if seed >= len(x):
+        return out
+
+    out[seed] = x[first : seed + 1].mean()
+    rest = x[seed + 1 :]
+    decay = 1.0 - alpha
+    if decay == 0.0:
+        out[seed + 1 :] = rest
+        return out
+
+    block = max(1, int(_MAX_LOG_SCALE / -np.log(decay)))
+    scale = decay ** -np.arange(1, min(block, len(rest)) + 1, dtype=np.float64)
+    previous = out[seed]
+    for lo in range(0, len(rest), block):
+        chunk = rest[lo : lo + block]
+        weights = scale[: len(chunk)]
+        # y[k] = decay^(k+1) * (y[-1] + alpha * sum_j x[j] * decay^-(j+1))
+        values_out = (previous + alpha * np.cumsum(chunk * weights)) / weights
+        out[seed + 1 + lo : seed + 1 + lo + len(chunk)] = values_out
+        previous = values_out[-1]
+    return out
@@ -3,6 +3,7 @@ from typing import List, Protocol, runtime_checkable
 
 from .series import ActionSeries
 from .model import Quote
+from .frame import QuoteFrame
 from .enum import Period
 
 
@@ -23,3 +24,33 @@ class Provider(Protocol):
     def execute(
         self, id: str, symbol: str, action: ActionSeries, amount: float
     ) -> None: ...
+
+
+@runtime_checkable
+class FrameProvider(Provider, Protocol):
+    def quote_frame(
+        self,
+        symbol: str,
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> QuoteFrame: ...
+
+
+@runtime_checkable
+class AsyncProvider(Protocol):
+    def source(self) -> str: ...
+
+    async def quotes(
+        self,
+        symbol: str,
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> List[Quote]: ...
+
+    async def authenticate(self, token: str) -> None: ...
+
+    async def execute(
+        self, id: str, symbol: str, action: ActionSeries, amount: float
+    ) -> None: ...
@@ -0,0 +1,346 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Sequence, overload
+
+import numpy as np
+
+from ..utils.time import from_epoch, to_epoch, to_epoch_array
+from .model import Quote
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class QuoteFrame:
+    """
+    Columnar (struct-of-arrays) container for OHLCV market data.
+
+    Every column is a contiguous NumPy array: timestamps are int64 epoch
+    seconds (UTC) and prices/volume are float64. Rows are always sorted
+    by timestamp in ascending order.
+
+    Column accessors return read-only views, so reading ``frame.close``
+    never copies. Slicing a frame (``frame[10:20]``) also returns a
+    zero-copy frame over the same buffers.
+
+    Example:
+        >>> frame = ctx.quote_frame()
+        >>> closes = frame.close            # np.ndarray view, no copy
+        >>> last_week = frame[-7:]          # zero-copy slice
+        >>> for quote in frame.quotes():    # lazy Quote objects
+        ...     print(quote.timestamp, quote.close)
+    """
+
+    __slots__ = ("_timestamp", "_open", "_high", "_low", "_close", "_volume", "_view")
+
+    COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+    def __init__(
+        self,
+        timestamp: Sequence[int] | np.ndarray,
+        open: Sequence[float] | np.ndarray,
+        high: Sequence[float] | np.ndarray,
+        low: Sequence[float] | np.ndarray,
+        close: Sequence[float] | np.ndarray,
+        volume: Sequence[float] | np.ndarray,
+    ):
+        """
+        Build a frame from column arrays.
+
+        Args:
+            timestamp: Epoch seconds (UTC) for each candle
+            open, high, low, close, volume: Price and volume columns
+
+        Raises:
+            ValueError: If the columns are not one-dimensional or differ
+                in length
+
+        Note:
+            Columns that are already int64/float64 arrays are referenced,
+            not copied. Unsorted input is sorted by timestamp (copying).
+        """
+        ts = np.asarray(timestamp, dtype=np.int64)
+        prices = [
+            np.asarray(col, dtype=np.float64)
+            for col in (open, high, low, close, volume)
+        ]
+
+        if ts.ndim != 1 or any(col.shape != ts.shape for col in prices):
+            raise ValueError("quote columns must be one-dimensional and equal length")
+
+        if len(ts) > 1 and not bool(np.all(ts[1:] >= ts[:-1])):
+            order = np.argsort(ts, kind="stable")
+            ts = ts[order]
+            prices = [col[order] for col in prices]
+
+        self._timestamp = _readonly(ts)
+        self._open, self._high, self._low, self._close, self._volume = (
+            _readonly(col) for col in prices
+        )
+        self._view: QuoteView | None = None
+
+    @classmethod
+    def _wrap(cls, *columns: np.ndarray) -> "QuoteFrame":
+        frame = cls.__new__(cls)
+        (
+            frame._timestamp,
+            frame._open,
+            frame._high,
+            frame._low,
+            frame._close,
+            frame._volume,
+        ) = columns
+        frame._view = None
+        return frame
+
+    @classmethod
+    def empty(cls) -> "QuoteFrame":
+        """Create a frame with no rows."""
+        return cls([], [], [], [], [], [])
+
+    @classmethod
+    def from_quotes(cls, quotes: Sequence[Quote]) -> "QuoteFrame":
+        """
+        Build a frame from a list of ``Quote`` objects.
+
+        When the quotes are already sorted, the original objects are kept
+        as the frame's ``quotes()`` view so they are not rebuilt later.
+        """
+        if isinstance(quotes, QuoteView):
+            return quotes.frame
+
+        n = len(quotes)
+        ts = to_epoch_array([q.timestamp for q in quotes])
+        frame = cls(
+            ts,
+            np.fromiter((q.open for q in quotes), np.float64, n),
+            np.fromiter((q.high for q in quotes), np.float64, n),
+            np.fromiter((q.low for q in quotes), np.float64, n),
+            np.fromiter((q.close for q in quotes), np.float64, n),
+            np.fromiter((q.volume for q in quotes), np.float64, n),
+        )
+        if n < 2 or bool(np.all(ts[1:] >= ts[:-1])):
+            frame.quotes()._items = list(quotes)
+        return frame
+
+    @classmethod
+    def merge(cls, *frames: "QuoteFrame") -> "QuoteFrame":
+        """
+        Combine frames into one sorted frame without duplicate timestamps.
+
+        When several frames contain the same timestamp, the row from the
+        frame passed last wins, so newer data replaces older data.
+        """
+        frames = tuple(f for f in frames if len(f))
+        if not frames:
+            return cls.empty()
+        if len(frames) == 1:
+            return frames[0]
+
+        columns = [
+            np.concatenate(cols) for cols in zip(*(f._columns() for f in frames))
+        ]
+        order = np.argsort(columns[0], kind="stable")
+        columns = [col[order] for col in columns]
+
+        ts = columns[0]
+        keep = np.empty(len(ts), dtype=bool)
+        keep[:-1] = ts[1:] != ts[:-1]
+        keep[-1] = True
+        return cls._wrap(*(_readonly(col[keep]) for col in columns))
+
+    @property
+    def timestamp(self) -> np.ndarray:
+        """Epoch seconds (UTC), int64."""
+        return self._timestamp
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._open
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._high
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._low
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._close
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._volume
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the column buffers in bytes."""
+        return sum(col.nbytes for col in self._columns())
+
+    def _columns(self) -> tuple:
+        return (
+            self._timestamp,
+            self._open,
+            self._high,
+            self._low,
+            self._close,
+            self._volume,
+        )
+
+    def __len__(self) -> int:
+        return len(self._timestamp)
+
+    @overload
+    def __getitem__(self, index: int) -> Quote: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "QuoteFrame": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            step = index.step
+            if step is not None and step <= 0:
+                raise ValueError("QuoteFrame slices must have a positive step")
+            return QuoteFrame._wrap(*(col[index] for col in self._columns()))
+        return self.quote_at(index)
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "QuoteFrame(rows=0)"
+        return (
+            f"QuoteFrame(rows={len(self)}, "
+            f"start={self.datetime_at(0).isoformat()}, "
+            f"end={self.datetime_at(-1).isoformat()})"
+        )
+
+    def datetime_at(self, index: int) -> datetime:
+        """Timezone-aware UTC datetime of the candle at ``index``."""
+        return from_epoch(self._timestamp[index])
+
+    def datetimes(self) -> List[datetime]:
+        """Materialize all timestamps as timezone-aware UTC datetimes."""
+        return [from_epoch(ts) for ts in self._timestamp.tolist()]
+
+    def quote_at(self, index: int) -> Quote:
+        """Build the ``Quote`` object for a single row."""
+        return Quote(
+            timestamp=self.datetime_at(index),
+            high=float(self._high[index]),
+            low=float(self._low[index]),
+            open=float(self._open[index]),
+            close=float(self._close[index]),
+            volume=float(self._volume[index]),
+        )
+
+    def quotes(self) -> "QuoteView":
+        """
+        Get a lazy ``List[Quote]``-compatible view of this frame.
+
+        ``Quote`` objects are only built for rows that are accessed and
+        are cached afterwards.
+        """
+        if self._view is None:
+            self._view = QuoteView(self)
+        return self._view
+
+    def to_list(self) -> List[Quote]:
+        """Materialize every row as a ``Quote`` object."""
+        return list(self.quotes())
+
+    def between(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> "QuoteFrame":
+        """
+        Zero-copy slice of the rows with ``start <= timestamp <= end``.
+
+        Either bound may be ``None`` to leave that side open.
+        """
+        lo = 0 if start is None else self.index_of(start)
+        hi = (
+            len(self)
+            if end is None
+            else int(np.searchsorted(self._timestamp, to_epoch(end), side="right"))
+        )
+        return self[lo:hi]
+
+    def index_of(self, timestamp: datetime) -> int:
+        """Index of the first row at or after ``timestamp``."""
+        return int(np.searchsorted(self._timestamp, to_epoch(timestamp), side="left"))
+
+
+class QuoteView(Sequence[Quote]):
+    """
+    Read-only ``List[Quote]`` compatibility view over a ``QuoteFrame``.
+
+    Behaves like a list of quotes for indexing, slicing, iteration and
+    equality, but only builds ``Quote`` objects on access.
+    """
+
+    __slots__ = ("_frame", "_items")
+
+    def __init__(self, frame: QuoteFrame):
+        self._frame = frame
+        self._items: List[Quote | None] | None = None
+
+    @property
+    def frame(self) -> QuoteFrame:
+        """The underlying columnar frame."""
+        return self._frame
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    def _item(self, index: int) -> Quote:
+        if self._items is None:
+            self._items = [None] * len(self._frame)
+        item = self._items[index]
+        if item is None:
+            item = self._frame.quote_at(index)
+            self._items[index] = item
+        return item
+
+    @overload
+    def __getitem__(self, index: int) -> Quote: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Quote]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < -n or index >= n:
+            raise IndexError("quote index out of range")
+        return self._item(index % n)
+
+    def __iter__(self) -> Iterator[Quote]:
+        for i in range(len(self)):
+            yield self._item(i)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"QuoteView({self._frame!r})"
+
+
+@dataclass
+class QuoteBatch:
+    """
+    Result of a multi-symbol quote load.
+
+    Attributes:
+        frames (Dict[str, QuoteFrame]): Quotes per successfully loaded symbol
+        errors (Dict[str, Exception]): Failure per symbol that could not
+            be loaded
+    """
+
+    frames: Dict[str, QuoteFrame] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import Sequence
 
 from .series import FloatSeries
 from .enum import DefaultProvider, Period
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     timestamp: datetime
     high: float
@@ -16,7 +16,7 @@ class Quote:
     volume: float
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     ticker: str
     period: Period
@@ -24,14 +24,14 @@ class MarketData:
     quotes: list[Quote]
 
 
-@dataclass
+@dataclass(slots=True)
 class PlotData:
     label: str
-    data: List[FloatSeries]
+    data: Sequence[FloatSeries]
     screen_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RangeInterval:
     interval: str
     range: str
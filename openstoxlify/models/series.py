@@ -5,7 +5,7 @@ from utcnow import utcnow
 from .enum import ActionType
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatSeries:
     timestamp: datetime
     value: float
@@ -17,7 +17,7 @@ class FloatSeries:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionSeries:
     timestamp: datetime
     action: ActionType
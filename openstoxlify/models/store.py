@@ -0,0 +1,366 @@
+from datetime import datetime
+from typing import Dict, Iterator, List, Sequence, Tuple, overload
+
+import numpy as np
+
+from ..utils.time import from_epoch, to_epoch, to_epoch_array
+from .enum import ActionType
+from .model import PlotData
+from .series import ActionSeries, FloatSeries
+
+ACTION_CODES: Dict[ActionType, int] = {
+    ActionType.HOLD: 0,
+    ActionType.LONG: 1,
+    ActionType.SHORT: -1,
+}
+ACTIONS: Dict[int, ActionType] = {code: action for action, code in ACTION_CODES.items()}
+
+
+class GrowableArray:
+    """
+    Append-friendly typed NumPy buffer with amortized O(1) growth.
+
+    Capacity doubles when full, so appending n values costs O(n) copies
+    in total instead of one Python object per value.
+    """
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, dtype: np.dtype | type, capacity: int = 16):
+        self._data = np.empty(max(capacity, 1), dtype=dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int) -> None:
+        required = self._size + extra
+        if required <= len(self._data):
+            return
+        capacity = max(required, len(self._data) * 2)
+        data = np.empty(capacity, dtype=self._data.dtype)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+
+    def append(self, value) -> None:
+        self._reserve(1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values: np.ndarray) -> None:
+        n = len(values)
+        self._reserve(n)
+        self._data[self._size : self._size + n] = values
+        self._size += n
+
+    def view(self) -> np.ndarray:
+        """Read-only view of the filled part of the buffer."""
+        view = self._data[: self._size]
+        view.flags.writeable = False
+        return view
+
+
+def _round_trips(timestamp: datetime) -> bool:
+    """Whether ``from_epoch(to_epoch(timestamp))`` equals ``timestamp``."""
+    return timestamp.tzinfo is not None and timestamp.microsecond == 0
+
+
+class SeriesColumns:
+    """
+    Timestamp and value columns of a single plotted series.
+
+    Timestamps are stored as whole epoch seconds. Datetimes appended one
+    at a time that this would change (naive or sub-second ones) are also
+    kept in ``originals`` by row, so the ``FloatSeries`` objects read back
+    are equal to the ones that were appended.
+    """
+
+    __slots__ = ("timestamps", "values", "originals", "plot_data")
+
+    def __init__(self, label: str, screen_index: int):
+        self.timestamps = GrowableArray(np.int64)
+        self.values = GrowableArray(np.float64)
+        self.originals: Dict[int, datetime] = {}
+        self.plot_data = PlotData(
+            label=label, data=SeriesView(self), screen_index=screen_index
+        )
+
+    def append(self, timestamp: datetime, value: float) -> None:
+        if not _round_trips(timestamp):
+            self.originals[len(self.timestamps)] = timestamp
+        self.timestamps.append(to_epoch(timestamp))
+        self.values.append(value)
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        self.timestamps.extend(timestamps)
+        self.values.extend(values)
+
+
+class SeriesView(Sequence[FloatSeries]):
+    """
+    ``List[FloatSeries]``-compatible view over a plotted series.
+
+    ``FloatSeries`` objects are built on access; the raw columns are
+    available through ``timestamps`` and ``values`` without copying.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns: SeriesColumns):
+        self._columns = columns
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Epoch seconds (UTC), int64."""
+        return self._columns.timestamps.view()
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._columns.values.view()
+
+    @property
+    def originals(self) -> Dict[int, datetime]:
+        """Appended datetimes that ``timestamps`` does not reproduce, by row."""
+        return self._columns.originals
+
+    def __len__(self) -> int:
+        return len(self._columns.values)
+
+    def _item(self, index: int) -> FloatSeries:
+        timestamp = self._columns.originals.get(index)
+        if timestamp is None:
+            timestamp = from_epoch(self.timestamps[index])
+        return FloatSeries(timestamp, float(self.values[index]))
+
+    @overload
+    def __getitem__(self, index: int) -> FloatSeries: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[FloatSeries]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < -n or index >= n:
+            raise IndexError("series index out of range")
+        return self._item(index % n)
+
+    def __iter__(self) -> Iterator[FloatSeries]:
+        timestamps = self.timestamps.tolist()
+        values = self.values.tolist()
+        originals = self._columns.originals
+        for i, (ts, value) in enumerate(zip(timestamps, values)):
+            yield FloatSeries(originals.get(i) or from_epoch(ts), value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def append(self, data: FloatSeries) -> None:
+        """Append a single point, mirroring ``list.append``."""
+        self._columns.append(data.timestamp, data.value)
+
+    def __repr__(self) -> str:
+        return f"SeriesView(points={len(self)})"
+
+
+class PlotStore:
+    """
+    Label-indexed storage for plotted indicator series.
+
+    Series are looked up by ``(plot_type, label)`` in O(1) and their
+    points are kept in growable typed arrays. ``plots()`` exposes the
+    familiar ``Dict[str, List[PlotData]]`` shape backed by live views.
+    """
+
+    def __init__(self):
+        self._plots: Dict[str, List[PlotData]] = {}
+        self._index: Dict[Tuple[str, str], SeriesColumns] = {}
+
+    def _series(self, key: str, label: str, screen_index: int) -> SeriesColumns:
+        columns = self._index.get((key, label))
+        if columns is None:
+            columns = SeriesColumns(label, screen_index)
+            self._index[(key, label)] = columns
+            self._plots.setdefault(key, []).append(columns.plot_data)
+        return columns
+
+    def append(
+        self, key: str, label: str, data: FloatSeries, screen_index: int
+    ) -> None:
+        self._series(key, label, screen_index).append(data.timestamp, data.value)
+
+    def extend(
+        self,
+        key: str,
+        label: str,
+        timestamps: Sequence[datetime] | np.ndarray,
+        values: Sequence[float] | np.ndarray,
+        screen_index: int,
+    ) -> None:
+        ts = to_epoch_array(timestamps)
+        vals = np.asarray(values, dtype=np.float64)
+        if ts.ndim != 1 or ts.shape != vals.shape:
+            raise ValueError("timestamps and values must be 1-D and equal length")
+        self._series(key, label, screen_index).extend(ts, vals)
+
+    def plots(self) -> Dict[str, List[PlotData]]:
+        return self._plots
+
+
+class SignalStore:
+    """
+    Columnar storage for trading signals.
+
+    Signals are kept in insertion order as int64 epoch timestamps, int8
+    action codes (``ACTION_CODES``: LONG=1, SHORT=-1, HOLD=0) and float64
+    amounts. A timestamp-sorted index is built lazily and reused until
+    the next append, so lookups by timestamp are a single binary search.
+
+    As with plotted series, naive or sub-second datetimes passed to
+    ``append()`` are kept alongside the epoch seconds, so the
+    ``ActionSeries`` read back are equal to the recorded ones.
+    """
+
+    def __init__(self):
+        self._timestamps = GrowableArray(np.int64)
+        self._actions = GrowableArray(np.int8)
+        self._amounts = GrowableArray(np.float64)
+        self._originals: Dict[int, datetime] = {}
+        self._index: Tuple[np.ndarray, np.ndarray] | None = None
+        self._view = SignalView(self)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Epoch seconds (UTC), int64, in insertion order."""
+        return self._timestamps.view()
+
+    @property
+    def actions(self) -> np.ndarray:
+        """Action codes, int8, in insertion order."""
+        return self._actions.view()
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self._amounts.view()
+
+    def append(self, data: ActionSeries) -> None:
+        if not _round_trips(data.timestamp):
+            self._originals[len(self._timestamps)] = data.timestamp
+        self._timestamps.append(to_epoch(data.timestamp))
+        self._actions.append(ACTION_CODES[data.action])
+        self._amounts.append(data.amount)
+        self._index = None
+
+    def extend(
+        self, timestamps: np.ndarray, actions: np.ndarray, amounts: np.ndarray
+    ) -> None:
+        """Append epoch timestamps, action codes and amounts in bulk."""
+        self._timestamps.extend(timestamps)
+        self._actions.extend(actions)
+        self._amounts.extend(np.where(actions == 0, 0.0, amounts))
+        self._index = None
+
+    def _sorted(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._index is None:
+            order = np.argsort(self.timestamps, kind="stable")
+            self._index = (self.timestamps[order], order)
+        return self._index
+
+    def find(self, timestamp: int) -> int | None:
+        """
+        Locate the signal recorded at an epoch timestamp.
+
+        Returns:
+            int | None: Insertion index of the most recently recorded
+                signal at ``timestamp``, or None if there is none
+        """
+        ts_sorted, order = self._sorted()
+        pos = int(np.searchsorted(ts_sorted, timestamp, side="right")) - 1
+        if pos < 0 or ts_sorted[pos] != timestamp:
+            return None
+        return int(order[pos])
+
+    def _datetime(self, index: int, epoch: int) -> datetime:
+        return self._originals.get(index) or from_epoch(epoch)
+
+    def signal_at(self, index: int) -> ActionSeries:
+        return ActionSeries(
+            timestamp=self._datetime(index, self._timestamps.view()[index]),
+            action=ACTIONS[int(self._actions.view()[index])],
+            amount=float(self._amounts.view()[index]),
+        )
+
+    def signals(self) -> "SignalView":
+        return self._view
+
+
+class SignalView(Sequence[ActionSeries]):
+    """
+    ``List[ActionSeries]``-compatible view over a ``SignalStore``.
+
+    Signals are returned in the order they were recorded and built as
+    ``ActionSeries`` objects on access; the raw columns are available
+    through ``timestamps``, ``actions`` and ``amounts`` without copying.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: SignalStore):
+        self._store = store
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Epoch seconds (UTC), int64, in recording order."""
+        return self._store.timestamps
+
+    @property
+    def actions(self) -> np.ndarray:
+        """Action codes (LONG=1, SHORT=-1, HOLD=0), int8."""
+        return self._store.actions
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self._store.amounts
+
+    @property
+    def originals(self) -> Dict[int, datetime]:
+        """Recorded datetimes that ``timestamps`` does not reproduce, by row."""
+        return self._store._originals
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @overload
+    def __getitem__(self, index: int) -> ActionSeries: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ActionSeries]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._store.signal_at(i) for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < -n or index >= n:
+            raise IndexError("signal index out of range")
+        return self._store.signal_at(index % n)
+
+    def __iter__(self) -> Iterator[ActionSeries]:
+        timestamps = self._store.timestamps.tolist()
+        actions = self._store.actions.tolist()
+        amounts = self._store.amounts.tolist()
+        for i, (ts, code, amount) in enumerate(zip(timestamps, actions, amounts)):
+            yield ActionSeries(self._store._datetime(i, ts), ACTIONS[code], amount)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"SignalView(signals={len(self)})"
@@ -0,0 +1,172 @@
+# pyright: reportAttributeAccessIssue=false
+import asyncio
+
+from datetime import datetime
+from typing import Iterable, List
+
+import grpc
+
+from .codec import decode_quotes, product_info_request, trade_request
+from .proto import client
+from .proto.market import market_pb2_grpc
+from .proto.trade import trade_pb2_grpc
+
+from ...utils.batch import DEFAULT_MAX_CONCURRENCY
+from ...utils.period import find_range_interval
+from ...utils.time import to_epoch
+from ...models.enum import DefaultProvider, Period
+from ...models.series import ActionSeries
+from ...models.model import Quote
+from ...models.frame import QuoteBatch, QuoteFrame
+
+
+class AsyncProvider:
+    """
+    asyncio counterpart of the stoxlify ``Provider`` built on ``grpc.aio``.
+
+    The channel is opened lazily on first use, so it is bound to the
+    event loop the provider is used from. One provider can drive many
+    concurrent requests on a single loop without a thread per request.
+
+    Example:
+        >>> async with AsyncProvider(DefaultProvider.YFinance) as provider:
+        ...     frame = await provider.quote_frame("BTC-USD", Period.DAILY)
+    """
+
+    def __init__(
+        self,
+        source: DefaultProvider,
+        target: str = client.DEFAULT_GRPC_TARGET,
+        options: client.ChannelOptions | None = None,
+    ):
+        self._source = source
+        self._target = target
+        self._options = options
+        self._channel: grpc.aio.Channel | None = None
+        self._market: market_pb2_grpc.MarketServiceStub | None = None
+        self._trade: trade_pb2_grpc.TradeServiceStub | None = None
+        self._token: str | None = None
+
+    async def __aenter__(self) -> "AsyncProvider":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _connect(self) -> grpc.aio.Channel:
+        if self._channel is None:
+            self._channel = client.aio_channel(self._target, self._options)
+            self._market = market_pb2_grpc.MarketServiceStub(self._channel)
+            self._trade = trade_pb2_grpc.TradeServiceStub(self._channel)
+        return self._channel
+
+    async def warm_up(self, timeout: float = client.DEFAULT_WARM_UP_TIMEOUT) -> None:
+        """
+        Connect to the backend and wait until the channel is READY.
+
+        Raises:
+            TimeoutError: If the channel is not ready within ``timeout``
+                seconds
+        """
+        try:
+            await asyncio.wait_for(self._connect().channel_ready(), timeout)
+        except asyncio.TimeoutError as err:
+            raise TimeoutError(f"channel not ready after {timeout}s") from err
+
+    async def close(self) -> None:
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = self._market = self._trade = None
+
+    def source(self) -> str:
+        return self._source.value
+
+    async def quotes(
+        self,
+        symbol: str,
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> List[Quote]:
+        frame = await self.quote_frame(symbol, period, start, end)
+        return frame.to_list()
+
+    async def quote_frame(
+        self,
+        symbol: str,
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> QuoteFrame:
+        req = product_info_request(
+            self._source,
+            symbol,
+            find_range_interval(period),
+            None if start is None else to_epoch(start),
+            None if end is None else to_epoch(end),
+        )
+        try:
+            self._connect()
+            response = await self._market.GetProductInfo(req)
+        except Exception as err:
+            raise RuntimeError(f"request failed: {err}") from err
+
+        return decode_quotes(response)
+
+    async def quotes_many(
+        self,
+        symbols: Iterable[str],
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> QuoteBatch:
+        """
+        Fetch quotes for many symbols with at most ``max_concurrency``
+        requests in flight.
+
+        Returns:
+            QuoteBatch: Frames per loaded symbol and errors per failed one
+
+        Raises:
+            asyncio.CancelledError: If a fetch was cancelled. Cancellation
+                is not recorded as a per-symbol error.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        unique = list(dict.fromkeys(symbols))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(symbol: str) -> QuoteFrame:
+            async with semaphore:
+                return await self.quote_frame(symbol, period, start, end)
+
+        results = await asyncio.gather(
+            *(fetch(symbol) for symbol in unique), return_exceptions=True
+        )
+
+        batch = QuoteBatch()
+        for symbol, result in zip(unique, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            if isinstance(result, Exception):
+                batch.errors[symbol] = result
+            else:
+                batch.frames[symbol] = result
+        return batch
+
+    async def authenticate(self, token: str) -> None:
+        self._token = token
+        return
+
+    async def execute(
+        self, id: str, symbol: str, action: ActionSeries, amount: float
+    ) -> None:
+        try:
+            req = trade_request(id, symbol, action.action, amount)
+            meta = (("authorization", f"Bearer {self._token}"),)
+            self._connect()
+            await self._trade.ExecuteTrade(req, metadata=meta)
+        except Exception:
+            return
@@ -0,0 +1,89 @@
+# pyright: reportAttributeAccessIssue=false
+from typing import Iterator
+
+import numpy as np
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from .proto.market import market_pb2
+from .proto.trade import trade_pb2
+from .proto.model import model_pb2
+
+from ...models.enum import ActionType, DefaultProvider
+from ...models.frame import QuoteFrame
+from ...models.model import RangeInterval
+
+
+def product_info_request(
+    source: DefaultProvider,
+    symbol: str,
+    range_interval: RangeInterval,
+    start: int | None = None,
+    end: int | None = None,
+) -> market_pb2.GetProductInfoRequest:
+    req = market_pb2.GetProductInfoRequest(
+        Ticker=symbol,
+        Range=range_interval.range,
+        Interval=range_interval.interval,
+        Indicator="quote",
+        Source=source.value,
+    )
+    if start is not None:
+        req.Start.CopyFrom(Timestamp(seconds=start))
+    if end is not None:
+        req.End.CopyFrom(Timestamp(seconds=end))
+    return req
+
+
+QUOTE_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("open", np.float64),
+        ("high", np.float64),
+        ("low", np.float64),
+        ("close", np.float64),
+        ("volume", np.float64),
+    ]
+)
+
+
+def _quote_rows(quotes) -> Iterator[tuple]:
+    for q in quotes:
+        price = q.ProductInfo.Price
+        yield (
+            q.Timestamp.seconds,
+            price.Open,
+            price.High,
+            price.Low,
+            price.Close,
+            price.Volume,
+        )
+
+
+def decode_quotes(response: market_pb2.GetProductInfoResponse) -> QuoteFrame:
+    """
+    Decode a ``GetProductInfoResponse`` into a ``QuoteFrame``.
+
+    Timestamp seconds and HLOCV prices are read in a single pass straight
+    into a preallocated record buffer, which is then split into contiguous
+    columns. No ``datetime`` or ``Quote`` objects are created; those are
+    only built lazily when ``QuoteFrame.quotes()`` is accessed.
+    """
+    quotes = response.Quote
+    rows = np.fromiter(_quote_rows(quotes), dtype=QUOTE_DTYPE, count=len(quotes))
+    return QuoteFrame(
+        *(np.ascontiguousarray(rows[name]) for name in QuoteFrame.COLUMNS)
+    )
+
+
+def trade_request(
+    id: str, symbol: str, action: ActionType, amount: float
+) -> trade_pb2.ExecuteTradeRequest:
+    a = trade_pb2.Short
+    if action == ActionType.LONG:
+        a = trade_pb2.Long
+    task = model_pb2.Task(TaskId=id, Ticker=symbol)
+    return trade_pb2.ExecuteTradeRequest(
+        Task=task,
+        Action=a,
+        Quantity=amount,
+    )
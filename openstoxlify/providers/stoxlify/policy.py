@@ -0,0 +1,232 @@
+import queue
+import random
+import threading
+import time
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Tuple
+
+import grpc
+import numpy as np
+
+RETRYABLE_CODES: FrozenSet[grpc.StatusCode] = frozenset(
+    {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CallPolicy:
+    """
+    Deadline, retry and hedging settings for idempotent unary calls.
+
+    Attributes:
+        timeout (float | None): Deadline of each attempt in seconds,
+            None for no deadline
+        deadline (float | None): Budget for the whole call including
+            retries and backoff, None for no overall limit
+        max_attempts (int): Attempts per call, 1 disables retries
+        initial_backoff (float): Upper bound of the first backoff sleep
+        max_backoff (float): Upper bound of any backoff sleep
+        backoff_multiplier (float): Growth of the bound per retry. Sleeps
+            are drawn uniformly below the bound ("full jitter").
+        retry_codes (FrozenSet[grpc.StatusCode]): Status codes that are
+            retried, ``UNAVAILABLE`` and ``DEADLINE_EXCEEDED`` by default
+        hedge (bool): Send a second copy of an attempt that has not
+            answered after ``hedge_delay`` and keep the first response
+        hedge_delay (float | None): Fixed hedging delay. None uses the
+            ``hedge_quantile`` of recent call latencies.
+        hedge_quantile (float): Latency quantile used as the delay
+        hedge_min_samples (int): Latencies needed before the quantile is
+            used; ``hedge_fallback_delay`` applies until then
+        hedge_fallback_delay (float): Delay while there are too few samples
+
+    Example:
+        >>> policy = CallPolicy(timeout=5, max_attempts=4, hedge=True)
+        >>> provider = Provider(DefaultProvider.YFinance, policy=policy)
+    """
+
+    timeout: float | None = 60.0
+    deadline: float | None = None
+    max_attempts: int = 3
+    initial_backoff: float = 0.1
+    max_backoff: float = 2.0
+    backoff_multiplier: float = 2.0
+    retry_codes: FrozenSet[grpc.StatusCode] = RETRYABLE_CODES
+    hedge: bool = False
+    hedge_delay: float | None = None
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_fallback_delay: float = 1.0
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def backoff(self, retry: int) -> float:
+        """Jittered sleep before retry number ``retry`` (1-based)."""
+        bound = self.initial_backoff * self.backoff_multiplier ** (retry - 1)
+        return random.uniform(0, min(self.max_backoff, bound))
+
+
+@dataclass
+class CallStats:
+    """
+    Counters of a ``PolicyCaller``. Updated under a lock, read with
+    ``snapshot()``.
+
+    Attributes:
+        calls (int): Calls made
+        attempts (int): Attempts sent, excluding hedged copies
+        retries (int): Attempts after a retryable failure
+        hedges (int): Hedged copies sent
+        hedge_wins (int): Calls answered by the hedged copy
+        deadline_exceeded (int): Attempts that ran past their deadline
+        failures (int): Calls that raised after all attempts
+    """
+
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    deadline_exceeded: int = 0
+    failures: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Current counter values."""
+        with self._lock:
+            return {
+                name: getattr(self, name)
+                for name in self.__dataclass_fields__
+                if not name.startswith("_")
+            }
+
+
+class PolicyCaller:
+    """
+    Calls unary gRPC methods under a ``CallPolicy``.
+
+    Only use it for idempotent methods, since an attempt may reach the
+    server more than once. Hedging needs the method's ``future()`` form,
+    which generated stubs provide.
+
+    Args:
+        policy (CallPolicy): Deadline, retry and hedging settings
+        window (int): Number of recent latencies kept for the hedging
+            quantile
+    """
+
+    def __init__(self, policy: CallPolicy, window: int = 1000):
+        self.policy = policy
+        self.stats = CallStats()
+        self._latencies: deque = deque(maxlen=window)
+
+    def hedge_delay(self) -> float:
+        """Delay before a hedged copy is sent."""
+        policy = self.policy
+        if policy.hedge_delay is not None:
+            return policy.hedge_delay
+        samples = list(self._latencies)
+        if len(samples) < policy.hedge_min_samples:
+            return policy.hedge_fallback_delay
+        return float(np.quantile(samples, policy.hedge_quantile))
+
+    def __call__(self, method: Callable, request: Any, **kwargs: Any) -> Any:
+        """
+        Call ``method(request, **kwargs)`` with deadlines, retries and
+        optional hedging.
+
+        Raises:
+            grpc.RpcError: The last error when every attempt failed, or
+                the first non-retryable one
+        """
+        policy = self.policy
+        self.stats.add(calls=1)
+        start = time.monotonic()
+        end = None if policy.deadline is None else start + policy.deadline
+
+        for attempt in range(1, policy.max_attempts + 1):
+            timeout = policy.timeout
+            if end is not None:
+                left = end - time.monotonic()
+                timeout = left if timeout is None else min(timeout, left)
+
+            self.stats.add(attempts=1, retries=int(attempt > 1))
+            sent = time.monotonic()
+            primary = True
+            try:
+                if policy.hedge:
+                    response, primary = self._hedged(method, request, timeout, kwargs)
+                else:
+                    response = method(request, timeout=timeout, **kwargs)
+            except grpc.RpcError as err:
+                code = err.code() if callable(getattr(err, "code", None)) else None
+                if code == grpc.StatusCode.DEADLINE_EXCEEDED:
+                    self.stats.add(deadline_exceeded=1)
+                if code not in policy.retry_codes or attempt == policy.max_attempts:
+                    self.stats.add(failures=1)
+                    raise
+                pause = policy.backoff(attempt)
+                if end is not None and time.monotonic() + pause >= end:
+                    self.stats.add(failures=1)
+                    raise
+                time.sleep(pause)
+                continue
+            except Exception:
+                self.stats.add(failures=1)
+                raise
+
+            # A hedge win measures the copy sent after the delay, not the
+            # server's latency, and would drag the quantile down.
+            if primary:
+                self._latencies.append(time.monotonic() - sent)
+            return response
+
+    def _hedged(
+        self, method: Callable, request: Any, timeout: float | None, kwargs: Dict
+    ) -> Tuple[Any, bool]:
+        """
+        Race the attempt against a copy sent after ``hedge_delay()``.
+
+        Returns:
+            Tuple[Any, bool]: The response and whether the first attempt,
+            rather than the hedged copy, produced it
+        """
+        done: queue.Queue = queue.Queue()
+        first = method.future(request, timeout=timeout, **kwargs)
+        first.add_done_callback(done.put)
+        pending = [first]
+
+        finished = None
+        delay = self.hedge_delay()
+        if timeout is None or delay < timeout:
+            try:
+                finished = done.get(timeout=delay)
+            except queue.Empty:
+                second = method.future(request, timeout=timeout, **kwargs)
+                second.add_done_callback(done.put)
+                pending.append(second)
+                self.stats.add(hedges=1)
+        if finished is None:
+            finished = done.get()
+
+        while True:
+            pending.remove(finished)
+            if finished.exception() is None or not pending:
+                break
+            finished = done.get()
+
+        for other in pending:
+            other.cancel()
+        if finished is not first and finished.exception() is None:
+            self.stats.add(hedge_wins=1)
+        return finished.result(), finished is first
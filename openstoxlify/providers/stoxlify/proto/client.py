@@ -1,15 +1,155 @@
+import threading
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
 import grpc
 
 DEFAULT_GRPC_TARGET = "sa-api.twopercents.svc.cluster.local:8090"
+DEFAULT_MAX_MESSAGE_LENGTH = 256 * 2**20
+DEFAULT_WARM_UP_TIMEOUT = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelOptions:
+    """
+    Settings for a gRPC channel.
+
+    Keepalive is off by default. gRPC servers reject clients that ping
+    more often than they allow with GOAWAY ``too_many_pings``, which would
+    break every provider sharing the channel. With default server
+    settings, pings must be at least 5 minutes apart
+    (``grpc.http2.min_recv_ping_interval_without_data_ms``) and are only
+    accepted while a call is in flight (``grpc.keepalive_permit_without_calls``).
+    Only enable keepalive with an interval at or above the server's
+    minimum, and only ping idle channels if the server permits it.
+
+    Attributes:
+        keepalive_time_ms (int | None): Interval between keepalive pings,
+            None (default) to disable keepalive. Must not be shorter than
+            the server's minimum ping interval, e.g. ``300_000``.
+        keepalive_timeout_ms (int): Time to wait for a ping ack before
+            the connection is considered dead
+        keepalive_permit_without_calls (bool): Keep pinging while no
+            request is in flight, so an idle live run keeps its
+            connection. Only set this when the server also permits
+            pings without calls. Default False.
+        max_message_length (int): Largest message sent or received, in
+            bytes. Long minute histories exceed gRPC's 4 MiB default.
+        compression (grpc.Compression): Compression of the requests
+            sent on the channel. Responses are compressed at the server's
+            discretion.
+    """
+
+    keepalive_time_ms: int | None = None
+    keepalive_timeout_ms: int = 20_000
+    keepalive_permit_without_calls: bool = False
+    max_message_length: int = DEFAULT_MAX_MESSAGE_LENGTH
+    compression: grpc.Compression = grpc.Compression.Gzip
+
+    def arguments(self) -> List[Tuple[str, Any]]:
+        """Channel arguments in the form taken by ``grpc.*_channel()``."""
+        args: List[Tuple[str, Any]] = [
+            ("grpc.max_send_message_length", self.max_message_length),
+            ("grpc.max_receive_message_length", self.max_message_length),
+        ]
+        if self.keepalive_time_ms is not None:
+            args += [
+                ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+                ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+                (
+                    "grpc.keepalive_permit_without_calls",
+                    int(self.keepalive_permit_without_calls),
+                ),
+            ]
+        return args
+
 
+DEFAULT_CHANNEL_OPTIONS = ChannelOptions()
 
-def channel(target: str):
+
+def channel(target: str, options: ChannelOptions | None = None) -> grpc.Channel:
+    """Open a new channel to ``target``. Prefer ``shared_channel()``."""
+    options = options or DEFAULT_CHANNEL_OPTIONS
     if target.endswith(":443"):
         channel = grpc.secure_channel(
             target,
             grpc.ssl_channel_credentials(),
+            options=options.arguments(),
+            compression=options.compression,
+        )
+    else:
+        channel = grpc.insecure_channel(
+            target, options=options.arguments(), compression=options.compression
+        )
+
+    return channel
+
+
+def aio_channel(target: str, options: ChannelOptions | None = None):
+    options = options or DEFAULT_CHANNEL_OPTIONS
+    if target.endswith(":443"):
+        channel = grpc.aio.secure_channel(
+            target,
+            grpc.ssl_channel_credentials(),
+            options=options.arguments(),
+            compression=options.compression,
         )
     else:
-        channel = grpc.insecure_channel(target)
+        channel = grpc.aio.insecure_channel(
+            target, options=options.arguments(), compression=options.compression
+        )
 
     return channel
+
+
+class ChannelRegistry:
+    """
+    Process-wide cache of gRPC channels keyed by target and options.
+
+    A channel multiplexes any number of concurrent calls over one HTTP/2
+    connection, so every ``Provider`` for the same target shares one
+    channel instead of paying connection setup and holding a socket
+    each.
+    """
+
+    def __init__(self):
+        self._channels: Dict[Tuple[str, ChannelOptions], grpc.Channel] = {}
+        self._lock = threading.Lock()
+
+    def get(self, target: str, options: ChannelOptions | None = None) -> grpc.Channel:
+        """Get the channel for ``target``, opening it on first use."""
+        key = (target, options or DEFAULT_CHANNEL_OPTIONS)
+        with self._lock:
+            ch = self._channels.get(key)
+            if ch is None:
+                ch = self._channels[key] = channel(target, key[1])
+            return ch
+
+    def close(self) -> None:
+        """Close and forget every channel."""
+        with self._lock:
+            channels, self._channels = list(self._channels.values()), {}
+        for ch in channels:
+            ch.close()
+
+
+registry = ChannelRegistry()
+
+
+def shared_channel(target: str, options: ChannelOptions | None = None) -> grpc.Channel:
+    """The registry's channel for ``target``."""
+    return registry.get(target, options)
+
+
+def warm_up(ch: grpc.Channel, timeout: float = DEFAULT_WARM_UP_TIMEOUT) -> None:
+    """
+    Connect ``ch`` and wait until it is READY.
+
+    Raises:
+        TimeoutError: If the channel is not ready within ``timeout`` seconds
+    """
+    try:
+        grpc.channel_ready_future(ch).result(timeout=timeout)
+    except grpc.FutureTimeoutError as err:
+        raise TimeoutError(f"channel not ready after {timeout}s") from err
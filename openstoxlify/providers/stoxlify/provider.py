@@ -1,26 +1,77 @@
 # pyright: reportAttributeAccessIssue=false
-from datetime import timezone, datetime
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Tuple
 
+import numpy as np
 
+from .codec import decode_quotes, product_info_request, trade_request
+from .policy import CallPolicy, CallStats, PolicyCaller
 from .proto import client
 from .proto.market import market_pb2, market_pb2_grpc
-from .proto.trade import trade_pb2, trade_pb2_grpc
-from .proto.model import model_pb2
+from .proto.trade import trade_pb2_grpc
 
-from ...utils.period import find_range_interval
-from ...utils.time import to_google_timestamp
-from ...models.enum import ActionType, DefaultProvider, Period
+from ...cache.disk import DiskQuoteStore
+from ...utils.batch import DEFAULT_MAX_CONCURRENCY, fetch_many
+from ...utils.period import default_chunk, find_range_interval, range_duration
+from ...utils.time import to_epoch
+from ...models.enum import DefaultProvider, Period
 from ...models.series import ActionSeries
-from ...models.model import Quote
+from ...models.model import Quote, RangeInterval
+from ...models.frame import QuoteBatch, QuoteFrame
 
 
 class Provider:
     def __init__(
-        self, source: DefaultProvider, target: str = client.DEFAULT_GRPC_TARGET
+        self,
+        source: DefaultProvider,
+        target: str = client.DEFAULT_GRPC_TARGET,
+        store: DiskQuoteStore | None = None,
+        options: client.ChannelOptions | None = None,
+        policy: CallPolicy | None = None,
     ):
+        """
+        Args:
+            source (DefaultProvider): Market data source
+            target (str): gRPC target of the market/trade services
+            store (DiskQuoteStore | None): Optional on-disk candle store.
+                When set, only the time ranges missing from the store are
+                requested and the results are merged back into it.
+            options (ChannelOptions | None): Keepalive, compression and
+                message-size settings of the channel. Providers with the
+                same target and options share one channel from
+                ``client.registry``.
+            policy (CallPolicy | None): Per-attempt deadline, retries with
+                jittered backoff and optional hedging of quote requests.
+                Trades only get the deadline, since they are not
+                idempotent. Defaults to ``CallPolicy()``.
+        """
         self._source = source
-        self._channel = client.channel(target=target)
+        self._channel = client.shared_channel(target, options)
+        self._market = market_pb2_grpc.MarketServiceStub(self._channel)
+        self._trade = trade_pb2_grpc.TradeServiceStub(self._channel)
+        self._caller = PolicyCaller(policy or CallPolicy())
+        self._store = store
+
+    @property
+    def stats(self) -> CallStats:
+        """Call, retry and hedging counters of quote requests."""
+        return self._caller.stats
+
+    def warm_up(self, timeout: float = client.DEFAULT_WARM_UP_TIMEOUT) -> None:
+        """
+        Connect to the backend and wait until the channel is READY.
+
+        Call this before the first bar-close deadline of a live run, so
+        the first request does not pay for DNS, TCP and TLS setup.
+
+        Args:
+            timeout (float): Seconds to wait. Defaults to 10.
+
+        Raises:
+            TimeoutError: If the channel is not ready in time
+        """
+        client.warm_up(self._channel, timeout)
 
     def source(self) -> str:
         return self._source.value
@@ -32,39 +83,188 @@ class Provider:
         start: datetime | None = None,
         end: datetime | None = None,
     ) -> List[Quote]:
+        return self.quote_frame(symbol, period, start, end).to_list()
+
+    def quote_frame(
+        self,
+        symbol: str,
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> QuoteFrame:
+        range_interval = find_range_interval(period)
+        start_epoch = None if start is None else to_epoch(start)
+        end_epoch = None if end is None else to_epoch(end)
+
+        if self._store is not None:
+            return self._stored_frame(symbol, range_interval, start_epoch, end_epoch)
+
+        return self._fetch(
+            self._request(symbol, range_interval, start_epoch, end_epoch)
+        )
+
+    def quotes_many(
+        self,
+        symbols: Iterable[str],
+        period: Period,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> QuoteBatch:
+        """
+        Fetch quotes for many symbols concurrently over the shared channel.
+
+        Args:
+            symbols (Iterable[str]): Trading symbols to load
+            period (Period): Timeframe for candles
+            start (datetime | None): Start of the requested range
+            end (datetime | None): End of the requested range
+            max_concurrency (int): Maximum number of in-flight requests
+
+        Returns:
+            QuoteBatch: Frames per loaded symbol and errors per failed one
+        """
+        return fetch_many(
+            lambda symbol: self.quote_frame(symbol, period, start, end),
+            symbols,
+            max_concurrency,
+        )
+
+    def iter_quotes(
+        self,
+        symbol: str,
+        period: Period,
+        start: datetime,
+        end: datetime | None = None,
+        chunk: timedelta | None = None,
+    ) -> Iterator[QuoteFrame]:
+        """
+        Stream a long history as a sequence of ``QuoteFrame`` chunks.
+
+        The window is split into ``chunk``-sized Start/End sub-requests.
+        While the caller processes one chunk, the request for the next
+        chunk is already in flight, and only these two chunks are held
+        in memory at a time.
+
+        Args:
+            symbol (str): Trading symbol
+            period (Period): Timeframe for candles
+            start (datetime): Start of the history
+            end (datetime | None): End of the history, defaults to now
+            chunk (timedelta | None): Time span per sub-request. Defaults
+                to a span of roughly 10k candles for the period.
+
+        Yields:
+            QuoteFrame: Non-empty chunks in chronological order, without
+                overlapping candles
+
+        Example:
+            >>> for frame in provider.iter_quotes(
+            ...     "BTC-USD", Period.MINUTELY, datetime(2020, 1, 1, tzinfo=timezone.utc)
+            ... ):
+            ...     process(frame.close)
+        """
         range_interval = find_range_interval(period)
+        step = int((chunk or default_chunk(period)).total_seconds())
+        if step <= 0:
+            raise ValueError("chunk must be a positive duration")
+
+        lo = to_epoch(start)
+        hi = to_epoch(end if end is not None else datetime.now(timezone.utc))
+        bounds = [(t, min(t + step, hi)) for t in range(lo, hi, step)] or [(lo, hi)]
+
+        def fetch(window: Tuple[int, int]) -> QuoteFrame:
+            lower, upper = window
+            frame = self._fetch(self._request(symbol, range_interval, lower, upper))
+            # Neighbouring sub-requests share their boundary candle, keep it
+            # only in the later chunk.
+            side = "right" if upper == hi else "left"
+            first = int(np.searchsorted(frame.timestamp, lower, side="left"))
+            last = int(np.searchsorted(frame.timestamp, upper, side=side))
+            return frame[first:last]
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(fetch, bounds[0])
+            try:
+                for window in bounds[1:]:
+                    current = pending.result()
+                    pending = pool.submit(fetch, window)
+                    if len(current):
+                        yield current
+                current = pending.result()
+                if len(current):
+                    yield current
+            finally:
+                pending.cancel()
+
+    def _request(
+        self,
+        symbol: str,
+        range_interval: RangeInterval,
+        start: int | None,
+        end: int | None,
+    ) -> market_pb2.GetProductInfoRequest:
+        return product_info_request(self._source, symbol, range_interval, start, end)
+
+    def _fetch(self, req: market_pb2.GetProductInfoRequest) -> QuoteFrame:
         try:
-            stub = market_pb2_grpc.MarketServiceStub(self._channel)
-            req = market_pb2.GetProductInfoRequest(
-                Ticker=symbol,
-                Range=range_interval.range,
-                Interval=range_interval.interval,
-                Indicator="quote",
-                Source=self._source.value,
-            )
-            if start is not None:
-                req.Start.CopyFrom(to_google_timestamp(start))
-            if end is not None:
-                req.End.CopyFrom(to_google_timestamp(end))
-            response = stub.GetProductInfo(req)
+            response = self._caller(self._market.GetProductInfo, req)
         except Exception as err:
             raise RuntimeError(f"request failed: {err}") from err
 
-        quotes = []
-        for q in response.Quote:
-            ts = q.Timestamp.ToDatetime().replace(tzinfo=timezone.utc)
-            price = q.ProductInfo.Price
-            quotes.append(
-                Quote(
-                    timestamp=ts,
-                    high=price.High,
-                    low=price.Low,
-                    open=price.Open,
-                    close=price.Close,
-                    volume=price.Volume,
+        return decode_quotes(response)
+
+    def _stored_frame(
+        self,
+        symbol: str,
+        range_interval: RangeInterval,
+        start: int | None,
+        end: int | None,
+    ) -> QuoteFrame:
+        """
+        Serve quotes from the disk store, fetching only missing ranges.
+
+        Without an explicit ``start`` the window is derived from the
+        period's default range (e.g. one year for daily candles).
+        """
+        window_end = end if end is not None else to_epoch(datetime.now(timezone.utc))
+        window_start = start
+        if window_start is None:
+            duration = range_duration(range_interval.range)
+            if duration is not None:
+                window_start = window_end - int(duration.total_seconds())
+
+        key = (self._source.value, symbol, range_interval.interval)
+        stored = self._store.load(*key)
+
+        if stored is None:
+            frame = self._fetch(self._request(symbol, range_interval, start, end))
+            stored = self._store.save(*key, frame, window_start, window_end)
+        else:
+            gaps = stored.missing(window_start, window_end)
+            if gaps:
+                fetched = [
+                    self._fetch(self._request(symbol, range_interval, lo, hi))
+                    for lo, hi in gaps
+                ]
+                coverage_start = (
+                    None
+                    if stored.start is None or window_start is None
+                    else min(stored.start, window_start)
+                )
+                stored = self._store.save(
+                    *key,
+                    QuoteFrame.merge(stored.frame, *fetched),
+                    coverage_start,
+                    max(stored.end, window_end),
                 )
-            )
-        return quotes
+
+        frame = stored.frame
+        lo = 0
+        if window_start is not None:
+            lo = int(np.searchsorted(frame.timestamp, window_start, side="left"))
+        hi = int(np.searchsorted(frame.timestamp, window_end, side="right"))
+        return frame[lo:hi]
 
     def authenticate(self, token: str) -> None:
         self._token = token
@@ -74,17 +274,10 @@ class Provider:
         self, id: str, symbol: str, action: ActionSeries, amount: float
     ) -> None:
         try:
-            a = trade_pb2.Short
-            if action.action == ActionType.LONG:
-                a = trade_pb2.Long
-            task = model_pb2.Task(TaskId=id, Ticker=symbol)
-            req = trade_pb2.ExecuteTradeRequest(
-                Task=task,
-                Action=a,
-                Quantity=amount,
-            )
+            req = trade_request(id, symbol, action.action, amount)
             meta = (("authorization", f"Bearer {self._token}"),)
-            stub = trade_pb2_grpc.TradeServiceStub(self._channel)
-            trade = stub.ExecuteTrade(req, metadata=meta)
+            trade = self._trade.ExecuteTrade(
+                req, metadata=meta, timeout=self._caller.policy.timeout
+            )
         except Exception as err:
             return
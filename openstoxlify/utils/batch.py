@@ -0,0 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable
+
+from ..models.frame import QuoteBatch, QuoteFrame
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def fetch_many(
+    fetch: Callable[[str], QuoteFrame],
+    symbols: Iterable[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> QuoteBatch:
+    """
+    Run ``fetch`` for every symbol on a bounded thread pool.
+
+    Failures are collected per symbol instead of aborting the batch.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    unique = list(dict.fromkeys(symbols))
+    batch = QuoteBatch()
+    if not unique:
+        return batch
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(unique))) as pool:
+        futures = {pool.submit(fetch, symbol): symbol for symbol in unique}
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                batch.frames[symbol] = future.result()
+            except Exception as err:
+                batch.errors[symbol] = err
+
+    batch.frames = {s: batch.frames[s] for s in unique if s in batch.frames}
+    return batch
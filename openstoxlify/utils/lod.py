@@ -0,0 +1,135 @@
+import numpy as np
+
+from ..models.frame import QuoteFrame
+
+
+def ohlc_buckets(frame: QuoteFrame, buckets: int) -> QuoteFrame:
+    """
+    Re-aggregate candles into at most ``buckets`` equal time spans.
+
+    Each bucket becomes one candle with the first open, the highest
+    high, the lowest low, the last close and the summed volume of the
+    candles in it, stamped with the timestamp of its first candle.
+    Empty buckets are dropped.
+
+    Args:
+        frame (QuoteFrame): Candles to aggregate
+        buckets (int): Maximum number of candles in the result
+
+    Returns:
+        QuoteFrame: The aggregated candles, or ``frame`` itself when it
+            already has no more than ``buckets`` rows
+
+    Example:
+        >>> ohlc_buckets(minute_frame, 1200)  # one candle per pixel column
+    """
+    n = len(frame)
+    if buckets < 1:
+        raise ValueError("buckets must be at least 1")
+    if n <= buckets:
+        return frame
+
+    ts = frame.timestamp
+    edges = np.linspace(ts[0], ts[-1], buckets + 1)[1:-1]
+    starts = np.unique(np.concatenate(([0], np.searchsorted(ts, edges, side="left"))))
+    ends = np.append(starts[1:] - 1, n - 1)
+
+    return QuoteFrame(
+        ts[starts],
+        frame.open[starts],
+        np.maximum.reduceat(frame.high, starts),
+        np.minimum.reduceat(frame.low, starts),
+        frame.close[ends],
+        np.add.reduceat(frame.volume, starts),
+    )
+
+
+def minmax(values: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Indices of the minimum and maximum of each of ``buckets`` slices.
+
+    Keeps the envelope of the series, which is what filled areas and
+    bars show at low zoom. The first and last points are always kept.
+
+    Args:
+        values (np.ndarray): Series values
+        buckets (int): Number of equal-length slices
+
+    Returns:
+        np.ndarray: Sorted indices of at most ``2 * buckets + 2`` points
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    if buckets < 1:
+        raise ValueError("buckets must be at least 1")
+    if n <= 2 * buckets:
+        return np.arange(n)
+
+    size = -(-n // buckets)
+    rows = -(-n // size)
+    padded = np.full(rows * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(rows, size)
+    missing = np.isnan(padded)
+    offsets = np.arange(rows) * size
+    lows = np.where(missing, np.inf, padded).argmin(axis=1) + offsets
+    highs = np.where(missing, -np.inf, padded).argmax(axis=1) + offsets
+    return np.unique(np.concatenate(([0, n - 1], lows, highs)))
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Picks ``threshold`` points that keep the visual shape of a line:
+    from each bucket, the point forming the largest triangle with the
+    previously chosen point and the average of the next bucket.
+
+    Args:
+        x (np.ndarray): Increasing x coordinates (e.g. epoch seconds)
+        y (np.ndarray): Values
+        threshold (int): Number of points to keep
+
+    Returns:
+        np.ndarray: Sorted indices of the kept points, including the
+            first and the last one
+
+    Note:
+        See Steinarsson, "Downsampling Time Series for Visual
+        Representation" (2013).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    # Areas are translation invariant; shifting keeps the prefix sums of
+    # epoch-second coordinates well within float64 precision.
+    x = x - x[0]
+
+    bounds = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(
+        np.int64
+    ) + 1
+    bounds[-1] = n - 1
+    # Bucket averages from prefix sums; the last "bucket" is the last point.
+    cx = np.concatenate(([0.0], np.cumsum(x)))
+    cy = np.concatenate(([0.0], np.cumsum(y)))
+    lo = bounds[1:]
+    hi = np.append(bounds[2:], n)
+    counts = hi - lo
+    avg_x = (cx[hi] - cx[lo]) / counts
+    avg_y = (cy[hi] - cy[lo]) / counts
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = bounds[i], bounds[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y[i] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
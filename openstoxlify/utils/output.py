@@ -1,12 +1,41 @@
 import json
+import sys
 
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, List, Sequence, TextIO, Tuple
+
+import numpy as np
 from utcnow import utcnow
 
-from ..models.output import Output, PlotOut, QuoteOut, QuotesOut, StrategyOut
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..models.output import PlotOut
 from ..context import Context
 from ..models.enum import PlotType
+from ..models.frame import QuoteFrame
+from ..models.model import PlotData
+from ..models.store import (
+    ACTIONS,
+    ACTION_CODES,
+    SeriesView,
+    SignalView,
+    _round_trips,
+)
 
 from .period import find_range_interval
+from .time import to_epoch_array
+
+CHUNK_ROWS = 8_192
+BACKENDS = ("json", "orjson")
+DEFAULT_BACKEND = "json"
+FORMATS = ("json", "json-v2", "npz")
+SCHEMA_VERSION = 2
+
+_ACTION_VALUES = {code: action.value for code, action in ACTIONS.items()}
+_NON_FINITE = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
 
 
 def build_plots(ctx: Context, plot_type: PlotType):
@@ -20,35 +49,570 @@ def build_plots(ctx: Context, plot_type: PlotType):
     ]
 
 
-def output(ctx: Context):
-    quotes = QuotesOut(
-        ticker=ctx.symbol(),
-        interval=find_range_interval(ctx.period()).interval,
-        provider=ctx.provider().source(),
-        data=[
-            QuoteOut(
-                timestamp=utcnow.get(q.timestamp.isoformat()),
-                open=q.open,
-                high=q.high,
-                low=q.low,
-                close=q.close,
-                volume=q.volume,
-            )
-            for q in ctx.quotes()
-        ],
+def _series_columns(plot: PlotData) -> Tuple[np.ndarray, np.ndarray]:
+    """Epoch timestamps and values of a plot, without copying stored columns."""
+    if isinstance(plot.data, SeriesView):
+        return plot.data.timestamps, plot.data.values
+    ts = to_epoch_array([item.timestamp for item in plot.data])
+    return ts, np.array([item.value for item in plot.data], np.float64)
+
+
+def _signal_columns(ctx: Context) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Epoch timestamps, action codes and amounts of the context's signals."""
+    signals = ctx.signals()
+    if isinstance(signals, SignalView):
+        return signals.timestamps, signals.actions, signals.amounts
+    return (
+        to_epoch_array([s.timestamp for s in signals]),
+        np.array([ACTION_CODES[s.action] for s in signals], np.int8),
+        np.array([s.amount for s in signals], np.float64),
     )
 
-    out = Output(
-        histogram=build_plots(ctx, PlotType.HISTOGRAM),
-        line=build_plots(ctx, PlotType.LINE),
-        area=build_plots(ctx, PlotType.AREA),
-        strategy=[
-            StrategyOut(
-                label="default",
-                data=[item.to_dict() for item in ctx.signals()],
+
+def _originals(items: Sequence) -> Dict[int, datetime]:
+    """Rows whose datetime is not reproduced by its epoch-second timestamp."""
+    if isinstance(items, (SeriesView, SignalView)):
+        return items.originals
+    return {
+        i: item.timestamp
+        for i, item in enumerate(items)
+        if not _round_trips(item.timestamp)
+    }
+
+
+def _header(ctx: Context) -> Dict[str, str]:
+    return {
+        "ticker": ctx.symbol(),
+        "interval": find_range_interval(ctx.period()).interval,
+        "provider": ctx.provider().source(),
+    }
+
+
+class TimestampFormatter:
+    """
+    Vectorized epoch-seconds to ISO 8601 conversion with reuse.
+
+    Produces the same ``YYYY-MM-DDTHH:MM:SS.ffffffZ`` strings as
+    ``utcnow.get()``. The first array formatted (normally the quote
+    timestamps) is kept, and later arrays whose timestamps are all in
+    it, such as indicator series and signals, reuse its strings instead
+    of being formatted again.
+    """
+
+    def __init__(self):
+        self._timestamps: np.ndarray | None = None
+        self._strings: List[str] = []
+
+    def format(
+        self, timestamps: np.ndarray, originals: Dict[int, datetime] | None = None
+    ) -> List[str]:
+        """
+        ISO strings of ``timestamps``.
+
+        Rows in ``originals`` are formatted from the stored datetime
+        instead, so naive and sub-second timestamps keep their value.
+        """
+        strings = self._format(timestamps)
+        if originals:
+            strings = list(strings)
+            for i, timestamp in originals.items():
+                strings[i] = utcnow.get(timestamp.isoformat())
+        return strings
+
+    def _format(self, timestamps: np.ndarray) -> List[str]:
+        ts = np.asarray(timestamps, dtype=np.int64)
+        known = self._timestamps
+        if known is not None and len(known) and len(ts):
+            pos = np.minimum(np.searchsorted(known, ts), len(known) - 1)
+            if np.array_equal(known[pos], ts):
+                strings = self._strings
+                return [strings[i] for i in pos.tolist()]
+
+        strings: List[str] = []
+        for lo in range(0, len(ts), CHUNK_ROWS):
+            seconds = ts[lo : lo + CHUNK_ROWS].astype("datetime64[s]")
+            iso = np.datetime_as_string(seconds.astype("datetime64[us]"), unit="us")
+            strings.extend([s + "Z" for s in iso.tolist()])
+        if known is None and bool(np.all(ts[1:] >= ts[:-1])):
+            self._timestamps, self._strings = ts, strings
+        return strings
+
+
+def _numbers(values: np.ndarray) -> List[str]:
+    """JSON literals for floats, matching ``json.dumps``."""
+    out = list(map(repr, values.tolist()))
+    if not bool(np.isfinite(values).all()):
+        for i in np.flatnonzero(~np.isfinite(values)).tolist():
+            out[i] = _NON_FINITE[out[i]]
+    return out
+
+
+class JsonWriter:
+    """
+    Streams the ``Output`` document to a text stream section by section.
+
+    Rows are encoded ``CHUNK_ROWS`` at a time straight from the columnar
+    stores, so no per-point dictionaries or dataclasses are kept and the
+    document is never held in memory as one string.
+
+    Args:
+        stream (TextIO): Destination, e.g. ``sys.stdout`` or an open file
+        backend (str | None): ``"json"`` (standard library, the
+            default) or ``"orjson"``
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If ``"orjson"`` is requested but not installed
+
+    Note:
+        orjson is opt-in because its output is not byte-identical: it
+        omits the spaces after separators and writes non-finite floats
+        as ``null``, where the standard library backend writes
+        ``NaN``/``Infinity`` like ``json.dumps``.
+    """
+
+    def __init__(self, stream: TextIO, backend: str | None = None):
+        backend = backend or DEFAULT_BACKEND
+        if backend not in BACKENDS:
+            raise ValueError(f"unknown JSON backend: {backend}")
+        if backend == "orjson" and orjson is None:
+            raise ImportError("the orjson backend requires the orjson package")
+
+        self._write = stream.write
+        self._orjson = backend == "orjson"
+        self._timestamps = TimestampFormatter()
+
+    def _rows(self, keys: Sequence[str], columns: Sequence[Any]) -> None:
+        """
+        Write ``{key: value, ...}`` objects for parallel columns.
+
+        The first column holds the ISO timestamp strings. Float columns
+        are NumPy arrays; other columns are lists of JSON literals for
+        the standard library backend and plain values for orjson.
+        """
+        n = len(columns[0])
+        template = (
+            '{"timestamp": "%s"' + "".join(f', "{key}": %s' for key in keys[1:]) + "}"
+        )
+
+        for lo in range(0, n, CHUNK_ROWS):
+            hi = min(lo + CHUNK_ROWS, n)
+            if lo:
+                self._write(", ")
+            if self._orjson:
+                chunk = [
+                    col[lo:hi].tolist() if isinstance(col, np.ndarray) else col[lo:hi]
+                    for col in columns
+                ]
+                rows = [dict(zip(keys, row)) for row in zip(*chunk)]
+                self._write(orjson.dumps(rows)[1:-1].decode())
+            else:
+                chunk = [
+                    _numbers(col[lo:hi]) if isinstance(col, np.ndarray) else col[lo:hi]
+                    for col in columns
+                ]
+                self._write(", ".join(template % row for row in zip(*chunk)))
+
+    def _plots(self, ctx: Context, plot_type: PlotType) -> None:
+        self._write("[")
+        for i, plot in enumerate(ctx.plots().get(plot_type.value, [])):
+            ts, values = _series_columns(plot)
+            self._write(
+                f'{", " if i else ""}{{"label": {json.dumps(plot.label)}, "data": ['
             )
-        ],
-        quotes=quotes,
-    )
+            if len(ts):
+                times = self._timestamps.format(ts, _originals(plot.data))
+                self._rows(("timestamp", "value"), (times, values))
+            self._write(f'], "screen_index": {int(plot.screen_index)}}}')
+        self._write("]")
+
+    def _strategy(self, ctx: Context) -> None:
+        ts, codes, amounts = _signal_columns(ctx)
+
+        self._write('[{"label": "default", "data": [')
+        if len(ts):
+            times = self._timestamps.format(ts, _originals(ctx.signals()))
+            actions = [_ACTION_VALUES[code] for code in codes.tolist()]
+            quoted = actions if self._orjson else [f'"{a}"' for a in actions]
+            self._rows(
+                ("timestamp", "action", "amount"),
+                (times, quoted, amounts),
+            )
+        self._write("]}]")
+
+    def write(self, ctx: Context) -> None:
+        """Write the complete document for ``ctx`` followed by a newline."""
+        frame = QuoteFrame.from_quotes(ctx.quotes())
+        quote_times = self._timestamps.format(frame.timestamp)
+
+        self._write('{"histogram": ')
+        self._plots(ctx, PlotType.HISTOGRAM)
+        self._write(', "line": ')
+        self._plots(ctx, PlotType.LINE)
+        self._write(', "area": ')
+        self._plots(ctx, PlotType.AREA)
+        self._write(', "strategy": ')
+        self._strategy(ctx)
+
+        self._write(', "quotes": {')
+        for key, value in _header(ctx).items():
+            self._write(f'"{key}": {json.dumps(value)}, ')
+        self._write('"data": [')
+        if len(frame):
+            self._rows(
+                ("timestamp",) + QuoteFrame.COLUMNS[1:],
+                [quote_times] + [getattr(frame, c) for c in QuoteFrame.COLUMNS[1:]],
+            )
+        self._write("]}}\n")
+
+
+class ColumnarJsonWriter(JsonWriter):
+    """
+    Streams the columnar version 2 JSON layout of the ``Output`` document.
+
+    Timestamps are written once, as a sorted ``timestamp`` column of
+    epoch seconds shared by every series. Each series is a set of
+    parallel value arrays placed on that axis either by ``offset`` (the
+    series covers ``timestamp[offset:offset + n]``, as quotes and most
+    indicators do) or by an explicit ``index`` array::
+
+        {"version": 2, "timestamp": [...],
+         "histogram": [{"label", "screen_index", "offset" | "index", "value"}],
+         "line": [...], "area": [...],
+         "strategy": [{"label", "offset" | "index", "action", "amount"}],
+         "quotes": {"ticker", "interval", "provider", "offset" | "index",
+                    "open", "high", "low", "close", "volume"}}
+
+    Actions are ``ACTION_CODES`` (LONG=1, SHORT=-1, HOLD=0). Use
+    ``read_json_v2()`` to load it.
+
+    Args:
+        stream (TextIO): Destination, e.g. ``sys.stdout`` or an open file
+        backend (str | None): ``"json"`` (default) or ``"orjson"``
+    """
+
+    def _value(self, value: Any) -> str:
+        if self._orjson:
+            return orjson.dumps(value).decode()
+        return json.dumps(value, separators=(",", ":"))
+
+    def _array(self, values: np.ndarray) -> None:
+        self._write("[")
+        for lo in range(0, len(values), CHUNK_ROWS):
+            chunk = self._value(values[lo : lo + CHUNK_ROWS].tolist())
+            self._write(f",{chunk[1:-1]}" if lo else chunk[1:-1])
+        self._write("]")
+
+    def _fields(self, fields: Dict[str, Any]) -> None:
+        for i, (key, value) in enumerate(fields.items()):
+            self._write(f'{"," if i else ""}"{key}":')
+            if isinstance(value, np.ndarray):
+                self._array(value)
+            else:
+                self._write(self._value(value))
+
+    def write(self, ctx: Context) -> None:
+        """Write the complete document for ``ctx`` followed by a newline."""
+        frame = QuoteFrame.from_quotes(ctx.quotes())
+        plot_types = (PlotType.HISTOGRAM, PlotType.LINE, PlotType.AREA)
+        plots = {
+            plot_type: [
+                (plot, _series_columns(plot))
+                for plot in ctx.plots().get(plot_type.value, [])
+            ]
+            for plot_type in plot_types
+        }
+        signal_ts, codes, amounts = _signal_columns(ctx)
+
+        timestamps = [frame.timestamp, signal_ts]
+        for series in plots.values():
+            timestamps.extend(ts for _, (ts, _) in series)
+        axis = np.unique(np.concatenate(timestamps).astype(np.int64))
+
+        self._write(f'{{"version":{SCHEMA_VERSION},"timestamp":')
+        self._array(axis)
+        for plot_type in plot_types:
+            self._write(f',"{plot_type.value}":[')
+            for i, (plot, (ts, values)) in enumerate(plots[plot_type]):
+                self._write("," if i else "")
+                self._write("{")
+                self._fields(
+                    {
+                        "label": plot.label,
+                        "screen_index": int(plot.screen_index),
+                        **_positions(axis, ts),
+                        "value": np.asarray(values),
+                    }
+                )
+                self._write("}")
+            self._write("]")
+
+        self._write(',"strategy":[{')
+        self._fields(
+            {
+                "label": "default",
+                **_positions(axis, signal_ts),
+                "action": np.asarray(codes),
+                "amount": np.asarray(amounts),
+            }
+        )
+        self._write('}],"quotes":{')
+        self._fields(
+            {
+                **_header(ctx),
+                **_positions(axis, frame.timestamp),
+                **{name: getattr(frame, name) for name in QuoteFrame.COLUMNS[1:]},
+            }
+        )
+        self._write("}}\n")
+
+
+def _positions(axis: np.ndarray, timestamps: np.ndarray) -> Dict[str, Any]:
+    """Place a series on the shared axis, as an offset when it is contiguous."""
+    pos = np.searchsorted(axis, timestamps)
+    n = len(pos)
+    if n == 0 or (pos[-1] - pos[0] == n - 1 and bool(np.all(np.diff(pos) == 1))):
+        return {"offset": int(pos[0]) if n else 0}
+    return {"index": pos}
+
+
+class NpzWriter:
+    """
+    Writes the ``Output`` structure as typed columns in a NumPy ``.npz``.
+
+    Every plot type is stored Arrow-style as one concatenated
+    ``timestamp``/``value`` column pair plus ``offsets``, so the archive
+    holds the same fixed set of arrays however many series were plotted:
+
+    - ``quotes/ticker``, ``quotes/interval``, ``quotes/provider``: strings
+    - ``quotes/timestamp`` (int64 epoch seconds), ``quotes/open``,
+      ``quotes/high``, ``quotes/low``, ``quotes/close``, ``quotes/volume``
+    - ``<type>/label``, ``<type>/screen_index``: one entry per plot
+    - ``<type>/offsets``: plot ``i`` owns rows ``offsets[i]:offsets[i + 1]``
+    - ``<type>/timestamp``, ``<type>/value``: concatenated rows
+    - ``strategy/timestamp``, ``strategy/action`` (int8 ``ACTION_CODES``),
+      ``strategy/amount``
+
+    where ``<type>`` is ``histogram``, ``line`` or ``area``. Use
+    ``read_npz()`` to load it back into the ``Output`` layout.
+
+    Args:
+        stream (BinaryIO): Destination, e.g. ``sys.stdout.buffer`` or a
+            file opened in binary mode
+        compress (bool): Deflate the arrays. Smaller, but slower to
+            write and read. Defaults to False.
+    """
+
+    def __init__(self, stream: BinaryIO, compress: bool = False):
+        self._stream = stream
+        self._compress = compress
+
+    def columns(self, ctx: Context) -> Dict[str, np.ndarray]:
+        """The archive's arrays, keyed by name."""
+        arrays: Dict[str, np.ndarray] = {}
+
+        for plot_type in (PlotType.HISTOGRAM, PlotType.LINE, PlotType.AREA):
+            plots = ctx.plots().get(plot_type.value, [])
+            columns = [_series_columns(plot) for plot in plots]
+            sizes = [len(ts) for ts, _ in columns]
+            key = plot_type.value
+            arrays[f"{key}/label"] = np.array([p.label for p in plots], dtype=str)
+            arrays[f"{key}/screen_index"] = np.array(
+                [p.screen_index for p in plots], np.int64
+            )
+            arrays[f"{key}/offsets"] = np.concatenate(([0], np.cumsum(sizes)))
+            arrays[f"{key}/timestamp"] = np.concatenate(
+                [ts for ts, _ in columns] or [np.empty(0, np.int64)]
+            ).astype(np.int64, copy=False)
+            arrays[f"{key}/value"] = np.concatenate(
+                [values for _, values in columns] or [np.empty(0)]
+            ).astype(np.float64, copy=False)
+
+        ts, codes, amounts = _signal_columns(ctx)
+        arrays["strategy/timestamp"] = np.asarray(ts, np.int64)
+        arrays["strategy/action"] = np.asarray(codes, np.int8)
+        arrays["strategy/amount"] = np.asarray(amounts, np.float64)
+
+        for key, value in _header(ctx).items():
+            arrays[f"quotes/{key}"] = np.array(value, dtype=str)
+        frame = QuoteFrame.from_quotes(ctx.quotes())
+        for name in QuoteFrame.COLUMNS:
+            arrays[f"quotes/{name}"] = getattr(frame, name)
+
+        return arrays
+
+    def write(self, ctx: Context) -> None:
+        """Write the archive for ``ctx``."""
+        save = np.savez_compressed if self._compress else np.savez
+        save(self._stream, **self.columns(ctx))
+
+
+def read_npz(source: str | BinaryIO) -> Dict[str, Any]:
+    """
+    Load an archive written by ``NpzWriter`` into the ``Output`` layout.
+
+    ``histogram``, ``line`` and ``area`` are lists of ``{label,
+    screen_index, timestamp, value}``, ``strategy`` is a one-element list
+    of ``{label, timestamp, action, amount}`` and ``quotes`` holds
+    ``ticker``, ``interval``, ``provider`` and the ``QuoteFrame`` columns.
+    Values stay NumPy arrays, so nothing is parsed per point.
+
+    Args:
+        source (str | BinaryIO): Path or binary file object
+
+    Returns:
+        Dict[str, Any]: The document, with int64 epoch-second timestamps
+            and int8 ``ACTION_CODES`` actions
+
+    Example:
+        >>> doc = read_npz("result.npz")
+        >>> doc["line"][0]["value"].mean()
+    """
+    with np.load(source, allow_pickle=False) as npz:
+        doc: Dict[str, Any] = {}
+        for plot_type in (PlotType.HISTOGRAM, PlotType.LINE, PlotType.AREA):
+            key = plot_type.value
+            offsets = npz[f"{key}/offsets"]
+            ts, values = npz[f"{key}/timestamp"], npz[f"{key}/value"]
+            doc[key] = [
+                {
+                    "label": str(label),
+                    "screen_index": int(screen_index),
+                    "timestamp": ts[lo:hi],
+                    "value": values[lo:hi],
+                }
+                for label, screen_index, lo, hi in zip(
+                    npz[f"{key}/label"].tolist(),
+                    npz[f"{key}/screen_index"].tolist(),
+                    offsets[:-1].tolist(),
+                    offsets[1:].tolist(),
+                )
+            ]
+
+        doc["strategy"] = [
+            {
+                "label": "default",
+                "timestamp": npz["strategy/timestamp"],
+                "action": npz["strategy/action"],
+                "amount": npz["strategy/amount"],
+            }
+        ]
+        doc["quotes"] = {
+            key: str(npz[f"quotes/{key}"]) for key in ("ticker", "interval", "provider")
+        }
+        for name in QuoteFrame.COLUMNS:
+            doc["quotes"][name] = npz[f"quotes/{name}"]
+    return doc
+
+
+def read_json_v2(source: str | TextIO | BinaryIO) -> Dict[str, Any]:
+    """
+    Load a version 2 document written by ``ColumnarJsonWriter``.
+
+    Returns the same layout as ``read_npz()``: every series gets its own
+    ``timestamp`` array resolved from the shared axis, and values are
+    NumPy arrays.
+
+    Args:
+        source (str | TextIO | BinaryIO): Path or file object
+
+    Returns:
+        Dict[str, Any]: The document, with int64 epoch-second timestamps
+            and int8 ``ACTION_CODES`` actions
+
+    Raises:
+        ValueError: If the document is not a version 2 document
+
+    Example:
+        >>> doc = read_json_v2("result.json")
+        >>> doc["quotes"]["close"][-1]
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            text = f.read()
+    else:
+        text = source.read()
+    raw = orjson.loads(text) if orjson is not None else json.loads(text)
+    if raw.get("version") != SCHEMA_VERSION:
+        raise ValueError(f"not a version {SCHEMA_VERSION} document")
+
+    axis = np.asarray(raw["timestamp"], np.int64)
+
+    def place(series: Dict[str, Any], n: int) -> np.ndarray:
+        if "index" in series:
+            return axis[np.asarray(series["index"], np.int64)]
+        return axis[series["offset"] : series["offset"] + n]
+
+    doc: Dict[str, Any] = {}
+    for plot_type in (PlotType.HISTOGRAM, PlotType.LINE, PlotType.AREA):
+        doc[plot_type.value] = []
+        for plot in raw[plot_type.value]:
+            values = np.asarray(plot["value"], np.float64)
+            doc[plot_type.value].append(
+                {
+                    "label": plot["label"],
+                    "screen_index": plot["screen_index"],
+                    "timestamp": place(plot, len(values)),
+                    "value": values,
+                }
+            )
+
+    doc["strategy"] = []
+    for strategy in raw["strategy"]:
+        actions = np.asarray(strategy["action"], np.int8)
+        doc["strategy"].append(
+            {
+                "label": strategy["label"],
+                "timestamp": place(strategy, len(actions)),
+                "action": actions,
+                "amount": np.asarray(strategy["amount"], np.float64),
+            }
+        )
+
+    quotes = raw["quotes"]
+    doc["quotes"] = {key: quotes[key] for key in ("ticker", "interval", "provider")}
+    close = np.asarray(quotes["close"], np.float64)
+    doc["quotes"]["timestamp"] = place(quotes, len(close))
+    for name in QuoteFrame.COLUMNS[1:]:
+        doc["quotes"][name] = np.asarray(quotes[name], np.float64)
+    return doc
+
+
+def output(
+    ctx: Context,
+    stream: TextIO | BinaryIO | None = None,
+    backend: str | None = None,
+    format: str = "json",
+) -> None:
+    """
+    Write the context's quotes, plots and signals as one document.
+
+    Args:
+        ctx (Context): Context to export
+        stream (TextIO | BinaryIO | None): Destination, a text stream for
+            JSON and a binary one for npz. Defaults to ``sys.stdout``.
+        backend (str | None): JSON backend, ``"json"`` (default) or
+            ``"orjson"``. See ``JsonWriter`` for how their output differs.
+        format (str): ``"json"`` for the JSON document (``JsonWriter``),
+            ``"json-v2"`` for the columnar JSON layout
+            (``ColumnarJsonWriter``) or ``"npz"`` for typed NumPy columns
+            (``NpzWriter``). Defaults to ``"json"``.
+
+    Raises:
+        ValueError: If the format or backend is unknown
+
+    Example:
+        >>> with open("result.json", "w") as f:
+        ...     output(ctx, f)
+        >>> with open("result.npz", "wb") as f:
+        ...     output(ctx, f, format="npz")
+    """
+    if format not in FORMATS:
+        raise ValueError(f"unknown output format: {format}")
 
-    print(json.dumps(out.to_dict()))
+    if format == "npz":
+        NpzWriter(stream or sys.stdout.buffer).write(ctx)
+    elif format == "json-v2":
+        ColumnarJsonWriter(stream or sys.stdout, backend).write(ctx)
+    else:
+        JsonWriter(stream or sys.stdout, backend).write(ctx)
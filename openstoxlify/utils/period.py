@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Dict
 from ..models.model import Period, RangeInterval
 
@@ -18,3 +19,35 @@ def find_range_interval(period: Period) -> RangeInterval:
         raise Exception(f"invalid period mapping {period}")
 
     return range_interval
+
+
+def range_duration(range: str) -> timedelta | None:
+    dictionary: Dict[str, timedelta | None] = {
+        "1wk": timedelta(weeks=1),
+        "1y": timedelta(days=365),
+        "10y": timedelta(days=3650),
+        "max": None,
+    }
+
+    if range not in dictionary:
+        raise Exception(f"invalid range mapping {range}")
+
+    return dictionary[range]
+
+
+def default_chunk(period: Period) -> timedelta:
+    dictionary: Dict[Period, timedelta] = {
+        Period.MINUTELY: timedelta(days=7),
+        Period.QUINTLY: timedelta(days=30),
+        Period.HALFHOURLY: timedelta(days=180),
+        Period.HOURLY: timedelta(days=365),
+        Period.DAILY: timedelta(days=3650),
+        Period.WEEKLY: timedelta(days=36500),
+        Period.MONTHLY: timedelta(days=36500),
+    }
+
+    chunk = dictionary.get(period)
+    if chunk is None:
+        raise Exception(f"invalid period mapping {period}")
+
+    return chunk
@@ -0,0 +1,199 @@
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from ..draw import Canvas
+from ..models.frame import QuoteFrame
+from ..models.store import ACTION_CODES, PlotStore, SeriesView, SignalStore, SignalView
+from .time import to_epoch_array
+
+
+@dataclass(frozen=True)
+class ChartSeries:
+    """Columns of one plotted series in a ``ChartSnapshot``."""
+
+    plot_type: str
+    label: str
+    screen_index: int
+    timestamps: np.ndarray
+    values: np.ndarray
+
+
+@dataclass(frozen=True)
+class ChartSnapshot:
+    """
+    Picklable copy of the chart data of a Context.
+
+    Holds the quotes, plotted series and signals as NumPy columns and
+    offers the ``quotes()``, ``plots()``, ``signals()`` and
+    ``authenticated()`` methods that ``Canvas`` reads, so a chart can be
+    rendered in another process without the Context's provider.
+
+    Attributes:
+        quote_columns (Tuple[np.ndarray, ...]): Columns in
+            ``QuoteFrame.COLUMNS`` order
+        series (Tuple[ChartSeries, ...]): Plotted series in plot order
+        signal_columns (Tuple[np.ndarray, np.ndarray, np.ndarray]): Signal
+            epoch timestamps, action codes and amounts
+    """
+
+    quote_columns: Tuple[np.ndarray, ...]
+    series: Tuple[ChartSeries, ...]
+    signal_columns: Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+    @classmethod
+    def from_context(cls, ctx: Any) -> "ChartSnapshot":
+        """
+        Capture the quotes, plots and signals of a Context.
+
+        Columnar data is referenced, not copied; list-based plots and
+        signals are converted to columns.
+        """
+        frame = QuoteFrame.from_quotes(ctx.quotes())
+
+        series = []
+        for plot_type, plots in ctx.plots().items():
+            for plot in plots:
+                data = plot.data
+                if isinstance(data, SeriesView):
+                    ts, values = data.timestamps, data.values
+                else:
+                    ts = to_epoch_array([item.timestamp for item in data])
+                    values = np.fromiter(
+                        (item.value for item in data), np.float64, len(data)
+                    )
+                series.append(
+                    ChartSeries(plot_type, plot.label, plot.screen_index, ts, values)
+                )
+
+        signals = ctx.signals()
+        if isinstance(signals, SignalView):
+            signal_columns = (signals.timestamps, signals.actions, signals.amounts)
+        else:
+            signal_columns = (
+                to_epoch_array([s.timestamp for s in signals]),
+                np.array([ACTION_CODES[s.action] for s in signals], dtype=np.int8),
+                np.array([s.amount for s in signals], dtype=np.float64),
+            )
+
+        return cls(
+            quote_columns=tuple(getattr(frame, name) for name in QuoteFrame.COLUMNS),
+            series=tuple(series),
+            signal_columns=signal_columns,
+        )
+
+    def quotes(self):
+        return QuoteFrame(*self.quote_columns).quotes()
+
+    def plots(self):
+        store = PlotStore()
+        for s in self.series:
+            store.extend(s.plot_type, s.label, s.timestamps, s.values, s.screen_index)
+        return store.plots()
+
+    def signals(self):
+        store = SignalStore()
+        store.extend(*self.signal_columns)
+        return store.signals()
+
+    def authenticated(self) -> bool:
+        return False
+
+
+@dataclass
+class RenderBatch:
+    """
+    Result of ``render_many()``.
+
+    Attributes:
+        paths (List[str]): Charts written successfully, in input order
+        errors (Dict[str, Exception]): Failure per chart path
+    """
+
+    paths: List[str] = field(default_factory=list)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+
+def _init() -> None:
+    """Load matplotlib and its font cache once per worker process."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(1, 1))
+    FigureCanvasAgg(fig)
+    fig.text(0.5, 0.5, "0")
+    fig.canvas.draw()
+
+
+def _render(
+    job: Tuple[ChartSnapshot, str, str | None, float | None, Dict[str, Any]],
+) -> Exception | None:
+    snapshot, path, format, dpi, options = job
+    try:
+        Canvas(snapshot).render(path, format=format, dpi=dpi, **options)
+    except Exception as err:
+        return err
+    return None
+
+
+def render_many(
+    charts: Iterable[Tuple[Any, str | os.PathLike]],
+    format: str | None = None,
+    dpi: float | None = None,
+    max_workers: int | None = None,
+    **options: Any,
+) -> RenderBatch:
+    """
+    Render many charts to files on a pool of worker processes.
+
+    Every Context is captured as a ``ChartSnapshot`` in the calling
+    process and rendered with ``Canvas.render()`` in a worker. Workers
+    import matplotlib and warm its font cache once when they start, not
+    per chart. A failing chart is reported in ``errors`` and does not
+    stop the others.
+
+    Args:
+        charts (Iterable[Tuple[Any, str | os.PathLike]]): Pairs of a
+            Context (or ``ChartSnapshot``) and its destination path
+        format (str | None): Image format, defaults to the file extension
+        dpi (float | None): Resolution in dots per inch
+        max_workers (int | None): Number of worker processes, defaults
+            to the CPU count
+        **options: Keyword arguments for ``Canvas.draw()``
+
+    Returns:
+        RenderBatch: Written paths and errors per path
+
+    Example:
+        >>> batch = render_many(
+        ...     [(ctx, f"charts/{ctx.symbol()}.png") for ctx in contexts],
+        ...     dpi=120,
+        ...     lod=True,
+        ... )
+        >>> print(batch.errors)
+    """
+    jobs = []
+    for chart, path in charts:
+        if not isinstance(chart, ChartSnapshot):
+            chart = ChartSnapshot.from_context(chart)
+        jobs.append((chart, os.fspath(path), format, dpi, options))
+
+    batch = RenderBatch()
+    if not jobs:
+        return batch
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init) as executor:
+        for job, error in zip(jobs, executor.map(_render, jobs)):
+            if error is None:
+                batch.paths.append(job[1])
+            else:
+                batch.errors[job[1]] = error
+    return batch
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import List, Tuple
+
+import numpy as np
+
+from ..models.frame import QuoteFrame
+
+_DTYPES = (np.int64,) + (np.float64,) * (len(QuoteFrame.COLUMNS) - 1)
+
+
+@dataclass(frozen=True, slots=True)
+class SharedFrameHandle:
+    """Picklable reference to a ``SharedFrame`` for worker processes."""
+
+    name: str
+    rows: int
+
+
+def _columns(buffer, rows: int) -> List[np.ndarray]:
+    return [
+        np.ndarray((rows,), dtype=dtype, buffer=buffer, offset=i * rows * 8)
+        for i, dtype in enumerate(_DTYPES)
+    ]
+
+
+class SharedFrame:
+    """
+    Copy of a ``QuoteFrame`` in a single ``multiprocessing.shared_memory``
+    block.
+
+    Worker processes ``attach()`` to the block by name and read the
+    columns in place, so quotes are copied once per sweep instead of
+    being pickled for every task. The creating process owns the block
+    and releases it with ``close()``.
+
+    Example:
+        >>> with SharedFrame(frame) as shared:
+        ...     pool.submit(work, shared.handle)
+    """
+
+    def __init__(self, frame: QuoteFrame):
+        rows = len(frame)
+        size = max(rows * 8 * len(QuoteFrame.COLUMNS), 1)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        for target, column in zip(
+            _columns(self._shm.buf, rows),
+            (getattr(frame, c) for c in QuoteFrame.COLUMNS),
+        ):
+            target[:] = column
+        self.handle = SharedFrameHandle(name=self._shm.name, rows=rows)
+
+    def close(self) -> None:
+        """Release and remove the shared block."""
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach(handle: SharedFrameHandle) -> Tuple[shared_memory.SharedMemory, QuoteFrame]:
+    """
+    Open a ``SharedFrame`` from another process.
+
+    Returns:
+        Tuple[SharedMemory, QuoteFrame]: The attached block, which must
+            stay referenced while the frame is used, and a read-only
+            frame over it
+    """
+    # Pool workers share the creating process's resource tracker, which
+    # keeps a single registration per block until ``SharedFrame.close()``.
+    shm = shared_memory.SharedMemory(name=handle.name)
+    return shm, QuoteFrame(*_columns(shm.buf, handle.rows))
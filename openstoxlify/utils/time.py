@@ -1,4 +1,9 @@
-from datetime import datetime
+import calendar
+
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
 from google.protobuf.timestamp_pb2 import Timestamp
 
 
@@ -6,3 +11,33 @@ def to_google_timestamp(dt: datetime) -> Timestamp:
     ts = Timestamp()
     ts.FromDatetime(dt)
     return ts
+
+
+def to_epoch(dt: datetime) -> int:
+    """Convert a datetime to epoch seconds. Naive datetimes are read as UTC."""
+    return calendar.timegm(dt.utctimetuple())
+
+
+def from_epoch(seconds: int) -> datetime:
+    """Convert epoch seconds to a timezone-aware UTC datetime."""
+    return datetime.fromtimestamp(int(seconds), tz=timezone.utc)
+
+
+def to_epoch_array(timestamps: Any) -> np.ndarray:
+    """
+    Convert a sequence of timestamps to an int64 epoch-seconds array.
+
+    Accepts integer epoch arrays (returned without copying when already
+    int64), ``datetime64`` arrays and sequences of ``datetime`` objects.
+    """
+    if isinstance(timestamps, np.ndarray):
+        if timestamps.dtype.kind == "M":
+            return timestamps.astype("datetime64[s]").astype(np.int64)
+        if timestamps.dtype.kind in "iu":
+            return timestamps.astype(np.int64, copy=False)
+        if timestamps.dtype.kind != "O":
+            raise ValueError(f"unsupported timestamp dtype: {timestamps.dtype}")
+
+    return np.fromiter(
+        (to_epoch(ts) for ts in timestamps), dtype=np.int64, count=len(timestamps)
+    )
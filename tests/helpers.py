@@ -0,0 +1,70 @@
+"""Data, konteks dan strategi bersama untuk test suite"""
+
+import numpy as np
+
+from openstoxlify.backtest.worker import ReplayProvider
+from openstoxlify.cache.memory import QuoteCache
+from openstoxlify.context import Context
+from openstoxlify.indicators.trend import sma
+from openstoxlify.models.enum import Period, PlotType
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.providers.stoxlify.proto.market import market_pb2
+
+DAY = 86400
+JAN_1 = 1704067200
+
+
+def make_frame(n=400, seed=3):
+    """Candle harian random walk mulai 1 Januari 2024"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=n))
+    ts = JAN_1 + DAY * np.arange(n, dtype=np.int64)
+    return QuoteFrame(ts, close, close + 1, close - 1, close, np.ones(n))
+
+
+def replay_context(frame, symbol="BTC-USD"):
+    """Context yang memutar ulang ``frame`` dengan cache sendiri"""
+    ctx = Context(
+        [], ReplayProvider("test", frame), symbol, Period.DAILY, cache=QuoteCache()
+    )
+    ctx.quotes()
+    return ctx
+
+
+def make_context(n=50, seed=3, symbol="BTC-USD"):
+    """Context dengan quote, plot line/histogram/area dan sinyal"""
+    frame = make_frame(n, seed)
+    ts, close = frame.timestamp, frame.close
+    ctx = replay_context(frame, symbol)
+    ctx.plot_series("SMA 5", PlotType.LINE, ts[10:], sma(close, 5)[10:])
+    ctx.plot_series("Volume", PlotType.HISTOGRAM, ts, np.ones(n), screen_index=1)
+    ctx.plot_series("Band", PlotType.AREA, ts[::7], close[::7])
+    ctx.signals_from_masks(ts, close > 101, close < 99)
+    return ctx
+
+
+def make_response(timestamps):
+    """Response GetProductInfo dengan harga yang diturunkan dari timestamp"""
+    response = market_pb2.GetProductInfoResponse()
+    for ts in timestamps:
+        quote = response.Quote.add()
+        quote.Timestamp.seconds = ts
+        price = quote.ProductInfo.Price
+        price.Open = ts / DAY
+        price.High = ts / DAY + 1
+        price.Low = ts / DAY - 1
+        price.Close = ts / DAY + 0.5
+        price.Volume = 10.0
+    response.Count = len(timestamps)
+    return response
+
+
+def crossover(ctx, params):
+    """Strategi crossover SMA untuk sweep dan walk-forward"""
+    if not 0 < params["fast"] < params["slow"]:
+        raise ValueError("fast must be positive and shorter than slow")
+    frame = ctx.quote_frame()
+    fast = sma(frame.close, params["fast"])
+    slow = sma(frame.close, params["slow"])
+    with np.errstate(invalid="ignore"):
+        ctx.signals_from_masks(frame.timestamp, fast > slow, fast < slow)
@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import grpc
+
+from openstoxlify.models.contract import AsyncProvider as AsyncProviderProtocol
+from openstoxlify.models.enum import ActionType, DefaultProvider, Period
+from openstoxlify.models.series import ActionSeries
+from openstoxlify.providers.stoxlify.async_provider import AsyncProvider
+from openstoxlify.providers.stoxlify.proto.market import market_pb2_grpc
+from openstoxlify.providers.stoxlify.proto.trade import trade_pb2, trade_pb2_grpc
+
+from helpers import DAY, JAN_1, make_response
+
+
+class MarketServicer(market_pb2_grpc.MarketServiceServicer):
+    async def GetProductInfo(self, request, context):
+        if request.Ticker == "BROKEN":
+            await context.abort(grpc.StatusCode.NOT_FOUND, "unknown ticker")
+        return make_response([JAN_1 + i * DAY for i in range(5)])
+
+
+class TradeServicer(trade_pb2_grpc.TradeServiceServicer):
+    def __init__(self):
+        self.requests = []
+
+    async def ExecuteTrade(self, request, context):
+        self.requests.append((request, dict(context.invocation_metadata())))
+        return trade_pb2.Trade(TradeId="t-1")
+
+
+class TestAsyncProvider(unittest.IsolatedAsyncioTestCase):
+    """Test suite untuk AsyncProvider dengan server grpc.aio lokal"""
+
+    async def asyncSetUp(self):
+        """Jalankan server gRPC asyncio di port acak"""
+        self.server = grpc.aio.server()
+        self.trade = TradeServicer()
+        market_pb2_grpc.add_MarketServiceServicer_to_server(
+            MarketServicer(), self.server
+        )
+        trade_pb2_grpc.add_TradeServiceServicer_to_server(self.trade, self.server)
+        port = self.server.add_insecure_port("127.0.0.1:0")
+        await self.server.start()
+
+        self.provider = AsyncProvider(
+            DefaultProvider.YFinance, target=f"127.0.0.1:{port}"
+        )
+
+    async def asyncTearDown(self):
+        await self.provider.close()
+        await self.server.stop(None)
+
+    async def test_implements_protocol(self):
+        """Test AsyncProvider memenuhi protocol AsyncProvider"""
+        self.assertIsInstance(self.provider, AsyncProviderProtocol)
+
+    async def test_quote_frame(self):
+        """Test quote_frame() async mengembalikan QuoteFrame"""
+        frame = await self.provider.quote_frame("BTC-USD", Period.DAILY)
+
+        self.assertEqual(len(frame), 5)
+        self.assertEqual(frame.timestamp[0], JAN_1)
+
+        quotes = await self.provider.quotes("BTC-USD", Period.DAILY)
+        self.assertEqual(quotes[-1].close, frame.close[-1])
+
+    async def test_warm_up(self):
+        """Test warm_up() async menunggu channel READY"""
+        await self.provider.warm_up(timeout=5)
+
+        state = self.provider._connect().get_state()
+        self.assertEqual(state, grpc.ChannelConnectivity.READY)
+
+    async def test_stubs_created_once_per_channel(self):
+        """Test stub service dibuat sekali saat channel dibuka, bukan per call"""
+        stub = market_pb2_grpc.MarketServiceStub
+        with patch.object(market_pb2_grpc, "MarketServiceStub", wraps=stub) as spy:
+            await self.provider.quote_frame("BTC-USD", Period.DAILY)
+            await self.provider.quotes_many(["BTC-USD", "ETH-USD"], Period.DAILY)
+            self.assertEqual(spy.call_count, 1)
+
+            await self.provider.close()
+            await self.provider.quote_frame("BTC-USD", Period.DAILY)
+            self.assertEqual(spy.call_count, 2)
+
+    async def test_quotes_many(self):
+        """Test quotes_many() async mengumpulkan hasil dan error per symbol"""
+        batch = await self.provider.quotes_many(
+            ["BTC-USD", "ETH-USD", "BROKEN"], Period.DAILY, max_concurrency=2
+        )
+
+        self.assertEqual(list(batch.frames), ["BTC-USD", "ETH-USD"])
+        self.assertIsInstance(batch.errors["BROKEN"], RuntimeError)
+
+    async def test_quotes_many_propagates_cancellation(self):
+        """Test quotes_many() meneruskan CancelledError, bukan sebagai frame"""
+        quote_frame = self.provider.quote_frame
+
+        async def cancelled(symbol, *args):
+            if symbol == "ETH-USD":
+                raise asyncio.CancelledError()
+            return await quote_frame(symbol, *args)
+
+        with patch.object(self.provider, "quote_frame", cancelled):
+            with self.assertRaises(asyncio.CancelledError):
+                await self.provider.quotes_many(["BTC-USD", "ETH-USD"], Period.DAILY)
+
+    async def test_execute_sends_token(self):
+        """Test execute() async mengirim trade dengan token bearer"""
+        await self.provider.authenticate("secret")
+        await self.provider.execute(
+            "id", "BTC-USD", ActionSeries(None, ActionType.LONG, 2.0), 2.0
+        )
+
+        request, metadata = self.trade.requests[0]
+        self.assertEqual(request.Action, trade_pb2.Long)
+        self.assertEqual(request.Quantity, 2.0)
+        self.assertEqual(metadata["authorization"], "Bearer secret")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import numpy as np
+
+from openstoxlify.backtest.engine import backtest, run
+from openstoxlify.context import Context
+from openstoxlify.models.contract import Provider
+from openstoxlify.models.enum import ActionType, Period, PlotType
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.models.series import ActionSeries
+from openstoxlify.providers.stoxlify.proto.statistic import statistic_pb2
+
+from helpers import DAY, JAN_1
+
+
+class TestBacktest(unittest.TestCase):
+    """Test suite untuk engine backtest"""
+
+    def setUp(self):
+        """Setup delapan candle harian dengan harga close yang diketahui"""
+        closes = [10.0, 11.0, 12.0, 13.0, 12.0, 11.0, 12.0, 11.0]
+        self.ts = JAN_1 + DAY * np.arange(len(closes), dtype=np.int64)
+        self.frame = QuoteFrame(self.ts, closes, closes, closes, closes, closes)
+
+    def signal_columns(self):
+        bars = [1, 1, 3, 5, 6]
+        return (
+            np.append(self.ts[bars], JAN_1 - DAY),
+            [-1, 1, -1, 1, 1, 1],
+            [5.0, 2.0, 1.0, 0.0, 1.0, 9.0],
+        )
+
+    def test_positions_and_equity(self):
+        """Test posisi mengikuti sinyal terakhir per candle hingga sinyal berikutnya"""
+        result = run(self.frame, *self.signal_columns(), capital=1000.0)
+
+        self.assertEqual(result.position.tolist(), [0, 2, 2, -1, -1, 0, 1, 1])
+        self.assertEqual(
+            result.equity.tolist(),
+            [1000, 1000, 1002, 1004, 1005, 1006, 1006, 1005],
+        )
+        self.assertEqual(result.net_profit, 5.0)
+        self.assertEqual(result.max_drawdown, 1.0)
+
+    def test_hold_keeps_position(self):
+        """Test HOLD tidak mengubah posisi yang sedang terbuka"""
+        result = run(self.frame, self.ts[[0, 1, 2]], [1, 0, 0], [1.0, 0.0, 0.0])
+
+        self.assertEqual(result.position.tolist(), [1] * 8)
+        self.assertEqual(len(result.trades), 1)
+        self.assertFalse(result.trades.closed[0])
+
+        same_bar = run(self.frame, self.ts[[0, 0]], [-1, 0], [2.0, 0.0])
+        self.assertEqual(same_bar.position.tolist(), [-2] * 8)
+
+    def test_trades(self):
+        """Test trade dibentuk dari perubahan posisi"""
+        trades = run(self.frame, *self.signal_columns()).trades
+
+        self.assertEqual(trades.entry.tolist(), [1, 3, 6])
+        self.assertEqual(trades.exit.tolist(), [3, 5, 7])
+        self.assertEqual(trades.pnl.tolist(), [4.0, 2.0, -1.0])
+        self.assertEqual(trades.closed.tolist(), [True, True, False])
+
+    def test_fee_is_charged_on_traded_value(self):
+        """Test fee dikenakan pada nilai transaksi setiap perubahan posisi"""
+        result = run(self.frame, *self.signal_columns(), capital=1000.0, fee=0.01)
+
+        traded = 2 * 11 + 3 * 13 + 1 * 11 + 1 * 12
+        self.assertAlmostEqual(result.net_profit, 5.0 - 0.01 * traded)
+        self.assertAlmostEqual(result.trades.pnl[0], 4.0 - 0.01 * 2 * (11 + 13))
+
+    def test_statistic_message(self):
+        """Test statistic() mengisi pesan Statistic"""
+        stats = run(
+            self.frame, *self.signal_columns(), capital=1000.0, label="BTC-USD"
+        ).statistic()
+
+        self.assertIsInstance(stats, statistic_pb2.Statistic)
+        self.assertEqual((stats.Capital.Cur, stats.Capital.Num), ("USD", "1000.00"))
+        self.assertEqual(stats.NetProfit.Num, "5.00")
+        self.assertEqual(stats.PercentProfitable, "100.00")
+        self.assertEqual(stats.TotalClosedTrades.value, 2)
+        self.assertEqual(stats.TotalWinningTrades.value, 2)
+        self.assertEqual(stats.WinRate, "100.00")
+        self.assertEqual(stats.MaximumDrawdown.Num, "1.00")
+
+        details = stats.Details[0]
+        self.assertEqual(details.Label, "BTC-USD")
+        self.assertEqual(len(details.Trades), 2)
+        self.assertEqual(details.Trades[0].TradeType, statistic_pb2.TradeType.Long)
+        self.assertEqual(details.Trades[0].PnL, "18.18")
+        self.assertEqual(details.Trades[1].TradeType, statistic_pb2.TradeType.Short)
+        self.assertEqual(details.Trades[1].PnL, "15.38")
+        self.assertEqual(details.Trades[1].Capital.Num, "13.00")
+
+    def test_statistic_counts_winning_trades(self):
+        """Test PercentProfitable adalah persentase trade yang untung"""
+        stats = run(self.frame, self.ts[[3, 4, 5]], [1, -1, 1], [1.0, 1.0, 0.0])
+
+        stats = stats.statistic()
+        self.assertEqual(stats.TotalClosedTrades.value, 2)
+        self.assertEqual(stats.TotalWinningTrades.value, 1)
+        self.assertEqual(stats.PercentProfitable, "50.00")
+        self.assertEqual(stats.WinRate, "50.00")
+
+    def test_statistic_details_match_trade_log(self):
+        """Test detail trade sama dengan pesan yang dibangun satu per satu"""
+        closes = np.array([1.0, 2.5, 1e150, -3.25, 7.0, 7.0])
+        frame = QuoteFrame(self.ts[:6], closes, closes, closes, closes, closes)
+        result = run(frame, self.ts[:6], [1, -1, 1, -1, 1, -1], 2.0, currency="IDR")
+
+        expected = statistic_pb2.Trades(Label="default")
+        for i in range(len(result.trades) - 1):
+            price = (result.trades.entry_price[i], result.trades.exit_price[i])
+            expected.Trades.add(
+                Capital={"Cur": "IDR", "Num": f"{2 * price[0]:.2f}"},
+                OpenPosition={"Cur": "IDR", "Num": f"{price[0]:.2f}"},
+                ClosePosition={"Cur": "IDR", "Num": f"{price[1]:.2f}"},
+                TradeType=(
+                    statistic_pb2.TradeType.Long
+                    if result.trades.size[i] > 0
+                    else statistic_pb2.TradeType.Short
+                ),
+                PnL=f"{result.trades.returns[i]:.2f}",
+            )
+
+        self.assertEqual(result.statistic().Details[0], expected)
+
+    def test_no_signals(self):
+        """Test backtest tanpa sinyal menghasilkan equity datar"""
+        result = run(self.frame, [], [], [])
+
+        self.assertTrue(np.all(result.equity == result.capital))
+        self.assertEqual(len(result.trades), 0)
+        self.assertEqual(result.statistic().WinRate, "0.00")
+
+    def test_backtest_context_and_plot(self):
+        """Test backtest() memakai quote dan sinyal dari Context"""
+        ctx = Context(["file.py"], Mock(spec=Provider), "BTC-USD", Period.DAILY)
+        ctx._quotes = self.frame.to_list()
+        ctx.signal(
+            ActionSeries(datetime(2024, 1, 2, tzinfo=timezone.utc), ActionType.LONG, 1)
+        )
+
+        result = backtest(ctx, capital=100.0)
+        result.plot(ctx)
+
+        self.assertEqual(result.net_profit, 0.0)
+        self.assertEqual(result.statistic().Details[0].Label, "BTC-USD")
+        equity = ctx.plots()[PlotType.LINE.value][0]
+        self.assertEqual((equity.label, equity.screen_index), ("Equity", 1))
+        self.assertEqual(equity.data.values.tolist(), result.equity.tolist())
+        self.assertEqual(ctx.plots()[PlotType.AREA.value][0].screen_index, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+
+import numpy as np
+
+from openstoxlify.cache.memory import CacheKey, QuoteCache
+from openstoxlify.models.enum import Period
+from openstoxlify.models.frame import QuoteFrame
+
+
+def make_frame(n: int) -> QuoteFrame:
+    values = np.arange(n, dtype=np.float64)
+    return QuoteFrame(np.arange(n), values, values, values, values, values)
+
+
+class TestQuoteCache(unittest.TestCase):
+    """Test suite untuk QuoteCache class"""
+
+    def setUp(self):
+        """Setup cache dengan clock yang bisa dikontrol"""
+        self.now = 0.0
+        self.cache = QuoteCache(max_bytes=10_000, ttl=60, clock=lambda: self.now)
+        self.key = CacheKey.of("YFinance", "BTC-USD", Period.DAILY)
+
+    def test_key_includes_range(self):
+        """Test CacheKey membedakan period dan rentang waktu"""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.assertNotEqual(
+            self.key, CacheKey.of("YFinance", "BTC-USD", Period.DAILY, start)
+        )
+        self.assertNotEqual(self.key, CacheKey.of("YFinance", "BTC-USD", Period.HOURLY))
+        self.assertEqual(self.key, CacheKey.of("YFinance", "BTC-USD", Period.DAILY))
+
+    def test_hit_and_miss_counters(self):
+        """Test counter hit/miss tercatat dengan benar"""
+        self.assertIsNone(self.cache.get(self.key))
+        frame = make_frame(10)
+        self.cache.put(self.key, frame)
+
+        self.assertIs(self.cache.get(self.key), frame)
+
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertEqual(stats.entries, 1)
+        self.assertEqual(stats.nbytes, frame.nbytes)
+
+    def test_lru_eviction_by_bytes(self):
+        """Test entry paling lama tidak dipakai dievict saat melebihi budget"""
+        keys = [CacheKey.of("YFinance", s, Period.DAILY) for s in ("A", "B", "C")]
+        for key in keys:
+            self.cache.put(key, make_frame(100))  # 4800 bytes each
+
+        self.assertIsNone(self.cache.get(keys[0]))
+        self.assertIsNotNone(self.cache.get(keys[1]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+        self.assertEqual(self.cache.stats().evictions, 1)
+
+    def test_oversized_frame_not_stored(self):
+        """Test frame yang lebih besar dari budget tidak disimpan"""
+        self.cache.put(self.key, make_frame(1000))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_ttl_expiry(self):
+        """Test entry kedaluwarsa setelah TTL"""
+        self.cache.put(self.key, make_frame(10))
+        self.now = 61.0
+
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertEqual(self.cache.stats().expirations, 1)
+
+    def test_configure_keeps_ttl(self):
+        """Test configure() tanpa ttl tidak mengubah TTL"""
+        self.cache.configure(max_bytes=1)
+        self.assertEqual(self.cache._ttl, 60)
+        self.cache.configure(ttl=None)
+        self.assertIsNone(self.cache._ttl)
+
+    def test_get_or_load_shares_concurrent_loads(self):
+        """Test get_or_load() hanya memanggil loader sekali untuk thread paralel"""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return make_frame(10)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(self.cache.get_or_load(self.key, loader))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(self.cache.stats().misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,16 @@ import unittest
 from unittest.mock import Mock
 from datetime import datetime, timezone
 
+import numpy as np
+
 from openstoxlify.context import Context
+from openstoxlify.indicators.online import OnlineEMA
+from openstoxlify.indicators.trend import sma
 from openstoxlify.models.enum import ActionType, PlotType, Period
 from openstoxlify.models.series import ActionSeries, FloatSeries
 from openstoxlify.models.model import Quote
-from openstoxlify.models.contract import Provider
+from openstoxlify.models.contract import FrameProvider, Provider
+from openstoxlify.models.frame import QuoteFrame
 
 
 class TestContext(unittest.TestCase):
@@ -82,6 +87,82 @@ class TestContext(unittest.TestCase):
         self.mock_provider.quotes.assert_called_once()
         self.assertEqual(result1, result2)
 
+    def test_quotes_cache_keyed_by_range(self):
+        """Test quotes() dengan rentang berbeda tidak memakai data cache lama"""
+        self.mock_provider.quotes.return_value = []
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        self.ctx.quotes()
+        self.ctx.quotes(start=start)
+        self.ctx.quotes(start=start)
+
+        self.assertEqual(self.mock_provider.quotes.call_count, 2)
+        self.mock_provider.quotes.assert_called_with(
+            self.symbol, self.period, start, None
+        )
+
+    def test_quotes_cache_shared_between_contexts(self):
+        """Test cache quote dipakai bersama oleh Context lain di proses yang sama"""
+        self.mock_provider.quotes.return_value = []
+        other = Context(["file.py"], self.mock_provider, self.symbol, self.period)
+
+        self.ctx.quotes()
+        other.quotes()
+
+        self.mock_provider.quotes.assert_called_once()
+
+    def test_quotes_many_fills_shared_cache(self):
+        """Test quotes_many() memuat banyak symbol dan mengisi cache bersama"""
+
+        def quotes(symbol, period, start, end):
+            if symbol == "BROKEN":
+                raise RuntimeError("request failed")
+            return []
+
+        self.mock_provider.quotes.side_effect = quotes
+
+        batch = self.ctx.quotes_many(["BTC-USD", "ETH-USD", "BROKEN"])
+        other = Context(["file.py"], self.mock_provider, "ETH-USD", self.period)
+        other.quotes()
+
+        self.assertEqual(sorted(batch.frames), ["BTC-USD", "ETH-USD"])
+        self.assertIn("BROKEN", batch.errors)
+        self.assertEqual(self.mock_provider.quotes.call_count, 3)
+
+    def test_quote_frame_from_quote_provider(self):
+        """Test quote_frame() membangun QuoteFrame dari provider berbasis list"""
+        mock_quotes = [
+            Quote(
+                timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                high=100.0,
+                low=90.0,
+                open=95.0,
+                close=98.0,
+                volume=1000,
+            )
+        ]
+        self.mock_provider.quotes.return_value = mock_quotes
+
+        frame = self.ctx.quote_frame()
+
+        self.assertIsInstance(frame, QuoteFrame)
+        self.assertEqual(frame.close.tolist(), [98.0])
+        self.assertIs(self.ctx.quote_frame(), frame)
+        self.mock_provider.quotes.assert_called_once()
+
+    def test_quote_frame_from_frame_provider(self):
+        """Test quotes() memakai QuoteFrame langsung dari FrameProvider"""
+        frame = QuoteFrame([1704067200], [95.0], [100.0], [90.0], [98.0], [1000.0])
+        provider = Mock(spec=FrameProvider)
+        provider.quote_frame.return_value = frame
+        ctx = Context(["file.py"], provider, self.symbol, self.period)
+
+        quotes = ctx.quotes()
+
+        self.assertIs(ctx.quote_frame(), frame)
+        self.assertEqual(quotes[0].close, 98.0)
+        provider.quotes.assert_not_called()
+
     def test_plot_line_new_label(self):
         """Test plot() menambahkan data baru dengan label baru"""
         timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
@@ -122,6 +203,89 @@ class TestContext(unittest.TestCase):
         self.assertEqual(plots[PlotType.LINE.value][0].screen_index, 0)
         self.assertEqual(plots[PlotType.HISTOGRAM.value][0].screen_index, 1)
 
+    def test_plot_series_bulk(self):
+        """Test plot_series() menambahkan seluruh series dalam satu panggilan"""
+        timestamps = np.array([1704067200, 1704153600, 1704240000], dtype=np.int64)
+        values = np.array([1.0, 2.0, 3.0])
+
+        self.ctx.plot_series("RSI", PlotType.LINE, timestamps, values, screen_index=2)
+        self.ctx.plot(
+            "RSI",
+            PlotType.LINE,
+            FloatSeries(datetime(2024, 1, 4, tzinfo=timezone.utc), 4.0),
+        )
+
+        plot = self.ctx.plots()[PlotType.LINE.value][0]
+        self.assertEqual(plot.label, "RSI")
+        self.assertEqual(plot.screen_index, 2)
+        self.assertEqual(plot.data.values.tolist(), [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(
+            plot.data[0], FloatSeries(datetime(2024, 1, 1, tzinfo=timezone.utc), 1.0)
+        )
+
+    def test_plot_series_keeps_indicator_warmup(self):
+        """Test plot_series() menyimpan NaN warm-up sama seperti plot() per titik"""
+        timestamps = np.array([1704067200, 1704153600, 1704240000], dtype=np.int64)
+        values = sma([1.0, 2.0, 4.0], 2)
+
+        self.ctx.plot_series("SMA 2", PlotType.LINE, timestamps, values)
+        for ts, value in zip(timestamps.tolist(), values.tolist()):
+            self.ctx.plot(
+                "SMA 2 per titik",
+                PlotType.LINE,
+                FloatSeries(datetime.fromtimestamp(ts, timezone.utc), value),
+            )
+
+        bulk, single = self.ctx.plots()[PlotType.LINE.value]
+        self.assertEqual(bulk.data.timestamps.tolist(), timestamps.tolist())
+        np.testing.assert_array_equal(bulk.data.values, [np.nan, 1.5, 3.0])
+        np.testing.assert_array_equal(bulk.data.timestamps, single.data.timestamps)
+        np.testing.assert_array_equal(bulk.data.values, single.data.values)
+
+    def test_plot_streams_online_indicator(self):
+        """Test plot() per bar dari indikator online tetap menyimpan NaN warm-up"""
+        ema = OnlineEMA(2)
+        for day, close in enumerate([1.0, 3.0, 5.0], start=1):
+            ts = datetime(2024, 1, day, tzinfo=timezone.utc)
+            self.ctx.plot(
+                "EMA 2", PlotType.LINE, FloatSeries(ts, ema.update(close, ts))
+            )
+
+        values = self.ctx.plots()[PlotType.LINE.value][0].data.values
+        self.assertTrue(np.isnan(values[0]))
+        self.assertEqual(values[1:].tolist(), [2.0, 4.0])
+
+    def test_plot_keeps_subsecond_and_naive_timestamps(self):
+        """Test plot() mengembalikan timestamp yang sama persis"""
+        points = [
+            FloatSeries(datetime(2024, 1, 1, 12, 0, 0, 500000), 1.0),
+            FloatSeries(datetime(2024, 1, 2, 12, 0, 0, tzinfo=timezone.utc), 2.0),
+            FloatSeries(datetime(2024, 1, 3, 12, 0, 0, 250, tzinfo=timezone.utc), 3.0),
+        ]
+        for point in points:
+            self.ctx.plot("Exact", PlotType.LINE, point)
+
+        data = self.ctx.plots()[PlotType.LINE.value][0].data
+        self.assertEqual(list(data), points)
+        self.assertEqual(data[0], points[0])
+        self.assertEqual(data.timestamps[0], 1704110400)
+
+    def test_signal_keeps_subsecond_and_naive_timestamps(self):
+        """Test signal() mengembalikan timestamp yang sama persis"""
+        signal = ActionSeries(datetime(2024, 1, 4, 9, 30, 0, 1), ActionType.LONG, 1.0)
+        self.ctx.signal(signal)
+
+        self.assertEqual(list(self.ctx.signals()), [signal])
+        self.assertEqual(self.ctx.signals()[0], signal)
+        self.assertEqual(self.ctx.signals().timestamps[0], 1704360600)
+
+    def test_plot_series_length_mismatch(self):
+        """Test plot_series() dengan panjang array berbeda menghasilkan ValueError"""
+        with self.assertRaises(ValueError):
+            self.ctx.plot_series(
+                "RSI", PlotType.LINE, np.array([1, 2], dtype=np.int64), [1.0]
+            )
+
     def test_signal_long_action(self):
         """Test signal() dengan LONG action"""
         timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
@@ -144,6 +308,82 @@ class TestContext(unittest.TestCase):
         signals = self.ctx.signals()
         self.assertEqual(signals[0].amount, 0.0)
 
+    def test_signals_from_arrays(self):
+        """Test signals_from_arrays() mencatat banyak signal sekaligus"""
+        timestamps = np.array([1704067200, 1704153600, 1704240000], dtype=np.int64)
+
+        self.ctx.signals_from_arrays(
+            timestamps,
+            [ActionType.LONG, ActionType.HOLD, ActionType.SHORT],
+            [1.5, 3.0, 2.0],
+        )
+
+        signals = self.ctx.signals()
+        self.assertEqual(len(signals), 3)
+        self.assertEqual(
+            signals[0].timestamp, datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+        self.assertEqual(
+            [s.action for s in signals],
+            [ActionType.LONG, ActionType.HOLD, ActionType.SHORT],
+        )
+        self.assertEqual([s.amount for s in signals], [1.5, 0.0, 2.0])
+
+    def test_signals_from_arrays_codes(self):
+        """Test signals_from_arrays() dengan action code integer"""
+        timestamps = np.array([1704067200, 1704153600], dtype=np.int64)
+
+        self.ctx.signals_from_arrays(timestamps, np.array([-1, 1]), 1.0)
+
+        self.assertEqual(
+            [s.action for s in self.ctx.signals()], [ActionType.SHORT, ActionType.LONG]
+        )
+        with self.assertRaises(ValueError):
+            self.ctx.signals_from_arrays(timestamps, np.array([2, 1]), 1.0)
+
+    def test_signals_from_arrays_lists_and_strings(self):
+        """Test signals_from_arrays() menerima list code, bool dan string"""
+        timestamps = np.array([1704067200, 1704153600], dtype=np.int64)
+
+        self.ctx.signals_from_arrays(timestamps, [1, -1], 1.0)
+        self.ctx.signals_from_arrays(timestamps, np.array([True, False]), 1.0)
+        self.ctx.signals_from_arrays(timestamps, ["Short", ActionType.LONG], 1.0)
+
+        self.assertEqual(
+            [s.action for s in self.ctx.signals()],
+            [
+                ActionType.LONG,
+                ActionType.SHORT,
+                ActionType.LONG,
+                ActionType.HOLD,
+                ActionType.SHORT,
+                ActionType.LONG,
+            ],
+        )
+        for bad in ([2, 1], [0.5, 1], ["Buy", "Long"]):
+            with self.assertRaises(ValueError):
+                self.ctx.signals_from_arrays(timestamps, bad, 1.0)
+
+    def test_signals_from_masks(self):
+        """Test signals_from_masks() hanya mencatat baris yang terpilih"""
+        timestamps = np.array([1704067200, 1704153600, 1704240000], dtype=np.int64)
+
+        self.ctx.signals_from_masks(
+            timestamps,
+            long_mask=np.array([True, False, False]),
+            short_mask=np.array([False, False, True]),
+            amounts=2.0,
+        )
+
+        signals = self.ctx.signals()
+        self.assertEqual(len(signals), 2)
+        self.assertEqual(signals[0].action, ActionType.LONG)
+        self.assertEqual(signals[1].action, ActionType.SHORT)
+        self.assertEqual(signals[1].amount, 2.0)
+
+        with self.assertRaises(ValueError):
+            self.ctx.signals_from_masks(timestamps, [True] * 3, [True] * 3)
+
     def test_authenticate_success(self):
         """Test authenticate() berhasil"""
         self.mock_provider.authenticate.return_value = None
@@ -246,6 +486,32 @@ class TestContext(unittest.TestCase):
             "id", self.symbol, signal, 2.5
         )
 
+    def test_execute_uses_latest_signal_from_arrays(self):
+        """Test execute() memakai signal terakhir pada timestamp terbaru"""
+        self.ctx._authenticated = True
+        timestamp = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        self.ctx._quotes = [
+            Quote(
+                timestamp=timestamp,
+                high=100.0,
+                low=90.0,
+                open=95.0,
+                close=98.0,
+                volume=1000,
+            )
+        ]
+
+        self.ctx.signals_from_arrays(
+            np.array([1704153600, 1704067200, 1704153600], dtype=np.int64),
+            np.array([1, 1, -1]),
+            np.array([1.0, 1.0, 3.0]),
+        )
+        self.ctx.execute()
+
+        self.mock_provider.execute.assert_called_once_with(
+            "id", self.symbol, ActionSeries(timestamp, ActionType.SHORT, 3.0), 3.0
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
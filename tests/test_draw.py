@@ -1,12 +1,17 @@
 import unittest
 from unittest.mock import Mock, patch
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+
+import matplotlib.pyplot as plt
+import numpy as np
 
 from openstoxlify.context import Context
 from openstoxlify.draw import Canvas
+from openstoxlify.models.frame import QuoteFrame
 from openstoxlify.models.enum import ActionType, PlotType, Period
 from openstoxlify.models.series import ActionSeries, FloatSeries
 from openstoxlify.models.model import Quote, PlotData
+from openstoxlify.models.store import PlotStore
 
 
 class TestCanvas(unittest.TestCase):
@@ -103,6 +108,46 @@ class TestCanvas(unittest.TestCase):
         self.assertIsInstance(result, float)
         self.assertGreater(result, 0)
 
+    def test_series_points_match_convert_timestamp(self):
+        """Test konversi vektor sama dengan convert_timestamp() per titik"""
+        data = [
+            FloatSeries(datetime(2024, 1, 1, 12, tzinfo=timezone.utc), 1.0),
+            FloatSeries("2024-01-02T00:00:00+00:00", 2.0),
+            FloatSeries(datetime(2024, 1, 3), 3.0),
+        ]
+
+        x, values = self.canvas._series_points(data, None, None)
+
+        np.testing.assert_allclose(
+            x, [self.canvas.convert_timestamp(item.timestamp) for item in data]
+        )
+        self.assertEqual(values.tolist(), [1.0, 2.0, 3.0])
+
+    def test_candle_coordinates_converted_once(self):
+        """Test koordinat candle dikonversi sekali dan dipakai ulang"""
+        self.canvas._market_data = [
+            Quote(
+                timestamp=datetime(2024, 1, day, tzinfo=timezone.utc),
+                high=110.0,
+                low=90.0,
+                open=100.0,
+                close=105.0,
+                volume=1,
+            )
+            for day in (1, 2)
+        ]
+
+        with patch.object(
+            self.canvas, "_date_numbers", wraps=self.canvas._date_numbers
+        ) as convert:
+            ts, x, close = self.canvas._build_candle_lookup_table()
+            self.canvas._quote_frame()
+            self.canvas._build_candle_lookup_table()
+
+        self.assertEqual(convert.call_count, 1)
+        self.assertEqual(x[0], self.canvas.convert_timestamp(datetime(2024, 1, 1)))
+        self.assertEqual(close.tolist(), [105.0, 105.0])
+
     def test_get_color_consistency(self):
         """Test _get_color() mengembalikan warna yang konsisten untuk label yang sama"""
         label = "MA20"
@@ -166,9 +211,152 @@ class TestCanvas(unittest.TestCase):
         self.canvas.draw()
 
         mock_subplots.assert_called_once()
-        mock_ax.vlines.assert_called()
+        mock_ax.add_collection.assert_called()
+        self.assertEqual(mock_ax.add_collection.call_count, 4)
         mock_show.assert_called_once()
 
+    def test_candlesticks_are_batched(self):
+        """Test candlestick digambar sebagai LineCollection, bukan per candle"""
+        from matplotlib.figure import Figure
+
+        self.canvas._market_data = [
+            Quote(
+                timestamp=datetime(2024, 1, day, tzinfo=timezone.utc),
+                high=110.0,
+                low=90.0,
+                open=100.0,
+                close=105.0 if day % 2 else 95.0,
+                volume=1000,
+            )
+            for day in range(1, 11)
+        ]
+        ax = Figure().add_subplot()
+
+        self.canvas._render_candlesticks(ax, 1, 4)
+
+        self.assertEqual(len(ax.collections), 4)
+        self.assertEqual(len(ax.lines), 0)
+        up_wicks = ax.collections[0].get_segments()
+        self.assertEqual(len(up_wicks), 5)
+        self.assertEqual(up_wicks[0][:, 1].tolist(), [90.0, 110.0])
+        self.assertEqual(
+            ax.collections[1].get_segments()[0][:, 1].tolist(), [100.0, 105.0]
+        )
+
+    def _signal_axes(self, days):
+        """Siapkan axes nyata dengan candle dan sinyal LONG/SHORT bergantian"""
+        from matplotlib.figure import Figure
+
+        timestamps = [
+            datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(hours=i)
+            for i in range(days)
+        ]
+        self.canvas._market_data = [
+            Quote(timestamp=ts, high=110.0, low=90.0, open=100.0, close=105.0, volume=1)
+            for ts in timestamps
+        ]
+        self.canvas._strategy_data = [
+            ActionSeries(ts, ActionType.LONG if i % 2 else ActionType.SHORT, 1.0)
+            for i, ts in enumerate(timestamps)
+        ]
+        ax = Figure(figsize=(12, 6), dpi=100).add_subplot()
+        self.canvas._render_candlesticks(ax, 1, 4)
+        return ax
+
+    def test_signals_use_one_scatter_per_direction(self):
+        """Test marker sinyal digambar dengan satu scatter per arah"""
+        ax = self._signal_axes(6)
+
+        self.canvas._render_trading_signals(
+            ax, self.canvas._build_candle_lookup_table(), 0.05, 8, 9
+        )
+
+        self.assertEqual(len(ax.collections), 2 + 2)
+        self.assertEqual(len(ax.lines), 0)
+        self.assertEqual(len(ax.collections[-2].get_offsets()), 3)
+        self.assertEqual(len(ax.texts), 6)
+        self.assertEqual(
+            sorted(t.get_text() for t in ax.texts)[:2], ["LONG 1.0", "LONG 1.0"]
+        )
+
+    def test_annotations_are_decimated(self):
+        """Test anotasi dibatasi dan tidak saling tumpang tindih"""
+        ax = self._signal_axes(5000)
+        lut = self.canvas._build_candle_lookup_table()
+
+        self.canvas._render_trading_signals(ax, lut, 0.05, 8, 9, max_annotations=50)
+
+        self.assertEqual(len(ax.collections[-1].get_offsets()), 2500)
+        self.assertGreater(len(ax.texts), 0)
+        self.assertLessEqual(len(ax.texts), 50)
+        width, _ = self.canvas._axes_resolution((12, 6), 1)
+        span = np.ptp(lut[1])
+        label_width = len("LONG 1.0") * 0.6 * 9 * plt.rcParams["figure.dpi"] / 72
+        for color in ("blue", "purple"):
+            xs = sorted(t.xy[0] for t in ax.texts if t.get_color() == color)
+            gaps = [(b - a) / span * width for a, b in zip(xs, xs[1:])]
+            self.assertGreaterEqual(min(gaps), label_width)
+
+    def test_annotation_spacing_uses_render_dpi(self):
+        """Test ukuran label dihitung dengan DPI render, bukan DPI figure"""
+        ax = self._signal_axes(2000)
+        lut = self.canvas._build_candle_lookup_table()
+        dpi = 3 * plt.rcParams["figure.dpi"]
+        resolution = self.canvas._axes_resolution((12, 6), 1, dpi)
+
+        self.canvas._render_trading_signals(ax, lut, 0.05, 8, 9, None, resolution, dpi)
+
+        span = np.ptp(lut[1])
+        label_width = len("LONG 1.0") * 0.6 * 9 * dpi / 72
+        for color in ("blue", "purple"):
+            xs = sorted(t.xy[0] for t in ax.texts if t.get_color() == color)
+            gaps = [(b - a) / span * resolution[0] for a, b in zip(xs, xs[1:])]
+            self.assertGreaterEqual(min(gaps), label_width)
+
+    def test_annotations_can_be_disabled(self):
+        """Test max_annotations=0 hanya menggambar marker"""
+        ax = self._signal_axes(10)
+
+        self.canvas._render_trading_signals(
+            ax, self.canvas._build_candle_lookup_table(), 0.05, 8, 9, 0
+        )
+
+        self.assertEqual(len(ax.texts), 0)
+        self.assertEqual(len(ax.collections), 4)
+
+    def test_lod_reduces_candles_and_series(self):
+        """Test mode LOD mengurangi jumlah candle dan titik indikator"""
+        from matplotlib.figure import Figure
+
+        n = 50_000
+        ts = 1_700_000_000 + 60 * np.arange(n)
+        close = 100 + np.cumsum(np.random.default_rng(1).normal(size=n))
+        self.canvas._market_data = QuoteFrame(
+            ts, close, close + 1, close - 1, close, np.ones(n)
+        ).quotes()
+        store = PlotStore()
+        store.extend(PlotType.LINE.value, "Close", ts, close, 0)
+        store.extend(PlotType.AREA.value, "Band", ts, close + 2, 0)
+        self.canvas._plot_data = store.plots()
+        ax = Figure().add_subplot()
+
+        self.canvas._plot_lines({0: ax}, 2, points=500)
+        self.canvas._plot_areas({0: ax}, 0.3, points=500)
+        self.canvas._render_candlesticks(ax, 1, 4, buckets=500)
+
+        line = ax.lines[0].get_ydata()
+        self.assertEqual(len(line), 500)
+        self.assertEqual((line[0], line[-1]), (close[0], close[-1]))
+        self.assertLessEqual(
+            len(ax.collections[0].get_paths()[0].vertices), 2 * 502 + 3
+        )
+        candles = sum(len(c.get_segments()) for c in ax.collections[1:]) // 2
+        self.assertLessEqual(candles, 500)
+        wick_tops = np.concatenate(
+            [[seg[1, 1] for seg in c.get_segments()] for c in ax.collections[1::2]]
+        )
+        self.assertEqual(wick_tops.max(), close.max() + 1)
+
     @patch("openstoxlify.draw.plt.subplots")
     def test_draw_with_custom_parameters(self, mock_subplots):
         """Test draw() dengan custom parameters"""
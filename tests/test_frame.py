@@ -0,0 +1,104 @@
+import unittest
+from datetime import datetime, timezone
+
+import numpy as np
+
+from openstoxlify.models.frame import QuoteFrame, QuoteView
+from openstoxlify.models.model import Quote
+
+
+class TestQuoteFrame(unittest.TestCase):
+    """Test suite untuk QuoteFrame class"""
+
+    def setUp(self):
+        """Setup frame dengan tiga candle harian"""
+        self.timestamps = np.array([1704067200, 1704153600, 1704240000], dtype=np.int64)
+        self.frame = QuoteFrame(
+            self.timestamps,
+            open=[100.0, 102.0, 108.0],
+            high=[105.0, 110.0, 115.0],
+            low=[95.0, 100.0, 105.0],
+            close=[102.0, 108.0, 98.0],
+            volume=[1000, 1500, 2000],
+        )
+
+    def test_columns_dtype(self):
+        """Test kolom memiliki dtype int64/float64"""
+        self.assertEqual(self.frame.timestamp.dtype, np.int64)
+        for name in ("open", "high", "low", "close", "volume"):
+            self.assertEqual(getattr(self.frame, name).dtype, np.float64)
+        self.assertEqual(len(self.frame), 3)
+
+    def test_columns_are_zero_copy_views(self):
+        """Test kolom int64 tidak di-copy dan bersifat read-only"""
+        self.assertTrue(np.shares_memory(self.frame.timestamp, self.timestamps))
+        with self.assertRaises(ValueError):
+            self.frame.close[0] = 1.0
+
+    def test_slice_is_zero_copy(self):
+        """Test slicing frame tidak meng-copy buffer"""
+        tail = self.frame[1:]
+        self.assertEqual(len(tail), 2)
+        self.assertTrue(np.shares_memory(tail.close, self.frame.close))
+
+    def test_unsorted_input_is_sorted(self):
+        """Test input yang tidak urut diurutkan berdasarkan timestamp"""
+        frame = QuoteFrame(
+            [3, 1, 2], [3, 1, 2], [3, 1, 2], [3, 1, 2], [3, 1, 2], [0, 0, 0]
+        )
+        self.assertEqual(frame.timestamp.tolist(), [1, 2, 3])
+        self.assertEqual(frame.close.tolist(), [1.0, 2.0, 3.0])
+
+    def test_mismatched_lengths(self):
+        """Test kolom dengan panjang berbeda menghasilkan ValueError"""
+        with self.assertRaises(ValueError):
+            QuoteFrame([1, 2], [1.0], [1.0], [1.0], [1.0], [1.0])
+
+    def test_quotes_view(self):
+        """Test quotes() mengembalikan view Quote yang lazy"""
+        view = self.frame.quotes()
+        self.assertIsInstance(view, QuoteView)
+        self.assertIs(self.frame.quotes(), view)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(view[0].timestamp, datetime(2024, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(view[-1].close, 98.0)
+        self.assertIs(view[1], view[1])
+        self.assertEqual([q.close for q in view], [102.0, 108.0, 98.0])
+
+    def test_from_quotes_roundtrip(self):
+        """Test from_quotes() menyimpan objek Quote asli"""
+        quotes = [
+            Quote(
+                timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                high=105.0,
+                low=95.0,
+                open=100.0,
+                close=102.0,
+                volume=1000,
+            ),
+            Quote(
+                timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                high=110.0,
+                low=100.0,
+                open=102.0,
+                close=108.0,
+                volume=1500,
+            ),
+        ]
+        frame = QuoteFrame.from_quotes(quotes)
+
+        self.assertEqual(frame.timestamp.tolist(), [1704067200, 1704153600])
+        self.assertIs(frame.quotes()[0], quotes[0])
+        self.assertEqual(frame.quotes(), quotes)
+
+    def test_between(self):
+        """Test between() memotong frame berdasarkan rentang waktu"""
+        sliced = self.frame.between(
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
+            datetime(2024, 1, 3, tzinfo=timezone.utc),
+        )
+        self.assertEqual(sliced.close.tolist(), [108.0, 98.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from openstoxlify.indicators.momentum import rsi, stochastic
+from openstoxlify.indicators.trend import ema, macd, sma
+from openstoxlify.indicators.volatility import atr, bollinger, true_range
+from openstoxlify.indicators.window import (
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_std,
+)
+
+
+def loop_ema(values, period, alpha=None):
+    alpha = alpha or 2.0 / (period + 1)
+    out = [float("nan")] * len(values)
+    value = sum(values[:period]) / period
+    out[period - 1] = value
+    for i in range(period, len(values)):
+        value += alpha * (values[i] - value)
+        out[i] = value
+    return np.array(out)
+
+
+class TestIndicators(unittest.TestCase):
+    """Test suite untuk indikator vektor"""
+
+    def setUp(self):
+        """Setup harga random walk yang deterministik"""
+        rng = np.random.default_rng(7)
+        self.close = 100 + np.cumsum(rng.normal(size=2000))
+        self.high = self.close + rng.uniform(0, 2, size=2000)
+        self.low = self.close - rng.uniform(0, 2, size=2000)
+
+    def test_sma_matches_window_average(self):
+        """Test sma() sama dengan rata-rata per window"""
+        result = sma(self.close, 20)
+        expected = [self.close[i - 19 : i + 1].mean() for i in range(19, 2000)]
+
+        self.assertTrue(np.isnan(result[:19]).all())
+        np.testing.assert_allclose(result[19:], expected, rtol=1e-10)
+
+    def test_ema_matches_recursive_definition(self):
+        """Test ema() sama dengan definisi rekursif untuk periode panjang"""
+        for period in (2, 12, 200):
+            np.testing.assert_allclose(
+                ema(self.close, period), loop_ema(self.close, period), rtol=1e-10
+            )
+
+    def test_macd_lines(self):
+        """Test macd() menghitung garis MACD, signal, dan histogram"""
+        result = macd(self.close, 12, 26, 9)
+        line = loop_ema(self.close, 12) - loop_ema(self.close, 26)
+
+        np.testing.assert_allclose(result.macd, line, rtol=1e-9)
+        self.assertTrue(np.isnan(result.signal[:33]).all())
+        self.assertFalse(np.isnan(result.signal[33]))
+        np.testing.assert_allclose(
+            result.histogram[33:], (result.macd - result.signal)[33:]
+        )
+        with self.assertRaises(ValueError):
+            macd(self.close, 26, 12)
+
+    def test_rsi_wilder(self):
+        """Test rsi() memakai smoothing Wilder"""
+        change = np.diff(self.close)
+        gain = loop_ema(np.maximum(change, 0), 14, 1 / 14)
+        loss = loop_ema(np.maximum(-change, 0), 14, 1 / 14)
+
+        result = rsi(self.close, 14)
+
+        self.assertTrue(np.isnan(result[:14]).all())
+        np.testing.assert_allclose(result[1:], 100 - 100 / (1 + gain / loss))
+        self.assertEqual(rsi(np.arange(30.0), 14)[-1], 100.0)
+        self.assertEqual(rsi(np.ones(30), 14)[-1], 50.0)
+
+    def test_rolling_extremes(self):
+        """Test rolling_max()/rolling_min() untuk window yang tidak habis membagi"""
+        for period in (1, 7, 14):
+            expected_max = [
+                self.close[i - period + 1 : i + 1].max()
+                for i in range(period - 1, 2000)
+            ]
+            expected_min = [
+                self.close[i - period + 1 : i + 1].min()
+                for i in range(period - 1, 2000)
+            ]
+            np.testing.assert_array_equal(
+                rolling_max(self.close, period)[period - 1 :], expected_max
+            )
+            np.testing.assert_array_equal(
+                rolling_min(self.close, period)[period - 1 :], expected_min
+            )
+
+    def test_rolling_std_long_drifting_series(self):
+        """Test rolling_std() tetap presisi pada deret panjang yang bergeser"""
+        rng = np.random.default_rng(11)
+        close = 1e4 + np.cumsum(rng.normal(0.5, 0.1, size=300_000))
+        windows = sliding_window_view(close, 20)
+
+        np.testing.assert_allclose(
+            rolling_std(close, 20)[19:], windows.std(axis=1), rtol=1e-8
+        )
+        np.testing.assert_allclose(
+            rolling_mean(close, 20)[19:], windows.mean(axis=1), rtol=1e-12
+        )
+
+    def test_rolling_windows_with_interior_nan(self):
+        """Test NaN di tengah hanya mempengaruhi window yang memuatnya"""
+        close = self.close.copy()
+        close[500] = np.nan
+        windows = sliding_window_view(close, 20)
+
+        for function, expected in (
+            (rolling_mean, windows.mean(axis=1)),
+            (rolling_std, windows.std(axis=1)),
+        ):
+            result = function(close, 20)[19:]
+            np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+            self.assertEqual(int(np.isnan(result).sum()), 20)
+            np.testing.assert_allclose(result, expected, rtol=1e-10)
+
+    def test_stochastic(self):
+        """Test stochastic() %K dan %D termasuk range datar"""
+        result = stochastic(self.high, self.low, self.close, 14, 3)
+        i = 100
+        hh = self.high[i - 13 : i + 1].max()
+        ll = self.low[i - 13 : i + 1].min()
+
+        self.assertAlmostEqual(result.k[i], 100 * (self.close[i] - ll) / (hh - ll))
+        self.assertAlmostEqual(result.d[i], result.k[i - 2 : i + 1].mean())
+        self.assertTrue(np.isnan(result.d[:15]).all())
+
+        flat = stochastic(np.ones(20), np.ones(20), np.ones(20), 14)
+        self.assertEqual(flat.k[-1], 50.0)
+
+    def test_bollinger(self):
+        """Test bollinger() memakai standar deviasi populasi"""
+        bands = bollinger(self.close, 20, 2.0)
+        window = self.close[80:100]
+
+        self.assertAlmostEqual(bands.middle[99], window.mean())
+        self.assertAlmostEqual(bands.upper[99], window.mean() + 2 * window.std())
+        self.assertAlmostEqual(bands.lower[99], window.mean() - 2 * window.std())
+
+    def test_atr(self):
+        """Test atr() memakai true range dengan close sebelumnya"""
+        tr = true_range(self.high, self.low, self.close)
+        self.assertEqual(tr[0], self.high[0] - self.low[0])
+        self.assertEqual(
+            tr[5],
+            max(
+                self.high[5] - self.low[5],
+                abs(self.high[5] - self.close[4]),
+                abs(self.low[5] - self.close[4]),
+            ),
+        )
+        np.testing.assert_allclose(
+            atr(self.high, self.low, self.close, 14), loop_ema(tr, 14, 1 / 14)
+        )
+
+    def test_short_input_and_invalid_period(self):
+        """Test input lebih pendek dari periode dan periode tidak valid"""
+        self.assertTrue(np.isnan(sma([1.0, 2.0], 5)).all())
+        self.assertTrue(np.isnan(ema([1.0, 2.0], 5)).all())
+        self.assertEqual(len(rsi([], 14)), 0)
+        with self.assertRaises(ValueError):
+            sma(self.close, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
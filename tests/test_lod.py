@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.utils.lod import lttb, minmax, ohlc_buckets
+
+
+def loop_lttb(x, y, threshold):
+    n = len(x)
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    out = [0]
+    for i in range(threshold - 2):
+        lo = int((i + 1) * every) + 1
+        hi = min(int((i + 2) * every) + 1, n)
+        if i == threshold - 3:
+            lo, hi = n - 1, n
+        avg_x = sum(x[lo:hi]) / (hi - lo)
+        avg_y = sum(y[lo:hi]) / (hi - lo)
+        best, best_area = None, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        out.append(best)
+        a = best
+    out.append(n - 1)
+    return out
+
+
+class TestLevelOfDetail(unittest.TestCase):
+    """Test suite untuk downsampling LOD"""
+
+    def setUp(self):
+        """Setup candle menit random walk yang deterministik"""
+        rng = np.random.default_rng(3)
+        n = 10_000
+        self.close = 100 + np.cumsum(rng.normal(size=n))
+        self.frame = QuoteFrame(
+            1_700_000_000 + 60 * np.arange(n),
+            np.concatenate(([100.0], self.close[:-1])),
+            self.close + rng.uniform(0, 1, size=n),
+            self.close - rng.uniform(0, 1, size=n),
+            self.close,
+            np.ones(n),
+        )
+
+    def test_ohlc_buckets_aggregate_candles(self):
+        """Test ohlc_buckets() menggabungkan open/high/low/close/volume per bucket"""
+        result = ohlc_buckets(self.frame, 100)
+
+        self.assertLessEqual(len(result), 100)
+        self.assertEqual(result.volume.sum(), len(self.frame))
+        self.assertEqual(result.high.max(), self.frame.high.max())
+        self.assertEqual(result.low.min(), self.frame.low.min())
+        self.assertEqual(result.open[0], self.frame.open[0])
+        self.assertEqual(result.close[-1], self.frame.close[-1])
+
+        first = self.frame[
+            : int(np.searchsorted(self.frame.timestamp, result.timestamp[1]))
+        ]
+        self.assertEqual(result.high[0], first.high.max())
+        self.assertEqual(result.low[0], first.low.min())
+        self.assertEqual(result.close[0], first.close[-1])
+
+    def test_ohlc_buckets_keeps_small_frames(self):
+        """Test frame yang sudah kecil dikembalikan apa adanya"""
+        self.assertIs(ohlc_buckets(self.frame, 20_000), self.frame)
+
+    def test_minmax_keeps_envelope(self):
+        """Test minmax() menyimpan nilai minimum dan maksimum tiap bucket"""
+        keep = minmax(self.close, 50)
+
+        self.assertLessEqual(len(keep), 102)
+        self.assertTrue(np.all(np.diff(keep) > 0))
+        self.assertIn(int(np.argmax(self.close)), keep)
+        self.assertIn(int(np.argmin(self.close)), keep)
+        self.assertEqual((keep[0], keep[-1]), (0, len(self.close) - 1))
+
+    def test_lttb_matches_reference(self):
+        """Test lttb() sama dengan implementasi referensi berbasis loop"""
+        x = np.arange(997, dtype=float)
+        y = self.close[:997]
+
+        keep = lttb(x, y, 60)
+
+        self.assertEqual(keep.tolist(), loop_lttb(x.tolist(), y.tolist(), 60))
+
+    def test_lttb_returns_all_points_below_threshold(self):
+        """Test lttb() tidak mengurangi data yang lebih pendek dari threshold"""
+        self.assertEqual(lttb(np.arange(5), np.arange(5), 10).tolist(), [0, 1, 2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
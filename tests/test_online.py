@@ -0,0 +1,118 @@
+import math
+import unittest
+
+import numpy as np
+
+from openstoxlify.indicators.momentum import rsi
+from openstoxlify.indicators.online import (
+    OnlineEMA,
+    OnlineIndicator,
+    OnlineMACD,
+    OnlineMax,
+    OnlineMin,
+    OnlineRSI,
+    OnlineSMA,
+    dumps,
+    loads,
+)
+from openstoxlify.indicators.trend import ema, macd, sma
+from openstoxlify.indicators.window import rolling_max, rolling_min
+
+
+class TestOnlineIndicators(unittest.TestCase):
+    """Test suite untuk indikator online (bar per bar)"""
+
+    def setUp(self):
+        """Setup harga random walk yang deterministik"""
+        rng = np.random.default_rng(11)
+        self.close = 100 + np.cumsum(rng.normal(size=500))
+
+    def assert_matches(self, online, expected):
+        result = np.array(online.update_many(self.close), dtype=np.float64)
+        np.testing.assert_allclose(result, expected, rtol=1e-9, equal_nan=True)
+
+    def test_matches_vectorized_indicators(self):
+        """Test hasil online sama dengan versi vektor"""
+        self.assert_matches(OnlineSMA(20), sma(self.close, 20))
+        self.assert_matches(OnlineEMA(12), ema(self.close, 12))
+        self.assert_matches(OnlineRSI(14), rsi(self.close, 14))
+        self.assert_matches(OnlineMax(14), rolling_max(self.close, 14))
+        self.assert_matches(OnlineMin(14), rolling_min(self.close, 14))
+
+    def test_macd_tuple(self):
+        """Test OnlineMACD mengembalikan (macd, signal, histogram)"""
+        online = OnlineMACD(12, 26, 9)
+        values = np.array(online.update_many(self.close))
+        expected = macd(self.close, 12, 26, 9)
+
+        np.testing.assert_allclose(values[:, 0], expected.macd, equal_nan=True)
+        np.testing.assert_allclose(values[:, 1], expected.signal, equal_nan=True)
+        np.testing.assert_allclose(values[:, 2], expected.histogram, equal_nan=True)
+        self.assertTrue(online.ready)
+
+    def test_state_roundtrip_continues_identically(self):
+        """Test state yang disimpan melanjutkan perhitungan dengan hasil sama"""
+        indicators = {
+            "sma": OnlineSMA(10),
+            "ema": OnlineEMA(10),
+            "rsi": OnlineRSI(14),
+            "macd": OnlineMACD(),
+            "max": OnlineMax(5),
+        }
+        for indicator in indicators.values():
+            indicator.update_many(self.close[:300])
+
+        restored = loads(dumps(indicators))
+
+        for name, indicator in indicators.items():
+            self.assertIsInstance(restored[name], type(indicator))
+            np.testing.assert_allclose(
+                np.array(restored[name].update_many(self.close[300:])),
+                np.array(indicator.update_many(self.close[300:])),
+                equal_nan=True,
+            )
+
+    def test_timestamp_replay_is_ignored(self):
+        """Test bar dengan timestamp lama tidak dihitung dua kali"""
+        online = OnlineSMA(2)
+        online.update(1.0, 100)
+        online.update(3.0, 200)
+        self.assertTrue(math.isnan(online.update(50.0, 200)))
+        self.assertTrue(online.skipped)
+        self.assertEqual(online.update(5.0, 300), 4.0)
+        self.assertFalse(online.skipped)
+
+        restored = OnlineIndicator.from_state(online.state())
+        self.assertEqual(restored.timestamp, 300)
+        self.assertTrue(math.isnan(restored.update(99.0, 250)))
+        self.assertEqual(restored.value, 4.0)
+
+    def test_replay_after_restore_reports_no_value(self):
+        """Test replay bar lama setelah restore tidak mengembalikan nilai terbaru"""
+        online = OnlineSMA(2)
+        online.update_many([1.0, 2.0, 3.0, 4.0, 9.0], [1, 2, 3, 4, 5])
+        restored = OnlineIndicator.from_state(online.state())
+
+        replayed = restored.update_many([2.0, 3.0, 4.0, 10.0], [2, 3, 4, 6])
+
+        self.assertTrue(all(math.isnan(v) for v in replayed[:3]))
+        self.assertEqual(replayed[3], 9.5)
+        macd = OnlineMACD(2, 3, 2)
+        macd.update(1.0, 10)
+        self.assertTrue(all(math.isnan(v) for v in macd.update(2.0, 10)))
+
+    def test_base_class_is_abstract(self):
+        """Test OnlineIndicator tidak bisa dibuat langsung"""
+        with self.assertRaises(TypeError):
+            OnlineIndicator()
+
+    def test_unknown_state(self):
+        """Test state dengan tipe tidak dikenal menghasilkan ValueError"""
+        with self.assertRaises(ValueError):
+            OnlineIndicator.from_state({"type": "Nope"})
+        with self.assertRaises(ValueError):
+            OnlineEMA.from_state(OnlineSMA(3).state())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,317 @@
+import io
+import json
+import unittest
+from dataclasses import asdict
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import numpy as np
+from utcnow import utcnow
+
+from openstoxlify.models.enum import ActionType, PlotType
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.models.output import Output, QuoteOut, QuotesOut, StrategyOut
+from openstoxlify.models.series import ActionSeries, FloatSeries
+from openstoxlify.utils import output as output_module
+from openstoxlify.utils.output import (
+    JsonWriter,
+    NpzWriter,
+    TimestampFormatter,
+    build_plots,
+    read_json_v2,
+    read_npz,
+)
+
+from helpers import DAY, JAN_1, make_context, replay_context
+
+
+def legacy_document(ctx):
+    """Dokumen yang dihasilkan implementasi lama berbasis dataclass"""
+    quotes = QuotesOut(
+        ticker=ctx.symbol(),
+        interval="1d",
+        provider=ctx.provider().source(),
+        data=[
+            QuoteOut(
+                timestamp=utcnow.get(q.timestamp.isoformat()),
+                open=q.open,
+                high=q.high,
+                low=q.low,
+                close=q.close,
+                volume=q.volume,
+            )
+            for q in ctx.quotes()
+        ],
+    )
+    out = Output(
+        histogram=build_plots(ctx, PlotType.HISTOGRAM),
+        line=build_plots(ctx, PlotType.LINE),
+        area=build_plots(ctx, PlotType.AREA),
+        strategy=[
+            StrategyOut(
+                label="default", data=[item.to_dict() for item in ctx.signals()]
+            )
+        ],
+        quotes=quotes,
+    )
+    return asdict(out)
+
+
+class TestOutput(unittest.TestCase):
+    """Test suite untuk serializer JSON output"""
+
+    def setUp(self):
+        """Setup context dengan quote, plot dan sinyal"""
+        self.ctx = make_context()
+        self.expected = legacy_document(self.ctx)
+
+    def write(self, backend):
+        stream = io.StringIO()
+        JsonWriter(stream, backend).write(self.ctx)
+        return stream.getvalue()
+
+    def test_json_backend_matches_legacy_document(self):
+        """Test backend json menghasilkan dokumen yang sama dengan versi lama"""
+        text = self.write("json")
+
+        self.assertTrue(text.endswith("}\n"))
+        self.assertEqual(json.loads(text), self.expected)
+
+    def test_orjson_backend_matches_legacy_document(self):
+        """Test backend orjson menghasilkan dokumen yang sama dengan versi lama"""
+        if output_module.orjson is None:
+            self.skipTest("orjson tidak terpasang")
+
+        self.assertEqual(json.loads(self.write("orjson")), self.expected)
+
+    def test_rows_are_written_in_chunks(self):
+        """Test baris ditulis per chunk tanpa mengubah isi dokumen"""
+        with patch.object(output_module, "CHUNK_ROWS", 7):
+            for backend in output_module.BACKENDS:
+                if backend == "orjson" and output_module.orjson is None:
+                    continue
+                self.assertEqual(json.loads(self.write(backend)), self.expected)
+
+    def test_non_finite_values(self):
+        """Test nilai tak hingga ditulis seperti json.dumps pada backend json"""
+        ts = JAN_1 + DAY * np.arange(3, dtype=np.int64)
+        self.ctx.plot_series(
+            "Ratio", PlotType.LINE, ts, np.array([np.inf, 1.0, -np.inf])
+        )
+
+        line = json.loads(self.write("json"))["line"][-1]["data"]
+
+        self.assertEqual([p["value"] for p in line], [np.inf, 1.0, -np.inf])
+
+    def test_output_defaults_to_stdout(self):
+        """Test output() menulis ke stdout bila stream tidak diberikan"""
+        stdout = io.StringIO()
+        with patch("sys.stdout", stdout):
+            output_module.output(self.ctx, backend="json")
+
+        self.assertEqual(json.loads(stdout.getvalue()), self.expected)
+
+    def test_subsecond_and_naive_timestamps(self):
+        """Test timestamp sub-detik dan naive ditulis seperti versi lama"""
+        subsecond = datetime(2024, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+        naive = datetime(2024, 1, 2, 12, 0, 0)
+        self.ctx.plot("Tick", PlotType.LINE, FloatSeries(subsecond, 1.0))
+        self.ctx.plot("Tick", PlotType.LINE, FloatSeries(naive, 2.0))
+        self.ctx.signal(ActionSeries(subsecond, ActionType.LONG, 1.0))
+        expected = legacy_document(self.ctx)
+
+        for backend in output_module.BACKENDS:
+            if backend == "orjson" and output_module.orjson is None:
+                continue
+            with self.subTest(backend=backend):
+                document = json.loads(self.write(backend))
+                self.assertEqual(document, expected)
+                self.assertEqual(
+                    document["line"][-1]["data"][0]["timestamp"],
+                    "2024-01-01T12:00:00.500000Z",
+                )
+
+    def test_default_backend_is_json(self):
+        """Test backend default adalah json; orjson hanya beda pada nilai tak hingga"""
+        stream = io.StringIO()
+        JsonWriter(stream).write(self.ctx)
+        self.assertEqual(stream.getvalue(), self.write("json"))
+
+        if output_module.orjson is None:
+            self.skipTest("orjson tidak terpasang")
+        self.ctx.plot_series(
+            "Gap", PlotType.LINE, self.ctx.frame().timestamp[:2], [np.inf, -2]
+        )
+        standard = json.loads(self.write("json"))
+        fast = json.loads(self.write("orjson"))
+
+        self.assertIsNone(fast["line"][-1]["data"][0]["value"])
+        self.assertEqual(standard["line"][-1]["data"][0]["value"], np.inf)
+        fast["line"][-1]["data"][0]["value"] = np.inf
+        self.assertEqual(fast, standard)
+
+    def test_unknown_backend(self):
+        """Test backend yang tidak dikenal ditolak"""
+        with self.assertRaises(ValueError):
+            JsonWriter(io.StringIO(), "yaml")
+
+    def test_timestamp_formatter_reuses_known_strings(self):
+        """Test timestamp subset memakai string yang sudah diformat"""
+        formatter = TimestampFormatter()
+        ts = JAN_1 + DAY * np.arange(5, dtype=np.int64)
+
+        first = formatter.format(ts)
+        subset = formatter.format(ts[[1, 3]])
+        other = formatter.format(np.array([JAN_1 + 1]))
+
+        self.assertEqual(first[0], "2024-01-01T00:00:00.000000Z")
+        self.assertIs(subset[0], first[1])
+        self.assertEqual(other, ["2024-01-01T00:00:01.000000Z"])
+
+
+class TestNpzOutput(unittest.TestCase):
+    """Test suite untuk output biner kolom NumPy"""
+
+    def setUp(self):
+        """Setup context dan dokumen JSON referensi"""
+        self.ctx = make_context()
+        self.expected = legacy_document(self.ctx)
+
+    def test_roundtrip_matches_json_document(self):
+        """Test isi arsip npz sama dengan dokumen JSON"""
+        buffer = io.BytesIO()
+        output_module.output(self.ctx, buffer, format="npz")
+        buffer.seek(0)
+        doc = read_npz(buffer)
+
+        for plot_type in ("histogram", "line", "area"):
+            expected = self.expected[plot_type]
+            self.assertEqual(len(doc[plot_type]), len(expected))
+            for plot, want in zip(doc[plot_type], expected):
+                self.assertEqual(plot["label"], want["label"])
+                self.assertEqual(plot["screen_index"], want["screen_index"])
+                self.assertEqual(
+                    TimestampFormatter().format(plot["timestamp"]),
+                    [p["timestamp"] for p in want["data"]],
+                )
+                self.assertEqual(
+                    plot["value"].tolist(), [p["value"] for p in want["data"]]
+                )
+
+        strategy = doc["strategy"][0]
+        self.assertEqual(strategy["action"].dtype, np.int8)
+        self.assertEqual(
+            [output_module.ACTIONS[a].value for a in strategy["action"].tolist()],
+            [s["action"] for s in self.expected["strategy"][0]["data"]],
+        )
+
+        quotes = doc["quotes"]
+        for key in ("ticker", "interval", "provider"):
+            self.assertEqual(quotes[key], self.expected["quotes"][key])
+        self.assertEqual(
+            quotes["close"].tolist(),
+            [q["close"] for q in self.expected["quotes"]["data"]],
+        )
+
+    def test_compressed_archive(self):
+        """Test arsip terkompresi bisa dibaca kembali"""
+        buffer = io.BytesIO()
+        NpzWriter(buffer, compress=True).write(self.ctx)
+        buffer.seek(0)
+
+        doc = read_npz(buffer)
+
+        self.assertEqual(len(doc["quotes"]["timestamp"]), 50)
+        self.assertEqual(doc["area"][0]["label"], "Band")
+
+    def test_empty_context(self):
+        """Test context tanpa plot dan sinyal menghasilkan kolom kosong"""
+        ctx = replay_context(QuoteFrame.from_quotes([]))
+        buffer = io.BytesIO()
+        NpzWriter(buffer).write(ctx)
+        buffer.seek(0)
+
+        doc = read_npz(buffer)
+
+        self.assertEqual(doc["line"], [])
+        self.assertEqual(len(doc["strategy"][0]["timestamp"]), 0)
+
+    def test_unknown_format(self):
+        """Test format output yang tidak dikenal ditolak"""
+        with self.assertRaises(ValueError):
+            output_module.output(self.ctx, io.BytesIO(), format="xml")
+
+
+class TestColumnarJsonOutput(unittest.TestCase):
+    """Test suite untuk layout JSON kolom versi 2"""
+
+    def setUp(self):
+        """Setup context dan dokumen npz referensi"""
+        self.ctx = make_context()
+        buffer = io.BytesIO()
+        NpzWriter(buffer).write(self.ctx)
+        buffer.seek(0)
+        self.expected = read_npz(buffer)
+
+    def write(self, backend):
+        stream = io.StringIO()
+        output_module.output(self.ctx, stream, backend, format="json-v2")
+        stream.seek(0)
+        return stream
+
+    def assertSameDocument(self, doc):
+        for plot_type in ("histogram", "line", "area", "strategy"):
+            self.assertEqual(len(doc[plot_type]), len(self.expected[plot_type]))
+            for got, want in zip(doc[plot_type], self.expected[plot_type]):
+                self.assertEqual(got.keys(), want.keys())
+                for key, value in want.items():
+                    np.testing.assert_array_equal(got[key], value)
+        for key, value in self.expected["quotes"].items():
+            np.testing.assert_array_equal(doc["quotes"][key], value)
+
+    def test_roundtrip_matches_npz(self):
+        """Test read_json_v2() menghasilkan isi yang sama dengan read_npz()"""
+        for backend in output_module.BACKENDS:
+            if backend == "orjson" and output_module.orjson is None:
+                continue
+            with self.subTest(backend=backend):
+                self.assertSameDocument(read_json_v2(self.write(backend)))
+
+    def test_shared_axis_and_positions(self):
+        """Test timestamp ditulis sekali dan seri diletakkan dengan offset/index"""
+        raw = json.loads(self.write("json").getvalue())
+
+        self.assertEqual(raw["version"], 2)
+        self.assertEqual(raw["timestamp"][0], JAN_1)
+        self.assertEqual(len(raw["timestamp"]), 50)
+        self.assertEqual(raw["quotes"]["offset"], 0)
+        self.assertEqual(raw["line"][0]["offset"], 10)
+        self.assertEqual(raw["area"][0]["index"], list(range(0, 50, 7)))
+
+    def test_timestamps_outside_quotes_extend_axis(self):
+        """Test timestamp seri di luar quote ditambahkan ke sumbu bersama"""
+        ts = np.array([JAN_1 + 1, JAN_1 + DAY + 1], dtype=np.int64)
+        self.ctx.plot_series("Intraday", PlotType.LINE, ts, np.array([1.0, 2.0]))
+
+        doc = read_json_v2(self.write("json"))
+
+        np.testing.assert_array_equal(doc["line"][-1]["timestamp"], ts)
+        self.assertEqual(len(doc["quotes"]["timestamp"]), 50)
+
+    def test_smaller_than_row_layout(self):
+        """Test dokumen versi 2 lebih kecil dari dokumen baris"""
+        rows = io.StringIO()
+        JsonWriter(rows, "json").write(self.ctx)
+
+        columnar = self.write("json").getvalue()
+
+        self.assertLess(len(columnar) * 2, len(rows.getvalue()))
+
+    def test_rejects_other_versions(self):
+        """Test dokumen versi lain ditolak"""
+        with self.assertRaises(ValueError):
+            read_json_v2(io.StringIO('{"histogram": []}'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,440 @@
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from concurrent import futures
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import grpc
+import numpy as np
+
+from openstoxlify.cache.disk import DiskQuoteStore
+from openstoxlify.models.enum import DefaultProvider, Period
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.providers.stoxlify.codec import decode_quotes
+from openstoxlify.providers.stoxlify.provider import Provider
+from openstoxlify.providers.stoxlify.policy import CallPolicy, PolicyCaller
+from openstoxlify.providers.stoxlify.proto import client
+from openstoxlify.providers.stoxlify.proto.market import market_pb2, market_pb2_grpc
+
+from helpers import DAY, JAN_1, make_response
+
+
+class TestCodec(unittest.TestCase):
+    """Test suite untuk decode_quotes"""
+
+    def test_decode_quotes_columns(self):
+        """Test decode_quotes() menghasilkan kolom kontigu per field"""
+        frame = decode_quotes(make_response([JAN_1, JAN_1 + DAY]))
+
+        self.assertEqual(frame.timestamp.tolist(), [JAN_1, JAN_1 + DAY])
+        self.assertEqual(frame.open[1], (JAN_1 + DAY) / DAY)
+        self.assertEqual(frame.high[0], JAN_1 / DAY + 1)
+        self.assertEqual(frame.low[0], JAN_1 / DAY - 1)
+        self.assertEqual(frame.volume.tolist(), [10.0, 10.0])
+        for name in QuoteFrame.COLUMNS:
+            self.assertTrue(getattr(frame, name).flags.c_contiguous)
+
+    def test_decode_empty_response(self):
+        """Test decode_quotes() dengan response kosong"""
+        self.assertEqual(len(decode_quotes(market_pb2.GetProductInfoResponse())), 0)
+
+
+class FakeMarketStub:
+    """Stub MarketService yang menyimpan request dan mengembalikan candle harian"""
+
+    def __init__(self, history):
+        self.history = history
+        self.requests = []
+
+    def GetProductInfo(self, req, **kwargs):
+        self.requests.append(req)
+        if req.Ticker == "BROKEN":
+            raise ValueError("unknown ticker")
+        lo = req.Start.seconds if req.HasField("Start") else -(1 << 62)
+        hi = req.End.seconds if req.HasField("End") else 1 << 62
+        return make_response([ts for ts in self.history if lo <= ts <= hi])
+
+
+class TestProvider(unittest.TestCase):
+    """Test suite untuk stoxlify Provider"""
+
+    def setUp(self):
+        """Setup provider dengan stub market palsu"""
+        self.history = [JAN_1 + i * DAY for i in range(10)]
+        self.stub = FakeMarketStub(self.history)
+        patcher = patch(
+            "openstoxlify.providers.stoxlify.provider.market_pb2_grpc.MarketServiceStub",
+            return_value=self.stub,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_quote_frame_decodes_response(self):
+        """Test quote_frame() mengubah response menjadi QuoteFrame"""
+        provider = Provider(DefaultProvider.YFinance, target="localhost:1")
+
+        frame = provider.quote_frame("BTC-USD", Period.DAILY)
+
+        self.assertIsInstance(frame, QuoteFrame)
+        self.assertEqual(frame.timestamp.tolist(), self.history)
+        self.assertEqual(frame.close[0], JAN_1 / DAY + 0.5)
+        req = self.stub.requests[0]
+        self.assertEqual((req.Ticker, req.Range, req.Interval), ("BTC-USD", "1y", "1d"))
+
+    def test_quotes_returns_quote_objects(self):
+        """Test quotes() tetap mengembalikan list Quote"""
+        provider = Provider(DefaultProvider.YFinance, target="localhost:1")
+
+        quotes = provider.quotes("BTC-USD", Period.DAILY)
+
+        self.assertEqual(len(quotes), 10)
+        self.assertEqual(quotes[0].timestamp, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    def test_quotes_many_collects_results_and_errors(self):
+        """Test quotes_many() mengembalikan hasil dan error per symbol"""
+        provider = Provider(DefaultProvider.YFinance, target="localhost:1")
+
+        batch = provider.quotes_many(
+            ["BTC-USD", "BROKEN", "ETH-USD", "BTC-USD"], Period.DAILY, max_concurrency=2
+        )
+
+        self.assertEqual(list(batch.frames), ["BTC-USD", "ETH-USD"])
+        self.assertEqual(len(batch.frames["ETH-USD"]), 10)
+        self.assertIsInstance(batch.errors["BROKEN"], RuntimeError)
+        self.assertEqual(len(self.stub.requests), 3)
+
+    def test_iter_quotes_chunks_without_overlap(self):
+        """Test iter_quotes() memecah rentang menjadi chunk tanpa duplikasi"""
+        provider = Provider(DefaultProvider.YFinance, target="localhost:1")
+
+        chunks = list(
+            provider.iter_quotes(
+                "BTC-USD",
+                Period.DAILY,
+                datetime(2024, 1, 1, tzinfo=timezone.utc),
+                datetime(2024, 1, 10, tzinfo=timezone.utc),
+                chunk=timedelta(days=4),
+            )
+        )
+
+        self.assertEqual([len(c) for c in chunks], [4, 4, 2])
+        merged = np.concatenate([c.timestamp for c in chunks])
+        self.assertEqual(merged.tolist(), self.history)
+        self.assertEqual(len(self.stub.requests), 3)
+        self.assertEqual(self.stub.requests[1].Start.seconds, JAN_1 + 4 * DAY)
+        self.assertEqual(self.stub.requests[1].End.seconds, JAN_1 + 8 * DAY)
+
+    def test_iter_quotes_stops_early(self):
+        """Test iter_quotes() berhenti tanpa meminta seluruh rentang"""
+        provider = Provider(DefaultProvider.YFinance, target="localhost:1")
+
+        stream = provider.iter_quotes(
+            "BTC-USD",
+            Period.DAILY,
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 10, tzinfo=timezone.utc),
+            chunk=timedelta(days=1),
+        )
+        next(stream)
+        stream.close()
+
+        self.assertLessEqual(len(self.stub.requests), 2)
+
+    def test_store_fetches_only_missing_tail(self):
+        """Test store hanya meminta rentang yang belum ada di disk"""
+        store = DiskQuoteStore(self.tmp.name)
+        provider = Provider(DefaultProvider.YFinance, target="localhost:1", store=store)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        first = provider.quote_frame(
+            "BTC-USD", Period.DAILY, start, datetime(2024, 1, 5, tzinfo=timezone.utc)
+        )
+        second = provider.quote_frame(
+            "BTC-USD", Period.DAILY, start, datetime(2024, 1, 10, tzinfo=timezone.utc)
+        )
+
+        self.assertEqual(len(first), 5)
+        self.assertEqual(second.timestamp.tolist(), self.history)
+        self.assertEqual(len(self.stub.requests), 2)
+        tail = self.stub.requests[1]
+        self.assertEqual(tail.Start.seconds, JAN_1 + 4 * DAY)
+        self.assertEqual(tail.End.seconds, JAN_1 + 9 * DAY)
+
+    def test_store_serves_covered_range_without_request(self):
+        """Test rentang yang sudah tercakup tidak memicu request baru"""
+        store = DiskQuoteStore(self.tmp.name)
+        provider = Provider(DefaultProvider.YFinance, target="localhost:1", store=store)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 10, tzinfo=timezone.utc)
+
+        provider.quote_frame("BTC-USD", Period.DAILY, start, end)
+        other = Provider(DefaultProvider.YFinance, target="localhost:1", store=store)
+        frame = other.quote_frame(
+            "BTC-USD", Period.DAILY, datetime(2024, 1, 3, tzinfo=timezone.utc), end
+        )
+
+        self.assertEqual(len(self.stub.requests), 1)
+        self.assertEqual(frame.timestamp[0], JAN_1 + 2 * DAY)
+        self.assertEqual(len(frame), 8)
+
+    def test_store_merges_head_gap_without_duplicates(self):
+        """Test gap di awal digabung tanpa duplikasi timestamp"""
+        store = DiskQuoteStore(self.tmp.name)
+        provider = Provider(DefaultProvider.YFinance, target="localhost:1", store=store)
+        end = datetime(2024, 1, 10, tzinfo=timezone.utc)
+
+        provider.quote_frame(
+            "BTC-USD", Period.DAILY, datetime(2024, 1, 5, tzinfo=timezone.utc), end
+        )
+        frame = provider.quote_frame(
+            "BTC-USD", Period.DAILY, datetime(2024, 1, 1, tzinfo=timezone.utc), end
+        )
+
+        self.assertEqual(frame.timestamp.tolist(), self.history)
+        self.assertTrue(np.all(np.diff(frame.timestamp) > 0))
+        stored = store.load("YFinance", "BTC-USD", "1d")
+        self.assertEqual(stored.start, JAN_1)
+        base = stored.frame.close
+        while base.base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        self.assertIsInstance(base, np.memmap)
+
+    def test_store_concurrent_saves_do_not_mix_generations(self):
+        """Test penyimpanan bersamaan tidak mencampur kolom antar penulis"""
+        store = DiskQuoteStore(self.tmp.name)
+        barrier = threading.Barrier(4)
+
+        def write(size):
+            timestamps = np.arange(size, dtype=np.int64) * DAY + JAN_1
+            frame = QuoteFrame(timestamps, *[np.full(size, float(size))] * 5)
+            barrier.wait()
+            for _ in range(10):
+                store.save(
+                    "YFinance", "BTC-USD", "1d", frame, None, int(timestamps[-1])
+                )
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in (3, 4, 5, 6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stored = store.load("YFinance", "BTC-USD", "1d")
+        size = len(stored.frame)
+        self.assertEqual(stored.end, JAN_1 + (size - 1) * DAY)
+        for name in QuoteFrame.COLUMNS[1:]:
+            self.assertEqual(len(getattr(stored.frame, name)), size)
+        self.assertTrue(np.all(stored.frame.close == size))
+
+
+class LargeMarketServicer(market_pb2_grpc.MarketServiceServicer):
+    """Servicer yang mengembalikan response lebih besar dari batas default 4 MiB"""
+
+    def GetProductInfo(self, request, context):
+        return make_response([JAN_1 + i * 60 for i in range(100_000)])
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestChannelRegistry(unittest.TestCase):
+    """Test suite untuk registry channel gRPC bersama"""
+
+    def setUp(self):
+        """Setup registry baru untuk setiap test"""
+        self.registry = client.ChannelRegistry()
+        self.addCleanup(self.registry.close)
+        patcher = patch.object(client, "registry", self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_providers_share_channel_per_target_and_options(self):
+        """Test provider dengan target dan opsi sama memakai satu channel"""
+        first = Provider(DefaultProvider.YFinance, target="localhost:1")
+        second = Provider(DefaultProvider.Binance, target="localhost:1")
+        other = Provider(
+            DefaultProvider.YFinance,
+            target="localhost:1",
+            options=client.ChannelOptions(keepalive_time_ms=300_000),
+        )
+
+        self.assertIs(first._channel, second._channel)
+        self.assertIsNot(first._channel, other._channel)
+
+    def test_channel_arguments(self):
+        """Test opsi channel diterjemahkan menjadi argumen gRPC"""
+        args = dict(client.ChannelOptions(max_message_length=1024).arguments())
+
+        self.assertEqual(args["grpc.max_receive_message_length"], 1024)
+        self.assertNotIn("grpc.keepalive_time_ms", args)
+
+        keepalive = dict(client.ChannelOptions(keepalive_time_ms=300_000).arguments())
+        self.assertEqual(keepalive["grpc.keepalive_time_ms"], 300_000)
+        self.assertEqual(keepalive["grpc.keepalive_permit_without_calls"], 0)
+        self.assertNotIn("grpc.http2.max_pings_without_data", keepalive)
+
+    def test_stub_is_created_once(self):
+        """Test stub dibuat sekali per provider, bukan per request"""
+        stub = FakeMarketStub([JAN_1])
+        with patch(
+            "openstoxlify.providers.stoxlify.provider.market_pb2_grpc.MarketServiceStub",
+            return_value=stub,
+        ) as factory:
+            provider = Provider(DefaultProvider.YFinance, target="localhost:1")
+            provider.quote_frame("BTC-USD", Period.DAILY)
+            provider.quote_frame("ETH-USD", Period.DAILY)
+
+        factory.assert_called_once()
+        self.assertEqual(len(stub.requests), 2)
+
+    def test_warm_up_and_large_response(self):
+        """Test warm_up() menunggu READY dan response > 4 MiB diterima"""
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        market_pb2_grpc.add_MarketServiceServicer_to_server(
+            LargeMarketServicer(), server
+        )
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        self.addCleanup(server.stop, None)
+        provider = Provider(DefaultProvider.YFinance, target=f"127.0.0.1:{port}")
+
+        provider.warm_up(timeout=5)
+        frame = provider.quote_frame("BTC-USD", Period.MINUTELY)
+
+        self.assertEqual(len(frame), 100_000)
+
+    def test_warm_up_timeout(self):
+        """Test warm_up() gagal dengan TimeoutError bila server tidak ada"""
+        provider = Provider(DefaultProvider.YFinance, target=f"127.0.0.1:{free_port()}")
+
+        with self.assertRaises(TimeoutError):
+            provider.warm_up(timeout=0.2)
+
+
+class ScriptedMarketServicer(market_pb2_grpc.MarketServiceServicer):
+    """Servicer yang menjalankan skenario per request: error, lambat, atau ok"""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+
+    def GetProductInfo(self, request, context):
+        step = self.script[min(self.calls, len(self.script) - 1)]
+        self.calls += 1
+        if isinstance(step, grpc.StatusCode):
+            context.abort(step, "scripted failure")
+        time.sleep(step)
+        return make_response([JAN_1])
+
+
+class TestCallPolicy(unittest.TestCase):
+    """Test suite untuk deadline, retry dan hedging pada Provider"""
+
+    def provider(self, script, **policy):
+        self.servicer = ScriptedMarketServicer(script)
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        market_pb2_grpc.add_MarketServiceServicer_to_server(self.servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        self.addCleanup(server.stop, None)
+        return Provider(
+            DefaultProvider.YFinance,
+            target=f"127.0.0.1:{port}",
+            policy=CallPolicy(initial_backoff=0, **policy),
+        )
+
+    def test_retries_unavailable(self):
+        """Test UNAVAILABLE diulang sampai berhasil"""
+        unavailable = grpc.StatusCode.UNAVAILABLE
+        provider = self.provider([unavailable, unavailable, 0])
+
+        frame = provider.quote_frame("BTC-USD", Period.DAILY)
+
+        self.assertEqual(len(frame), 1)
+        stats = provider.stats.snapshot()
+        self.assertEqual((stats["attempts"], stats["retries"]), (3, 2))
+        self.assertEqual(stats["failures"], 0)
+
+    def test_does_not_retry_other_codes(self):
+        """Test status yang tidak bisa diulang langsung gagal"""
+        provider = self.provider([grpc.StatusCode.NOT_FOUND, 0])
+
+        with self.assertRaises(RuntimeError):
+            provider.quote_frame("BTC-USD", Period.DAILY)
+
+        self.assertEqual(self.servicer.calls, 1)
+        self.assertEqual(provider.stats.snapshot()["failures"], 1)
+
+    def test_deadline_per_attempt(self):
+        """Test setiap attempt dibatasi deadline dan DEADLINE_EXCEEDED diulang"""
+        provider = self.provider([0.5], timeout=0.05, max_attempts=2)
+
+        with self.assertRaises(RuntimeError):
+            provider.quote_frame("BTC-USD", Period.DAILY)
+
+        stats = provider.stats.snapshot()
+        self.assertEqual(stats["deadline_exceeded"], 2)
+        self.assertEqual(stats["attempts"], 2)
+
+    def test_overall_deadline_stops_retries(self):
+        """Test deadline total menghentikan retry lebih awal"""
+        provider = self.provider([0.5], timeout=0.05, deadline=0.08, max_attempts=10)
+
+        with self.assertRaises(RuntimeError):
+            provider.quote_frame("BTC-USD", Period.DAILY)
+
+        self.assertLessEqual(provider.stats.snapshot()["attempts"], 2)
+
+    def test_hedged_request_wins(self):
+        """Test request kedua dikirim setelah delay dan respons tercepat dipakai"""
+        provider = self.provider([1.0, 0], hedge=True, hedge_delay=0.05)
+
+        start = time.monotonic()
+        frame = provider.quote_frame("BTC-USD", Period.DAILY)
+
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(len(frame), 1)
+        stats = provider.stats.snapshot()
+        self.assertEqual((stats["hedges"], stats["hedge_wins"]), (1, 1))
+
+    def test_hedge_win_records_no_latency(self):
+        """Test latensi hanya dicatat saat attempt pertama yang menang"""
+        provider = self.provider([1.0, 0, 0], hedge=True, hedge_delay=0.05)
+
+        provider.quote_frame("BTC-USD", Period.DAILY)
+        self.assertEqual(len(provider._caller._latencies), 0)
+
+        provider.quote_frame("BTC-USD", Period.DAILY)
+        self.assertEqual(len(provider._caller._latencies), 1)
+
+    def test_hedge_delay_from_latency_quantile(self):
+        """Test delay hedging memakai kuantil latensi setelah sampel cukup"""
+        caller = PolicyCaller(
+            CallPolicy(hedge=True, hedge_min_samples=10, hedge_fallback_delay=2.0)
+        )
+        self.assertEqual(caller.hedge_delay(), 2.0)
+
+        caller._latencies.extend(i / 100 for i in range(1, 101))
+
+        self.assertAlmostEqual(caller.hedge_delay(), 0.9505)
+
+    def test_backoff_is_bounded(self):
+        """Test backoff acak tidak melebihi batas"""
+        policy = CallPolicy(initial_backoff=0.1, max_backoff=0.3)
+
+        self.assertTrue(all(0 <= policy.backoff(n) <= 0.3 for n in range(1, 20)))
+        with self.assertRaises(ValueError):
+            CallPolicy(max_attempts=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
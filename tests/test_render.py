@@ -0,0 +1,97 @@
+import io
+import os
+import pickle
+import tempfile
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from openstoxlify.draw import Canvas
+from openstoxlify.utils.render import ChartSnapshot, render_many
+
+from helpers import make_context
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+class TestRender(unittest.TestCase):
+    """Test suite untuk rendering chart ke file tanpa display"""
+
+    def setUp(self):
+        """Setup context dengan quote, plot dan sinyal"""
+        self.ctx = make_context(120, seed=5)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_render_writes_image_without_pyplot_figure(self):
+        """Test render() menulis PNG tanpa meninggalkan figure pyplot"""
+        before = plt.get_fignums()
+        buffer = io.BytesIO()
+
+        Canvas(self.ctx).render(buffer, format="png", dpi=50, lod=True)
+
+        self.assertTrue(buffer.getvalue().startswith(PNG))
+        self.assertEqual(plt.get_fignums(), before)
+
+    def test_render_format_from_extension(self):
+        """Test format diambil dari ekstensi file"""
+        path = os.path.join(self.tmp.name, "chart.svg")
+
+        Canvas(self.ctx).render(path, title="BTC")
+
+        with open(path, "rb") as f:
+            self.assertIn(b"<svg", f.read(400))
+
+    def test_render_rejects_unknown_option(self):
+        """Test opsi yang bukan argumen draw() ditolak"""
+        with self.assertRaises(TypeError):
+            Canvas(self.ctx).render(io.BytesIO(), colour="red")
+        with self.assertRaises(TypeError):
+            Canvas(self.ctx).render(io.BytesIO(), output_format="npz")
+
+    def test_snapshot_roundtrip(self):
+        """Test ChartSnapshot bisa di-pickle dan menghasilkan data yang sama"""
+        snapshot = pickle.loads(pickle.dumps(ChartSnapshot.from_context(self.ctx)))
+
+        self.assertEqual(list(snapshot.quotes()), list(self.ctx.quotes()))
+        self.assertEqual(list(snapshot.signals()), list(self.ctx.signals()))
+        plots = snapshot.plots()
+        for plot_type, expected in self.ctx.plots().items():
+            self.assertEqual(
+                [(p.label, p.screen_index) for p in plots[plot_type]],
+                [(p.label, p.screen_index) for p in expected],
+            )
+            for copy, plot in zip(plots[plot_type], expected):
+                # NaN warm-up values are kept, so compare the columns.
+                np.testing.assert_array_equal(
+                    copy.data.timestamps, plot.data.timestamps
+                )
+                np.testing.assert_array_equal(copy.data.values, plot.data.values)
+        self.assertFalse(snapshot.authenticated())
+
+    def test_render_many_collects_paths_and_errors(self):
+        """Test render_many() merender paralel dan mengumpulkan error per path"""
+        good = os.path.join(self.tmp.name, "a.png")
+        other = os.path.join(self.tmp.name, "b.png")
+        bad = os.path.join(self.tmp.name, "missing", "c.png")
+
+        batch = render_many(
+            [
+                (self.ctx, good),
+                (make_context(120, seed=5, symbol="ETH-USD"), other),
+                (self.ctx, bad),
+            ],
+            dpi=40,
+            max_workers=2,
+        )
+
+        self.assertEqual(batch.paths, [good, other])
+        self.assertEqual(list(batch.errors), [bad])
+        for path in (good, other):
+            with open(path, "rb") as f:
+                self.assertTrue(f.read().startswith(PNG))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+
+from openstoxlify.backtest.sweep import sweep
+from openstoxlify.backtest.worker import expand
+from openstoxlify.models.frame import QuoteFrame
+from openstoxlify.utils.shared import SharedFrame, attach
+
+from helpers import crossover, make_frame, replay_context
+
+
+class TestSharedFrame(unittest.TestCase):
+    """Test suite untuk SharedFrame"""
+
+    def test_attach_reads_same_columns(self):
+        """Test attach() membaca kolom yang sama dari shared memory"""
+        frame = make_frame(50)
+        with SharedFrame(frame) as shared:
+            shm, copy = attach(shared.handle)
+            for name in QuoteFrame.COLUMNS:
+                np.testing.assert_array_equal(getattr(copy, name), getattr(frame, name))
+            del copy
+            shm.close()
+
+
+class TestSweep(unittest.TestCase):
+    """Test suite untuk sweep parameter paralel"""
+
+    def setUp(self):
+        """Setup context dengan quote yang sudah dimuat"""
+        self.frame = make_frame()
+        self.ctx = replay_context(self.frame)
+
+    def test_expand_grid(self):
+        """Test expand() menghasilkan semua kombinasi parameter"""
+        self.assertEqual(
+            expand({"fast": [5, 10], "slow": [20]}),
+            [{"fast": 5, "slow": 20}, {"fast": 10, "slow": 20}],
+        )
+        self.assertEqual(expand([{"fast": 1}]), [{"fast": 1}])
+
+    def test_sweep_ranks_results_and_collects_errors(self):
+        """Test sweep() mengurutkan hasil dan mengumpulkan error per kombinasi"""
+        report = sweep(
+            self.ctx,
+            crossover,
+            {"fast": [5, 10, 30], "slow": [20, 50]},
+            max_workers=2,
+        )
+
+        self.assertEqual(len(report.results), 5)
+        self.assertEqual([p for p, _ in report.errors], [{"fast": 30, "slow": 20}])
+        self.assertIsInstance(report.errors[0][1], ValueError)
+
+        profits = [r.net_profit for r in report.results]
+        self.assertEqual(profits, sorted(profits, reverse=True))
+        self.assertIs(report.best, report.results[0])
+        self.assertEqual(report.rows()[0]["net_profit"], profits[0])
+
+    def test_sweep_matches_single_process_backtest(self):
+        """Test hasil worker sama dengan backtest di proses utama"""
+        from openstoxlify.backtest.engine import backtest
+
+        report = sweep(self.ctx, crossover, [{"fast": 10, "slow": 50}], max_workers=1)
+
+        ctx = replay_context(self.frame)
+        crossover(ctx, {"fast": 10, "slow": 50})
+        expected = backtest(ctx)
+
+        self.assertAlmostEqual(report.best.net_profit, expected.net_profit)
+        self.assertEqual(
+            report.best.statistic.TotalClosedTrades.value,
+            expected.statistic().TotalClosedTrades.value,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from openstoxlify.backtest.walkforward import split, walk_forward
+from openstoxlify.backtest.worker import Task, evaluate
+from openstoxlify.models.enum import Period
+
+from helpers import crossover, make_frame, replay_context
+
+
+class TestSplit(unittest.TestCase):
+    """Test suite untuk pembagian fold walk-forward"""
+
+    def test_rolling_windows(self):
+        """Test window in-sample bergeser dan out-of-sample menutup akhir data"""
+        self.assertEqual(
+            split(100, folds=2, train_ratio=3.0),
+            [((0, 60), (60, 80)), ((20, 80), (80, 100))],
+        )
+
+    def test_anchored_windows(self):
+        """Test window anchored selalu dimulai dari bar pertama"""
+        windows = split(103, folds=3, train_ratio=2.5, anchored=True)
+        self.assertEqual([train[0] for train, _ in windows], [0, 0, 0])
+        self.assertEqual(windows[-1][1][1], 103)
+
+    def test_too_few_bars(self):
+        """Test jumlah bar yang terlalu sedikit menghasilkan ValueError"""
+        with self.assertRaises(ValueError):
+            split(3, folds=5)
+
+
+class TestWalkForward(unittest.TestCase):
+    """Test suite untuk walk_forward"""
+
+    def setUp(self):
+        """Setup context dengan random walk 600 candle"""
+        self.frame = make_frame(600, seed=5)
+        self.ctx = replay_context(self.frame)
+
+    def test_folds_select_in_sample_best(self):
+        """Test setiap fold memilih parameter terbaik in-sample dan diuji out-of-sample"""
+        grid = {"fast": [0, 5, 10], "slow": [30, 60]}
+        report = walk_forward(
+            self.ctx, crossover, grid, folds=3, warmup=60, max_workers=2
+        )
+
+        self.assertEqual(len(report.folds), 3)
+        self.assertEqual(len(report.errors), 3 * 2)
+        for fold in report.folds:
+            expected = evaluate(
+                self.frame,
+                "test",
+                "BTC-USD",
+                Period.DAILY,
+                Task(crossover, fold.params, *fold.test, warmup=60),
+            )
+            self.assertIn(fold.params["fast"], (5, 10))
+            self.assertAlmostEqual(fold.out_of_sample.net_profit, expected.net_profit)
+            self.assertEqual(fold.train[1], fold.test[0])
+
+        self.assertAlmostEqual(
+            report.net_profit,
+            sum(f.out_of_sample.net_profit for f in report.folds),
+        )
+
+    def test_warmup_bars_are_not_traded(self):
+        """Test bar warm-up hanya untuk indikator, bukan untuk trading"""
+        result = evaluate(
+            self.frame,
+            "test",
+            "BTC-USD",
+            Period.DAILY,
+            Task(crossover, {"fast": 5, "slow": 30}, 300, 400, warmup=30),
+        )
+        trades = result.statistic.Details[0].Trades
+        cold = evaluate(
+            self.frame,
+            "test",
+            "BTC-USD",
+            Period.DAILY,
+            Task(crossover, {"fast": 5, "slow": 30}, 300, 400),
+        )
+
+        self.assertGreater(len(trades), 0)
+        self.assertNotEqual(result.net_profit, cold.net_profit)
+
+
+if __name__ == "__main__":
+    unittest.main()